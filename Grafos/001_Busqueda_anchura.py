@@ -1,6 +1,12 @@
+import time
 from collections import deque #Importar libreria deque que permie rabajar con grafos
+import numpy as np
+from grafo_csr import GrafoCSR, bfs_niveles #Representacion compacta del grafo con arreglos de NumPy
 
 def bfs(grafo, inicio): #Implementar algorimo de busqueda en anchura
+    if isinstance(grafo, GrafoCSR): #Si el grafo viene en formato CSR se usa la version con arreglos
+        return bfs_csr(grafo, inicio)
+
     visitado = set()  #Variable para guardar los nodos visitados
     cola = deque([inicio]) #Cola para manejar los nodos por visitar que incia con el noodo de inicio
 
@@ -14,15 +20,75 @@ def bfs(grafo, inicio): #Implementar algorimo de busqueda en anchura
             cola.extend(grafo[node]-visitado) 
 
 
-# Ejemplo de uso
-grafo = {
-    'A': {'B', 'C'},
-    'B': {'A', 'D', 'E'},
-    'C': {'A', 'F'},
-    'D': {'B'},
-    'E': {'B', 'F'},
-    'F': {'C', 'E'}
-}
+def bfs_csr(grafo, inicio): #Busqueda en anchura sobre un GrafoCSR
+    visitado = np.zeros(grafo.num_nodos, dtype=bool) #Arreglo booleano de nodos visitados
+    origen = grafo.id(inicio)
+    visitado[origen] = True
+    cola = deque([origen]) #La cola guarda identificadores enteros en lugar de nombres
+
+    while cola:
+        node = cola.popleft()
+        print(grafo.nombre(node), end= " ")
+
+        #Se marcan los vecinos al encolarlos para que cada nodo entre una sola vez
+        vecinos = grafo.vecinos(node)
+        nuevos = vecinos[~visitado[vecinos]]
+        visitado[nuevos] = True
+        cola.extend(nuevos.tolist())
+
+
+def distancias_saltos(grafo, inicio): #Distancia en saltos desde inicio a cada nodo alcanzable
+    if isinstance(grafo, GrafoCSR): #En CSR se recorre nivel por nivel con NumPy
+        distancias, _ = bfs_niveles(grafo, grafo.id(inicio))
+        alcanzados = np.flatnonzero(distancias >= 0)
+        return {grafo.nombre(i): int(distancias[i]) for i in alcanzados}
+
+    distancias = {inicio: 0} #Version nodo por nodo con deque
+    cola = deque([inicio])
+    while cola:
+        node = cola.popleft()
+        for vecino in grafo[node]:
+            if vecino not in distancias:
+                distancias[vecino] = distancias[node] + 1
+                cola.append(vecino)
+    return distancias
+
+
+if __name__ == "__main__":
+    # Ejemplo de uso
+    grafo = {
+        'A': {'B', 'C'},
+        'B': {'A', 'D', 'E'},
+        'C': {'A', 'F'},
+        'D': {'B'},
+        'E': {'B', 'F'},
+        'F': {'C', 'E'}
+    }
+
+    print("Busqueda en Anchura (BFS):")
+    bfs(grafo, 'A')
+
+    # La misma busqueda sobre el grafo en formato CSR
+    print("\nBusqueda en Anchura (BFS) sobre GrafoCSR:")
+    bfs(GrafoCSR.desde_dict(grafo), 'A')
+
+    # Recorrido completo de un grafo aleatorio grande: nodo por nodo contra nivel por nivel
+    generador = np.random.default_rng(0)
+    num_nodos, num_aristas = 200_000, 2_000_000
+    origenes = np.sort(generador.integers(0, num_nodos, num_aristas))
+    desplazamientos = np.zeros(num_nodos + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origenes, minlength=num_nodos), out=desplazamientos[1:])
+    grande = GrafoCSR(desplazamientos, generador.integers(0, num_nodos, num_aristas))
+    como_dict = {i: grande.vecinos(i).tolist() for i in range(num_nodos)}
+    invertido = grande.invertido() #Se calcula una vez y sirve para todos los recorridos abajo-arriba
 
-print("Busqueda en Anchura (BFS):")
-bfs(grafo, 'A')
+    inicio = time.perf_counter()
+    lento = distancias_saltos(como_dict, 0)
+    tiempo_dict = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    distancias, padres = bfs_niveles(grande, 0, invertido=invertido)
+    tiempo_niveles = time.perf_counter() - inicio
+    assert all(distancias[nodo] == distancia for nodo, distancia in lento.items())
+    print(f"\n\nBFS completo de {num_nodos} nodos y {num_aristas} aristas: "
+          f"{tiempo_dict:.2f} s nodo por nodo, {tiempo_niveles:.2f} s por niveles "
+          f"({len(lento)} alcanzados, {distancias.max()} niveles)")
@@ -1,52 +1,176 @@
-import heapq  # Se importa heapq para usar una cola de prioridad
+import numpy as np
+from cola_prioridad import crear_cola  # Cola de prioridad indexada con decremento de prioridad
+from grafo_csr import GrafoCSR, dijkstra_csr, reconstruir_camino_ids  # Representación compacta del grafo
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales
 
-def busqueda_costo_uniforme(grafo, inicio, meta):
+@con_estadisticas
+def busqueda_costo_uniforme(grafo, inicio, meta, cola='binaria', estadisticas=None):
     """
     Implementa el algoritmo de Búsqueda en Anchura de Costo Uniforme (UCS).
     Retorna el camino más corto desde el nodo de inicio hasta el objetivo.
+    Acepta el grafo como diccionario de diccionarios o como GrafoCSR.
+    - cola: 'binaria' (montículo indexado) o 'cubetas' (solo para costos enteros)
+    - estadisticas: EstadisticasBusqueda opcional (ver estadisticas_busqueda.py)
     """
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos de NumPy para grafos grandes
+        return busqueda_costo_uniforme_csr(grafo, inicio, meta, cola, estadisticas=estadisticas)
 
-    # Crear la cola de prioridad
-    cola_prioridad = [(0, inicio, [])]  # (Costo acumulado, Nodo actual, Camino recorrido)
+    # Crear la cola de prioridad: cada nodo aparece una sola vez con su mejor costo conocido
+    cola_prioridad = crear_cola(cola)
+    cola_prioridad.insertar(inicio, 0)
 
+    padres = {inicio: None}  # Predecesor de cada nodo (en lugar de copiar el camino en cada entrada)
     visitado = set()  # Conjunto para guardar los nodos ya visitados y evitar ciclos
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(padres) - 1)
+        estadisticas.fase('busqueda')
 
     while cola_prioridad:
-        costo, nodo, camino = heapq.heappop(cola_prioridad)  # Se extrae el nodo de menor costo
-
-        if nodo in visitado:  # Se ignora el nodo si ya se visitó
-            continue
-
-        camino = camino + [nodo]  # Se actualiza el camino recorrido
+        nodo, costo = cola_prioridad.extraer_min()  # Se extrae el nodo de menor costo
         visitado.add(nodo)  # Se marca el nodo como visitado
 
         if nodo == meta:  # Si se llega al objetivo, se retorna el resultado
-            return costo, camino
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return costo, reconstruir_camino(padres, nodo)
         
-        # Explorar nodos adyacentes
-        for vecino, costo_arista in grafo.get(nodo, {}).items():
-            if vecino not in visitado:
-                heapq.heappush(cola_prioridad, (costo + costo_arista, vecino, camino))
+        # Explorar nodos adyacentes: si se mejora el costo de un vecino se actualiza su padre
+        vecinos = grafo.get(nodo, {})
+        if estadisticas is not None:
+            estadisticas.expansion(len(cola_prioridad), len(vecinos))
+        for vecino, costo_arista in vecinos.items():
+            if vecino not in visitado and cola_prioridad.insertar_o_decrementar(vecino, costo + costo_arista):
+                padres[vecino] = nodo
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(cola_prioridad))
     
     return float('inf'), []  # Si no se encuentra un camino, retorna infinito y una lista vacía
 
-# Definimos un grafo ponderado con costos en las aristas
-grafo = {
-    'A': {'B': 1, 'C': 4},
-    'B': {'A': 1, 'D': 2, 'E': 5},
-    'C': {'A': 4, 'F': 3},
-    'D': {'B': 2},
-    'E': {'B': 5, 'F': 1},
-    'F': {'C': 3, 'E': 1}
-}
-
-# Nodo inicial y nodo objetivo
-start_node = 'A'
-goal_node = 'F'
-
-# Ejecutamos el algoritmo UCS
-costo, camino = busqueda_costo_uniforme(grafo, start_node, goal_node)
-
-# Mostramos el resultado
-print(f"Costo mínimo: {costo}")
-print(f"Camino más corto: {' -> '.join(camino)}")
+def reconstruir_camino(padres, nodo):
+    """
+    Recorre los punteros a padres desde la meta hasta el inicio.
+    """
+    camino = []
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres[nodo]
+    return camino[::-1]
+
+@con_estadisticas
+def busqueda_costo_uniforme_csr(grafo, inicio, meta, cola='binaria', estadisticas=None):
+    """
+    UCS sobre un GrafoCSR: los nodos son enteros y el camino se recupera
+    con un arreglo de padres en lugar de copiar listas en cada entrada de la cola.
+    """
+    origen, destino = grafo.id(inicio), grafo.id(meta)
+    padres = np.full(grafo.num_nodos, -1, dtype=np.int32)  # Predecesor de cada nodo en el camino
+    visitado = np.zeros(grafo.num_nodos, dtype=bool)
+    cola_prioridad = crear_cola(cola)
+    cola_prioridad.insertar(origen, 0)
+    if estadisticas is not None:
+        # Descubiertos: nodos con padre, más los cerrados sin padre (el inicio)
+        estadisticas.vigilar(lambda: int(np.count_nonzero((padres >= 0) | visitado)) - 1)
+        estadisticas.fase('busqueda')
+
+    while cola_prioridad:
+        nodo, costo = cola_prioridad.extraer_min()
+        visitado[nodo] = True
+
+        if nodo == destino:  # Se traduce el camino de identificadores a nombres
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return costo, [grafo.nombre(i) for i in reconstruir_camino_ids(padres, nodo)]
+
+        # Explorar nodos adyacentes
+        vecinos = grafo.vecinos(nodo).tolist()
+        if estadisticas is not None:
+            estadisticas.expansion(len(cola_prioridad), len(vecinos))
+        for vecino, costo_arista in zip(vecinos, grafo.pesos_de(nodo).tolist()):
+            if not visitado[vecino] and cola_prioridad.insertar_o_decrementar(vecino, costo + costo_arista):
+                padres[vecino] = nodo
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(cola_prioridad))
+
+    return float('inf'), []
+
+@con_estadisticas
+def busqueda_costo_uniforme_varias_metas(grafo, inicio, metas, cola='binaria', estadisticas=None):
+    """
+    UCS de uno a muchos: una sola búsqueda desde 'inicio' que se detiene en cuanto
+    se extrae de la cola la última de las 'metas'.
+    Retorna un diccionario {meta: (costo, camino)}; las metas inalcanzables quedan con (inf, []).
+    Con un GrafoCSR se usa dijkstra_csr, que solo registra los tiempos por fase.
+    """
+    if isinstance(grafo, GrafoCSR):
+        ids = [grafo.id(meta) for meta in metas]
+        distancias, padres = dijkstra_csr(grafo, grafo.id(inicio), padres=True, destinos=ids)
+        return {meta: (distancias[i].item(), [grafo.nombre(j) for j in reconstruir_camino_ids(padres, i)])
+                if distancias[i] < float('inf') else (float('inf'), [])
+                for meta, i in zip(metas, ids)}
+
+    pendientes = set(metas)  # Metas que aún no se han extraído de la cola
+    resultado = {meta: (float('inf'), []) for meta in metas}
+    cola_prioridad = crear_cola(cola)
+    cola_prioridad.insertar(inicio, 0)
+    padres = {inicio: None}
+    visitado = set()
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(padres) - 1)
+        estadisticas.fase('busqueda')
+
+    while cola_prioridad and pendientes:
+        nodo, costo = cola_prioridad.extraer_min()
+        visitado.add(nodo)
+
+        if nodo in pendientes:  # Al extraerse, su costo ya es el mínimo
+            pendientes.discard(nodo)
+            resultado[nodo] = (costo, reconstruir_camino(padres, nodo))
+            if not pendientes:
+                break
+
+        vecinos = grafo.get(nodo, {})
+        if estadisticas is not None:
+            estadisticas.expansion(len(cola_prioridad), len(vecinos))
+        for vecino, costo_arista in vecinos.items():
+            if vecino not in visitado and cola_prioridad.insertar_o_decrementar(vecino, costo + costo_arista):
+                padres[vecino] = nodo
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(cola_prioridad))
+
+    return resultado
+
+if __name__ == "__main__":
+    # Definimos un grafo ponderado con costos en las aristas
+    grafo = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'D': 2, 'E': 5},
+        'C': {'A': 4, 'F': 3},
+        'D': {'B': 2},
+        'E': {'B': 5, 'F': 1},
+        'F': {'C': 3, 'E': 1}
+    }
+
+    # Nodo inicial y nodo objetivo
+    start_node = 'A'
+    goal_node = 'F'
+
+    # Ejecutamos el algoritmo UCS
+    costo, camino = busqueda_costo_uniforme(grafo, start_node, goal_node)
+
+    # Mostramos el resultado
+    print(f"Costo mínimo: {costo}")
+    print(f"Camino más corto: {' -> '.join(camino)}")
+
+    # La misma búsqueda sobre el grafo en formato CSR
+    costo, camino = busqueda_costo_uniforme(GrafoCSR.desde_dict(grafo), start_node, goal_node)
+    print(f"Costo mínimo (GrafoCSR): {costo}")
+    print(f"Camino más corto (GrafoCSR): {' -> '.join(camino)}")
+
+    # Con costos enteros se puede usar la cola de cubetas en lugar del montículo
+    costo, camino = busqueda_costo_uniforme(grafo, start_node, goal_node, cola='cubetas')
+    print(f"Costo mínimo (cola de cubetas): {costo}")
+    print(f"Camino más corto (cola de cubetas): {' -> '.join(camino)}")
+
+    # Una sola búsqueda para varias metas
+    for meta, (costo, camino) in busqueda_costo_uniforme_varias_metas(grafo, start_node, ['D', 'E', 'F']).items():
+        print(f"{start_node} -> {meta}: costo {costo}, camino {' -> '.join(camino)}")
@@ -1,14 +1,29 @@
+import numpy as np
+from grafo_csr import GrafoCSR  # Representación compacta del grafo con arreglos de NumPy
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
 
-def busqueda_profundidad(grafo, inicio, meta, visitado=None, camino=None):
+@con_estadisticas
+def busqueda_profundidad(grafo, inicio, meta, visitado=None, camino=None, estadisticas=None):
     """
     Implementación del algoritmo de Búsqueda en Profundidad (DFS).
     Retorna un camino desde el nodo de inicio hasta el nodo meta si existe.
     """
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos para grafos grandes
+        return busqueda_profundidad_csr(grafo, inicio, meta, estadisticas=estadisticas)
+
     if visitado is None:
         visitado = set()  # Conjunto para almacenar los nodos visitados y evitar ciclos
     if camino is None:
         camino = []  # Lista para guardar el camino recorrido
-    
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(visitado) - 1)
+        estadisticas.fase('busqueda')
+    return explorar_profundidad(grafo, inicio, meta, visitado, camino, estadisticas)
+
+def explorar_profundidad(grafo, inicio, meta, visitado, camino, estadisticas):
+    """
+    Paso recursivo de la DFS (la recursión no pasa por el decorador de estadísticas).
+    """
     visitado.add(inicio)  # Se marca el nodo actual como visitado
     camino.append(inicio)  # Se agrega el nodo actual al camino
     
@@ -17,9 +32,12 @@ def busqueda_profundidad(grafo, inicio, meta, visitado=None, camino=None):
         return camino
     
     # Explorar los nodos adyacentes
-    for vecino in grafo.get(inicio, []):
+    vecinos = grafo.get(inicio, [])
+    if estadisticas is not None:
+        estadisticas.expansion(len(camino), len(vecinos))  # La frontera es el camino de la recursión
+    for vecino in vecinos:
         if vecino not in visitado:  # Solo visitar nodos no explorados
-            resultado = busqueda_profundidad(grafo, vecino, meta, visitado, camino)
+            resultado = explorar_profundidad(grafo, vecino, meta, visitado, camino, estadisticas)
             if resultado:  # Si se encontró un camino, se retorna
                 return resultado
     
@@ -27,27 +45,77 @@ def busqueda_profundidad(grafo, inicio, meta, visitado=None, camino=None):
     camino.pop()
     return None  # Si no hay camino, retorna None
 
-# Definimos un grafo no ponderado en forma de diccionario
-# Las llaves representan los nodos y los valores son listas de nodos vecinos
-
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-# Nodo inicial y nodo objetivo
-inicio = 'A'
-meta = 'F'
-
-# Ejecutamos el algoritmo DFS
-camino = busqueda_profundidad(grafo, inicio, meta)
-
-# Mostramos el resultado
-if camino:
-    print(f"Camino encontrado: {' -> '.join(camino)}")
-else:
-    print("No se encontró un camino")
\ No newline at end of file
+@con_estadisticas
+def busqueda_profundidad_csr(grafo, inicio, meta, estadisticas=None):
+    """
+    DFS sobre un GrafoCSR con una pila explícita en lugar de recursión,
+    para no alcanzar el límite de recursión de Python en grafos profundos.
+    Explora los vecinos en el mismo orden que la versión recursiva.
+    """
+    origen, destino = grafo.id(inicio), grafo.id(meta)
+    visitado = np.zeros(grafo.num_nodos, dtype=bool)
+    visitado[origen] = True
+    camino = [origen]  # Camino actual (identificadores)
+    pila = [0]  # Para cada nodo del camino, posición del siguiente vecino por revisar
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: int(np.count_nonzero(visitado)) - 1)
+        estadisticas.fase('busqueda')
+
+    while camino:
+        nodo = camino[-1]
+        if nodo == destino:  # Si el nodo actual es el objetivo, se traduce el camino a nombres
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return [grafo.nombre(i) for i in camino]
+
+        vecinos = grafo.vecinos(nodo)
+        posicion = pila[-1]
+        if estadisticas is not None and posicion == 0:  # Primera vez que se revisan sus vecinos
+            estadisticas.expansion(len(camino), len(vecinos))
+        while posicion < len(vecinos) and visitado[vecinos[posicion]]:
+            posicion += 1  # Se saltan los vecinos ya visitados
+
+        if posicion < len(vecinos):  # Se avanza al siguiente vecino no visitado
+            pila[-1] = posicion + 1
+            vecino = int(vecinos[posicion])
+            visitado[vecino] = True
+            camino.append(vecino)
+            pila.append(0)
+        else:  # No quedan vecinos por explorar: se retrocede (Backtracking)
+            camino.pop()
+            pila.pop()
+
+    return None
+
+if __name__ == "__main__":
+    # Definimos un grafo no ponderado en forma de diccionario
+    # Las llaves representan los nodos y los valores son listas de nodos vecinos
+
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    # Nodo inicial y nodo objetivo
+    inicio = 'A'
+    meta = 'F'
+
+    # Ejecutamos el algoritmo DFS
+    camino = busqueda_profundidad(grafo, inicio, meta)
+
+    # Mostramos el resultado
+    if camino:
+        print(f"Camino encontrado: {' -> '.join(camino)}")
+    else:
+        print("No se encontró un camino")
+
+    # La misma búsqueda sobre el grafo en formato CSR
+    camino = busqueda_profundidad(GrafoCSR.desde_dict(grafo), inicio, meta)
+    if camino:
+        print(f"Camino encontrado (GrafoCSR): {' -> '.join(camino)}")
+    else:
+        print("No se encontró un camino (GrafoCSR)")
@@ -1,14 +1,30 @@
-def busqueda_profundidad_limitada(grafo, nodo, metta, limite, visitados=None, camino=None):
+import numpy as np
+from grafo_csr import GrafoCSR  # Representación compacta del grafo con arreglos de NumPy
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
+
+@con_estadisticas
+def busqueda_profundidad_limitada(grafo, nodo, metta, limite, visitados=None, camino=None, estadisticas=None):
     """
     Implementación del algoritmo de Búsqueda en Profundidad Limitada.
     Retorna un camino desde el nodo de inicio hasta el nodo meta si existe,
     o None si no se encuentra un camino dentro del límite especificado.
     """
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos para grafos grandes
+        return busqueda_profundidad_limitada_csr(grafo, nodo, metta, limite, estadisticas=estadisticas)
+
     if visitados is None:
         visitados = set()  # Conjunto para almacenar los nodos visitados y evitar ciclos
     if camino is None:
         camino = []  # Lista para guardar el camino recorrido
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(visitados) - 1)
+        estadisticas.fase('busqueda')
+    return explorar_limitada(grafo, nodo, metta, limite, visitados, camino, estadisticas)
 
+def explorar_limitada(grafo, nodo, metta, limite, visitados, camino, estadisticas):
+    """
+    Paso recursivo de la búsqueda limitada (la recursión no pasa por el decorador de estadísticas).
+    """
     visitados.add(nodo)  # Se marca el nodo actual como visitado
     camino.append(nodo)  # Se agrega el nodo actual al camino
 
@@ -22,9 +38,12 @@ def busqueda_profundidad_limitada(grafo, nodo, metta, limite, visitados=None, ca
         return None
 
     # Explorar los nodos adyacentes
-    for vecino in grafo.get(nodo, []):
+    vecinos = grafo.get(nodo, [])
+    if estadisticas is not None:
+        estadisticas.expansion(len(camino), len(vecinos))  # La frontera es el camino de la recursión
+    for vecino in vecinos:
         if vecino not in visitados:  # Solo visitar nodos no explorados
-            resultado = busqueda_profundidad_limitada(grafo, vecino, metta, limite - 1, visitados, camino)
+            resultado = explorar_limitada(grafo, vecino, metta, limite - 1, visitados, camino, estadisticas)
             if resultado:  # Si se encontró un camino, se retorna
                 return resultado
 
@@ -32,27 +51,77 @@ def busqueda_profundidad_limitada(grafo, nodo, metta, limite, visitados=None, ca
     camino.pop()
     return None  # Si no hay camino, retorna None
 
-# Definimos un grafo no ponderado en forma de diccionario
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-#Nodo inicial y nodo objetivo
-inicio = 'A'
-objetivo = 'F'
-limite_profundidad = 2 # Límite de profundidad para la búsqueda
-
-#Se ejecuta el algoritmo DFS con límite de profundidad
-resultado = busqueda_profundidad_limitada(grafo, inicio, objetivo, limite_profundidad)
-
-#Mostrar el resultado
-if resultado:
-    print(f"Camino encontrado: {' -> '.join(resultado)}")
-else:
-    print("No se encontró un camino dentro del límite de profundidad especificado")
-#Este algoritmo es útil para evitar búsquedas exhaustivas en grafos grandes o infinitos
\ No newline at end of file
+@con_estadisticas
+def busqueda_profundidad_limitada_csr(grafo, nodo, metta, limite, estadisticas=None):
+    """
+    Búsqueda en Profundidad Limitada sobre un GrafoCSR con pila explícita.
+    Recorre los nodos en el mismo orden que la versión recursiva.
+    """
+    origen, destino = grafo.id(nodo), grafo.id(metta)
+    visitados = np.zeros(grafo.num_nodos, dtype=bool)
+    visitados[origen] = True
+    camino = [origen]  # Camino actual (identificadores)
+    pila = [0]  # Para cada nodo del camino, posición del siguiente vecino por revisar
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: int(np.count_nonzero(visitados)) - 1)
+        estadisticas.fase('busqueda')
+
+    while camino:
+        actual = camino[-1]
+        if actual == destino:  # Si el nodo actual es el objetivo, se traduce el camino a nombres
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return [grafo.nombre(i) for i in camino]
+
+        # Si se alcanza el límite (profundidad = longitud del camino - 1), se retrocede
+        vecinos = grafo.vecinos(actual) if len(camino) - 1 < limite else ()
+        posicion = pila[-1]
+        if estadisticas is not None and posicion == 0 and len(camino) - 1 < limite:
+            estadisticas.expansion(len(camino), len(vecinos))  # Primera vez que se revisan sus vecinos
+        while posicion < len(vecinos) and visitados[vecinos[posicion]]:
+            posicion += 1  # Se saltan los vecinos ya visitados
+
+        if posicion < len(vecinos):  # Se avanza al siguiente vecino no visitado
+            pila[-1] = posicion + 1
+            vecino = int(vecinos[posicion])
+            visitados[vecino] = True
+            camino.append(vecino)
+            pila.append(0)
+        else:  # Backtracking
+            camino.pop()
+            pila.pop()
+
+    return None
+
+if __name__ == "__main__":
+    # Definimos un grafo no ponderado en forma de diccionario
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    #Nodo inicial y nodo objetivo
+    inicio = 'A'
+    objetivo = 'F'
+    limite_profundidad = 2 # Límite de profundidad para la búsqueda
+
+    #Se ejecuta el algoritmo DFS con límite de profundidad
+    resultado = busqueda_profundidad_limitada(grafo, inicio, objetivo, limite_profundidad)
+
+    #Mostrar el resultado
+    if resultado:
+        print(f"Camino encontrado: {' -> '.join(resultado)}")
+    else:
+        print("No se encontró un camino dentro del límite de profundidad especificado")
+    #Este algoritmo es útil para evitar búsquedas exhaustivas en grafos grandes o infinitos
+
+    #La misma búsqueda sobre el grafo en formato CSR
+    resultado = busqueda_profundidad_limitada(GrafoCSR.desde_dict(grafo), inicio, objetivo, limite_profundidad)
+    if resultado:
+        print(f"Camino encontrado (GrafoCSR): {' -> '.join(resultado)}")
+    else:
+        print("No se encontró un camino dentro del límite de profundidad especificado (GrafoCSR)")
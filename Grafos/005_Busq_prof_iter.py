@@ -1,12 +1,28 @@
+import heapq
+import itertools
+import numpy as np
+from grafo_csr import GrafoCSR  # Representación compacta del grafo con arreglos de NumPy
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
+
 #Funcion de Búsqueda en Profundidad Iterativa
-def busqueda_profundidad_iterativa(grafo, nodo_inicial, objetivo):
+@con_estadisticas
+def busqueda_profundidad_iterativa(grafo, nodo_inicial, objetivo, estadisticas=None):
     """
     Implementación del algoritmo de Búsqueda en Profundidad Iterativa.
     Retorna un camino desde el nodo de inicio hasta el nodo objetivo si existe,
     o None si no se encuentra un camino.
     """
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos para grafos grandes
+        return busqueda_profundidad_iterativa_csr(grafo, nodo_inicial, objetivo, estadisticas=estadisticas)
+
+    if estadisticas is not None:
+        estadisticas.fase('busqueda')
     for profundidad_maxima in range(len(grafo)):
         print(f"Buscando hasta profundidad {profundidad_maxima}")
+        if estadisticas is not None:
+            # Cada iteración empieza sin visitados; vigilar cierra la cuenta de la anterior
+            # (antes de reasignar 'visitados', que la función lee al cerrarla)
+            estadisticas.vigilar(lambda: len(visitados) - 1)
         visitados = set() # Conjunto para almacenar los nodos visitados y evitar ciclos
         pila = [(nodo_inicial, 0)] # Pila para almacenar los nodos a explorar y su profundidad
 
@@ -20,28 +36,329 @@ def busqueda_profundidad_iterativa(grafo, nodo_inicial, objetivo):
                 visitados.add(nodo)
 
                 # Agregar los nodos adyacentes a la pila con la profundidad incrementada
-                for vecino in grafo.get(nodo, []):
+                vecinos = grafo.get(nodo, [])
+                if estadisticas is not None:
+                    estadisticas.expansion(len(pila), len(vecinos))
+                for vecino in vecinos:
                     pila.append((vecino, profundidad + 1))
+                if estadisticas is not None:
+                    estadisticas.medir_frontera(len(pila))
         # Si no se encuentra el objetivo en esta profundidad, se incrementa la profundidad máxima
 
     return None # Si no se encuentra el objetivo, retorna None
 
-# Ejemplo de grafo representado como un diccionario de adyacencia
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-# Usamos la función de Búsqueda en Profundidad Iterativa
-nodo_inicial = 'A'
-objetivo = 'F'
-resultado = busqueda_profundidad_iterativa(grafo, nodo_inicial, objetivo)
-
-if resultado:
-    print(f"El objetivo {objetivo} fue encontrado.")
-else:
-    print(f"El objetivo {objetivo} no fue encontrado.")
\ No newline at end of file
+@con_estadisticas
+def busqueda_profundidad_iterativa_csr(grafo, nodo_inicial, objetivo, estadisticas=None):
+    """
+    Búsqueda en Profundidad Iterativa sobre un GrafoCSR.
+    La pila guarda identificadores enteros y los visitados son un arreglo booleano.
+    """
+    origen, destino = grafo.id(nodo_inicial), grafo.id(objetivo)
+    if estadisticas is not None:
+        estadisticas.fase('busqueda')
+    for profundidad_maxima in range(grafo.num_nodos):
+        print(f"Buscando hasta profundidad {profundidad_maxima}")
+        if estadisticas is not None:
+            estadisticas.vigilar(lambda: int(np.count_nonzero(visitados)) - 1)
+        visitados = np.zeros(grafo.num_nodos, dtype=bool)
+        pila = [(origen, 0)]
+
+        while pila:
+            nodo, profundidad = pila.pop()
+            if nodo == destino:
+                return True
+
+            if not visitados[nodo] and profundidad <= profundidad_maxima:
+                visitados[nodo] = True
+                vecinos = grafo.vecinos(nodo).tolist()
+                if estadisticas is not None:
+                    estadisticas.expansion(len(pila), len(vecinos))
+                pila.extend((vecino, profundidad + 1) for vecino in vecinos)
+                if estadisticas is not None:
+                    estadisticas.medir_frontera(len(pila))
+
+    return None
+
+def vecinos_con_costo(grafo, nodo):
+    """
+    Vecinos de un nodo con el costo de cada arista. Acepta el formato de 008
+    (dict de dicts {vecino: costo}) o listas de vecinos (costo 1).
+    """
+    vecinos = grafo.get(nodo, [])
+    return vecinos.items() if isinstance(vecinos, dict) else ((vecino, 1) for vecino in vecinos)
+
+#Funcion IDA* (A* con Profundización Iterativa)
+@con_estadisticas
+def ida_estrella(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    """
+    IDA*: profundización iterativa sobre el umbral f(n) = g(n) + h(n).
+    Usa una pila explícita de iteradores, por lo que no depende del límite de recursión,
+    y solo guarda el camino actual: la memoria es lineal en la profundidad.
+
+    Retorna (camino, costo, iteraciones), donde iteraciones es una lista de
+    (umbral, nodos generados) por cada iteración; (None, inf, iteraciones) si no hay camino.
+    """
+    h = heuristica if callable(heuristica) else heuristica.__getitem__
+    if estadisticas is not None:
+        h = estadisticas.contar_heuristica(h)
+        estadisticas.fase('busqueda')
+    umbral = h(inicio)
+    iteraciones = []
+
+    while True:
+        if inicio == objetivo:
+            return [inicio], 0, iteraciones
+        generados = 0
+        siguiente_umbral = float('inf')  # Menor f que superó el umbral actual
+        camino = [inicio]
+        costos = [0]  # g(n) de cada nodo del camino
+        en_camino = {inicio}  # Para no recorrer ciclos
+        pila = [iter(vecinos_con_costo(grafo, inicio))]
+        if estadisticas is not None:
+            estadisticas.expansion(1, 0)  # Los generados se suman al terminar la iteración
+
+        while pila:
+            siguiente = next(pila[-1], None)
+            if siguiente is None:  # Sin más vecinos: se retrocede
+                pila.pop()
+                en_camino.discard(camino.pop())
+                costos.pop()
+                continue
+
+            vecino, costo = siguiente
+            if vecino in en_camino:
+                continue
+            generados += 1
+            g = costos[-1] + costo
+            f = g + h(vecino)
+            if f > umbral:  # Se poda y se recuerda el menor f que excedió el umbral
+                siguiente_umbral = min(siguiente_umbral, f)
+                continue
+            if vecino == objetivo:
+                iteraciones.append((umbral, generados))
+                if estadisticas is not None:
+                    estadisticas.generados += generados
+                return camino + [vecino], g, iteraciones
+
+            camino.append(vecino)
+            costos.append(g)
+            en_camino.add(vecino)
+            pila.append(iter(vecinos_con_costo(grafo, vecino)))
+            if estadisticas is not None:
+                estadisticas.expansion(len(camino), 0)
+
+        iteraciones.append((umbral, generados))
+        if estadisticas is not None:
+            estadisticas.generados += generados
+        if siguiente_umbral == float('inf'):  # Ningún nodo quedó fuera: no hay camino
+            return None, float('inf'), iteraciones
+        umbral = siguiente_umbral
+
+class NodoSMA:
+    """
+    Nodo del árbol de búsqueda de SMA*.
+    - pendientes: sucesores que faltan por generar como (estado, costo, f), ordenados
+      de mayor a menor f; los olvidados vuelven aquí con el f que tenían
+    - hijos: hijos que están en memoria
+    """
+    __slots__ = ('estado', 'g', 'f', 'costo', 'padre', 'profundidad', 'pendientes', 'hijos',
+                 'en_abierta', 'version')
+
+    def __init__(self, estado, g, f, costo, padre):
+        self.estado = estado
+        self.g = g
+        self.f = f
+        self.costo = costo  # Costo de la arista desde el padre
+        self.padre = padre
+        self.profundidad = 0 if padre is None else padre.profundidad + 1
+        self.pendientes = None  # Se calculan en la primera expansión
+        self.hijos = set()
+        self.en_abierta = False
+        self.version = 0  # Invalida las entradas viejas de los montículos
+
+    def prioridad(self):
+        """f con el que compite en la frontera: el de su mejor sucesor pendiente, si ya se expandió."""
+        return self.pendientes[-1][2] if self.pendientes else self.f
+
+#Funcion SMA* (A* Simplificado con Memoria Acotada)
+@con_estadisticas
+def sma_estrella(grafo, inicio, objetivo, heuristica, max_nodos=1000, estadisticas=None):
+    """
+    SMA*: A* que nunca guarda más de 'max_nodos' nodos. Genera un sucesor a la vez
+    (el de menor f) desde la hoja más nueva con menor f. Cuando la memoria se llena,
+    olvida la hoja más vieja con mayor f y guarda ese f en su padre, que podrá
+    regenerarla más tarde si vuelve a ser prometedora.
+
+    Retorna (camino, costo, resumen) con los nodos generados y olvidados;
+    (None, inf, resumen) si no hay camino alcanzable con esa memoria.
+    """
+    h = heuristica if callable(heuristica) else heuristica.__getitem__
+    if estadisticas is not None:
+        h = estadisticas.contar_heuristica(h)
+    contador = itertools.count()  # Orden de llegada para desempatar
+    mejores = []  # (f, -profundidad, -llegada): menor f, el más profundo y más nuevo
+    peores = []  # (-f, profundidad, llegada): mayor f, el menos profundo y más viejo
+    resumen = {'generados': 0, 'olvidados': 0, 'memoria_maxima': 1}
+
+    def agregar(nodo):
+        nodo.version += 1
+        nodo.en_abierta = True
+        llegada = next(contador)
+        f = nodo.prioridad()
+        heapq.heappush(mejores, (f, -nodo.profundidad, -llegada, nodo.version, nodo))
+        heapq.heappush(peores, (-f, nodo.profundidad, llegada, nodo.version, nodo))
+
+    def quitar(nodo):
+        nodo.version += 1
+        nodo.en_abierta = False
+
+    def vigente(entrada):
+        return entrada[4].en_abierta and entrada[3] == entrada[4].version
+
+    def mejor_nodo():
+        while mejores and not vigente(mejores[0]):
+            heapq.heappop(mejores)  # Entradas invalidadas
+        return mejores[0][4] if mejores else None
+
+    def peor_hoja(protegido):
+        # Solo se olvidan hojas (sin hijos en memoria); los nodos interiores se apartan y se devuelven
+        apartados, hoja = [], None
+        while peores:
+            entrada = peores[0]
+            if not vigente(entrada):
+                heapq.heappop(peores)
+            elif entrada[4].hijos or entrada[4] is protegido:
+                apartados.append(heapq.heappop(peores))
+            else:
+                hoja = entrada[4]
+                break
+        for entrada in apartados:
+            heapq.heappush(peores, entrada)
+        return hoja
+
+    def respaldar(nodo):
+        # f de un nodo = menor f entre sus hijos en memoria y sus sucesores pendientes
+        while nodo is not None and nodo.pendientes is not None:
+            candidatos = [hijo.f for hijo in nodo.hijos]
+            if nodo.pendientes:
+                candidatos.append(nodo.pendientes[-1][2])
+            nuevo_f = min(candidatos, default=float('inf'))
+            if nuevo_f == nodo.f:
+                break
+            nodo.f = nuevo_f
+            if nodo.en_abierta:
+                agregar(nodo)
+            nodo = nodo.padre
+
+    raiz = NodoSMA(inicio, 0, h(inicio), 0, None)
+    agregar(raiz)
+    memoria = 1
+    if estadisticas is not None:
+        estadisticas.fase('busqueda')
+
+    while True:
+        nodo = mejor_nodo()
+        if nodo is None or nodo.prioridad() == float('inf'):
+            return None, float('inf'), resumen
+        if nodo.estado == objetivo:
+            camino = []
+            costo = nodo.g
+            while nodo is not None:
+                camino.append(nodo.estado)
+                nodo = nodo.padre
+            return camino[::-1], costo, resumen
+
+        if nodo.pendientes is None:  # Primera expansión: se listan sus sucesores sin ciclos
+            en_camino = set()
+            ancestro = nodo
+            while ancestro is not None:
+                en_camino.add(ancestro.estado)
+                ancestro = ancestro.padre
+            profundo = nodo.profundidad + 1 >= max_nodos - 1  # No cabe ningún descendiente más
+            nodo.pendientes = [(vecino, costo,
+                                float('inf') if profundo and vecino != objetivo
+                                else max(nodo.f, nodo.g + costo + h(vecino)))
+                               for vecino, costo in vecinos_con_costo(grafo, nodo.estado)
+                               if vecino not in en_camino]
+            # De mayor a menor f, para sacar el mejor con pop(); a igual f, en el orden del grafo
+            nodo.pendientes.reverse()
+            nodo.pendientes.sort(key=lambda pendiente: -pendiente[2])
+            if estadisticas is not None:  # La frontera son los nodos en memoria
+                estadisticas.expansion(memoria, len(nodo.pendientes))
+            if not nodo.pendientes:  # Nodo sin salida: nunca llevará a la meta
+                nodo.f = float('inf')
+                agregar(nodo)
+                respaldar(nodo.padre)
+                continue
+
+        # Se genera un solo sucesor por paso: el de menor f
+        estado, costo, f = nodo.pendientes.pop()
+        hijo = NodoSMA(estado, nodo.g + costo, f, costo, nodo)
+        nodo.hijos.add(hijo)
+        resumen['generados'] += 1
+        memoria += 1
+
+        if nodo.pendientes:
+            agregar(nodo)  # Compite con el f de su siguiente sucesor pendiente
+        else:  # Ya se generaron todos sus sucesores
+            quitar(nodo)
+        respaldar(nodo)
+        agregar(hijo)
+
+        # Si se supera la memoria, se olvidan las peores hojas
+        while memoria > max_nodos:
+            hoja = peor_hoja(protegido=raiz)
+            if hoja is None:
+                break
+            quitar(hoja)
+            padre = hoja.padre
+            padre.hijos.discard(hoja)
+            padre.pendientes.append((hoja.estado, hoja.costo, hoja.f))
+            padre.pendientes.sort(key=lambda pendiente: -pendiente[2])
+            memoria -= 1
+            resumen['olvidados'] += 1
+            agregar(padre)  # El padre vuelve a la frontera para poder regenerarla
+            respaldar(padre)
+        resumen['memoria_maxima'] = max(resumen['memoria_maxima'], memoria)
+
+if __name__ == "__main__":
+    # Ejemplo de grafo representado como un diccionario de adyacencia
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    # Usamos la función de Búsqueda en Profundidad Iterativa
+    nodo_inicial = 'A'
+    objetivo = 'F'
+    resultado = busqueda_profundidad_iterativa(grafo, nodo_inicial, objetivo)
+
+    if resultado:
+        print(f"El objetivo {objetivo} fue encontrado.")
+    else:
+        print(f"El objetivo {objetivo} no fue encontrado.")
+
+    # La misma búsqueda sobre el grafo en formato CSR
+    resultado = busqueda_profundidad_iterativa(GrafoCSR.desde_dict(grafo), nodo_inicial, objetivo)
+    print(f"GrafoCSR: el objetivo {objetivo} {'fue' if resultado else 'no fue'} encontrado.")
+
+    # Grafo ponderado y heurística del ejemplo de A* (008)
+    grafo_ponderado = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    }
+    heuristica = {'A': 4, 'B': 3, 'C': 1, 'D': 0}
+
+    camino, costo, iteraciones = ida_estrella(grafo_ponderado, 'A', 'D', heuristica)
+    print(f"IDA*: camino {camino} con costo {costo}")
+    for umbral, generados in iteraciones:
+        print(f"  umbral {umbral}: {generados} nodos generados")
+
+    camino, costo, estadisticas = sma_estrella(grafo_ponderado, 'A', 'D', heuristica, max_nodos=3)
+    print(f"SMA* con 3 nodos de memoria: camino {camino} con costo {costo}, {estadisticas}")
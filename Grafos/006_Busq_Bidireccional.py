@@ -1,51 +1,241 @@
-from collections import deque
+import numpy as np
+from cola_prioridad import ColaPrioridadIndexada  # Cola de prioridad con decremento de prioridad
+from grafo_csr import GrafoCSR, reconstruir_camino_ids  # Representación compacta del grafo
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
 
 # Función de Búsqueda Bidireccional
-def busqueda_bidireccional(grafo, nodo_inicial, nodo_objetivo):
-    # Inicializamos las colas de búsqueda para ambos extremos
-    cola_inicial = deque([nodo_inicial])
-    cola_objetivo = deque([nodo_objetivo])
-    
-    # Conjuntos para llevar registro de los nodos visitados desde ambos extremos
-    visitados_inicial = {nodo_inicial}
-    visitados_objetivo = {nodo_objetivo}
-    
+@con_estadisticas
+def busqueda_bidireccional(grafo, nodo_inicial, nodo_objetivo, inverso=None, estadisticas=None):
+    # inverso: grafo con las aristas invertidas (invertir_grafo), para no recalcularlo en
+    # cada consulta. Un GrafoCSR guarda el suyo (GrafoCSR.invertido)
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos para grafos grandes
+        return busqueda_bidireccional_csr(grafo, nodo_inicial, nodo_objetivo, estadisticas=estadisticas)
+
+    if nodo_inicial == nodo_objetivo:
+        return [nodo_inicial]
+
+    # La búsqueda desde el objetivo recorre las aristas al revés (importa en grafos dirigidos)
+    if inverso is None:
+        inverso = invertir_grafo(grafo)
+
+    # Fronteras (capas completas) de cada búsqueda
+    frontera_inicial = [nodo_inicial]
+    frontera_objetivo = [nodo_objetivo]
+
     # Diccionarios para almacenar los caminos desde los nodos iniciales y objetivos
     padres_inicial = {nodo_inicial: None}
     padres_objetivo = {nodo_objetivo: None}
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(padres_inicial) + len(padres_objetivo) - 2)
+        estadisticas.fase('busqueda')
 
     # Bucle que realiza la búsqueda desde ambos extremos
-    while cola_inicial and cola_objetivo:
-        # Expansión de la búsqueda desde el nodo inicial
-        if cola_inicial:
-            nodo_actual = cola_inicial.popleft()
-            # Explorar los vecinos del nodo actual
-            for vecino in grafo.get(nodo_actual, []):
-                if vecino not in visitados_inicial:
-                    visitados_inicial.add(vecino)
-                    cola_inicial.append(vecino)
-                    padres_inicial[vecino] = nodo_actual
-                    
-                    # Si encontramos un nodo en la cola del objetivo, terminamos
-                    if vecino in visitados_objetivo:
-                        return reconstruir_camino(padres_inicial, padres_objetivo, nodo_inicial, nodo_objetivo, vecino)
-        
-        # Expansión de la búsqueda desde el nodo objetivo
-        if cola_objetivo:
-            nodo_actual = cola_objetivo.popleft()
-            # Explorar los vecinos del nodo actual
-            for vecino in grafo.get(nodo_actual, []):
-                if vecino not in visitados_objetivo:
-                    visitados_objetivo.add(vecino)
-                    cola_objetivo.append(vecino)
-                    padres_objetivo[vecino] = nodo_actual
-                    
-                    # Si encontramos un nodo en la cola del inicial, terminamos
-                    if vecino in visitados_inicial:
-                        return reconstruir_camino(padres_inicial, padres_objetivo, nodo_inicial, nodo_objetivo, vecino)
+    while frontera_inicial and frontera_objetivo:
+        # Se expande la capa completa de la frontera más pequeña. Al expandir capas enteras,
+        # el primer nodo común encontrado pertenece a un camino más corto
+        if len(frontera_inicial) <= len(frontera_objetivo):
+            frontera_inicial, comun = expandir_capa(grafo, frontera_inicial, padres_inicial, padres_objetivo,
+                                                    estadisticas)
+        else:
+            frontera_objetivo, comun = expandir_capa(inverso, frontera_objetivo, padres_objetivo, padres_inicial,
+                                                     estadisticas)
+
+        if comun is not None:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return reconstruir_camino(padres_inicial, padres_objetivo, nodo_inicial, nodo_objetivo, comun)
 
     return None  # Si no encontramos ningún camino
 
+# Expande todos los nodos de una capa y retorna la capa siguiente y el primer nodo común (si hay)
+def expandir_capa(grafo, frontera, padres, padres_otro, estadisticas=None):
+    siguiente = []
+    for nodo_actual in frontera:
+        vecinos = grafo.get(nodo_actual, [])
+        if estadisticas is not None:  # Frontera: la capa actual más la que se está armando
+            estadisticas.expansion(len(frontera) + len(siguiente), len(vecinos))
+        for vecino in vecinos:
+            if vecino not in padres:
+                padres[vecino] = nodo_actual
+                siguiente.append(vecino)
+                # Si el otro lado ya visitó este vecino, las dos búsquedas se encontraron
+                if vecino in padres_otro:
+                    if estadisticas is not None:
+                        estadisticas.medir_frontera(len(frontera) + len(siguiente))
+                    return siguiente, vecino
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(frontera) + len(siguiente))
+    return siguiente, None
+
+# Construye el grafo con las aristas invertidas (acepta listas, sets o dicts de vecinos)
+def invertir_grafo(grafo):
+    inverso = {nodo: {} for nodo in grafo}
+    for nodo, vecinos in grafo.items():
+        for vecino in vecinos:
+            costo = vecinos[vecino] if isinstance(vecinos, dict) else 1
+            inverso.setdefault(vecino, {})[nodo] = costo
+    return inverso
+
+# Búsqueda Bidireccional por capas sobre un GrafoCSR
+@con_estadisticas
+def busqueda_bidireccional_csr(grafo, nodo_inicial, nodo_objetivo, estadisticas=None):
+    origen, destino = grafo.id(nodo_inicial), grafo.id(nodo_objetivo)
+    if origen == destino:
+        return [nodo_inicial]
+
+    # Arreglos de padres: -2 indica "no visitado" y -1 marca la raíz de cada búsqueda
+    padres_inicial = np.full(grafo.num_nodos, -2, dtype=np.int32)
+    padres_objetivo = np.full(grafo.num_nodos, -2, dtype=np.int32)
+    padres_inicial[origen] = -1
+    padres_objetivo[destino] = -1
+    frontera_inicial = np.array([origen], dtype=np.int32)
+    frontera_objetivo = np.array([destino], dtype=np.int32)
+    lados = ((grafo, padres_inicial, padres_objetivo), (grafo.invertido(), padres_objetivo, padres_inicial))
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: int(np.count_nonzero(padres_inicial != -2))
+                             + int(np.count_nonzero(padres_objetivo != -2)) - 2)
+        estadisticas.fase('busqueda')
+
+    while len(frontera_inicial) and len(frontera_objetivo):
+        directo = len(frontera_inicial) <= len(frontera_objetivo)
+        csr, padres, padres_otro = lados[0] if directo else lados[1]
+        frontera = frontera_inicial if directo else frontera_objetivo
+
+        # Todos los vecinos de la capa a la vez: se repite cada nodo tantas veces como aristas tiene
+        inicios, fines = csr.desplazamientos[frontera], csr.desplazamientos[frontera + 1]
+        grados = fines - inicios
+        if estadisticas is not None:  # Se expande la capa completa de una vez
+            estadisticas.expansion(len(frontera_inicial) + len(frontera_objetivo), int(grados.sum()), len(frontera))
+        indices = np.arange(grados.sum()) - np.repeat(np.cumsum(grados) - grados, grados) + np.repeat(inicios, grados)
+        vecinos, origenes = csr.destinos[indices], np.repeat(frontera, grados)
+
+        # Se quedan los vecinos no visitados (la primera aparición de cada uno fija su padre)
+        nuevos = padres[vecinos] == -2
+        vecinos, origenes = vecinos[nuevos], origenes[nuevos]
+        vecinos, primera = np.unique(vecinos, return_index=True)
+        padres[vecinos] = origenes[primera]
+        if estadisticas is not None:  # La capa expandida se reemplaza por la nueva
+            estadisticas.medir_frontera(len(frontera_inicial) + len(frontera_objetivo) - len(frontera) + len(vecinos))
+
+        comunes = vecinos[padres_otro[vecinos] != -2]
+        if len(comunes):
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            comun = comunes[0]
+            camino = reconstruir_camino_ids(padres_inicial, comun)
+            camino += reconstruir_camino_ids(padres_objetivo, comun)[::-1][1:]
+            return [grafo.nombre(i) for i in camino]
+
+        if directo:
+            frontera_inicial = vecinos
+        else:
+            frontera_objetivo = vecinos
+
+    return None
+
+# Dijkstra bidireccional con criterio de parada basado en mu
+@con_estadisticas
+def dijkstra_bidireccional(grafo, nodo_inicial, nodo_objetivo, potencial=None, inverso=None, estadisticas=None):
+    """
+    Dijkstra bidireccional para grafos ponderados (dict de dicts o GrafoCSR).
+    Retorna (costo, camino) como busqueda_costo_uniforme.
+
+    - En cada paso se expande la frontera con menos nodos.
+    - mu guarda el costo del mejor camino completo visto hasta ahora; la búsqueda
+      termina cuando la suma de las claves mínimas de ambas colas alcanza mu.
+    - potencial: función opcional p(v) que orienta la búsqueda hacia el objetivo.
+      Debe producir costos reducidos no negativos (w(u, v) - p(u) + p(v) >= 0), como
+      el promedio de dos heurísticas consistentes que arma a_estrella_bidireccional.
+    - inverso: grafo invertido precalculado (invertir_grafo) para varias consultas sobre
+      el mismo dict; un GrafoCSR calcula el suyo una sola vez (GrafoCSR.invertido).
+    """
+    if isinstance(grafo, GrafoCSR):
+        directo = lambda nodo: list(zip(grafo.vecinos(nodo).tolist(), grafo.pesos_de(nodo).tolist()))
+        inverso_csr = grafo.invertido()
+        inverso = lambda nodo: list(zip(inverso_csr.vecinos(nodo).tolist(), inverso_csr.pesos_de(nodo).tolist()))
+        origen, destino = grafo.id(nodo_inicial), grafo.id(nodo_objetivo)
+        p = (lambda nodo: 0) if potencial is None else (lambda nodo: potencial(grafo.nombre(nodo)))
+    else:
+        grafo_inverso = invertir_grafo(grafo) if inverso is None else inverso
+        directo = lambda nodo: grafo.get(nodo, {}).items()
+        inverso = lambda nodo: grafo_inverso.get(nodo, {}).items()
+        origen, destino = nodo_inicial, nodo_objetivo
+        p = (lambda nodo: 0) if potencial is None else potencial
+
+    # Estado de cada lado: distancias, padres, cola y nodos cerrados.
+    # Hacia adelante la clave es d(v) + p(v); hacia atrás es d(v) - p(v)
+    distancias = ({origen: 0}, {destino: 0})
+    padres = ({origen: None}, {destino: None})
+    colas = (ColaPrioridadIndexada(), ColaPrioridadIndexada())
+    colas[0].insertar(origen, p(origen))
+    colas[1].insertar(destino, -p(destino))
+    cerrados = (set(), set())
+    adyacentes = (directo, inverso)
+    signos = (1, -1)
+
+    mu = 0 if origen == destino else float('inf')  # Costo del mejor camino encontrado
+    encuentro = origen if origen == destino else None  # Nodo donde se unen los dos caminos
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(distancias[0]) + len(distancias[1]) - 2)
+        estadisticas.fase('busqueda')
+
+    while colas[0] and colas[1]:
+        # Criterio de parada: ningún camino por descubrir puede mejorar mu
+        if colas[0].prioridad(colas[0].elementos[0]) + colas[1].prioridad(colas[1].elementos[0]) >= mu:
+            break
+
+        lado = 0 if len(colas[0]) <= len(colas[1]) else 1  # Se avanza la frontera más pequeña
+        otro = 1 - lado
+        nodo, _ = colas[lado].extraer_min()
+        cerrados[lado].add(nodo)
+
+        vecinos = adyacentes[lado](nodo)
+        if estadisticas is not None:
+            estadisticas.expansion(len(colas[0]) + len(colas[1]), len(vecinos))
+        for vecino, costo in vecinos:
+            if vecino in cerrados[lado]:
+                continue
+            nueva_distancia = distancias[lado][nodo] + costo
+            if nueva_distancia < distancias[lado].get(vecino, float('inf')):
+                distancias[lado][vecino] = nueva_distancia
+                padres[lado][vecino] = nodo
+                colas[lado].insertar_o_decrementar(vecino, nueva_distancia + signos[lado] * p(vecino))
+            # Si el otro lado ya alcanzó al vecino, hay un camino completo candidato
+            if vecino in distancias[otro]:
+                total = distancias[lado][vecino] + distancias[otro][vecino]
+                if total < mu:
+                    mu, encuentro = total, vecino
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(colas[0]) + len(colas[1]))
+
+    if encuentro is None:
+        return float('inf'), []
+
+    # Se unen el camino desde el inicio y el camino (invertido) hacia el objetivo
+    if estadisticas is not None:
+        estadisticas.fase('reconstruccion')
+    camino = reconstruir_camino(padres[0], padres[1], origen, destino, encuentro)
+    if isinstance(grafo, GrafoCSR):
+        camino = [grafo.nombre(i) for i in camino]
+    return mu, camino
+
+# A* bidireccional con potenciales promedio
+@con_estadisticas
+def a_estrella_bidireccional(grafo, nodo_inicial, nodo_objetivo, heuristica_objetivo, heuristica_inicio,
+                             inverso=None, estadisticas=None):
+    """
+    A* bidireccional: heuristica_objetivo estima el costo de cada nodo al objetivo y
+    heuristica_inicio el costo desde el inicio (diccionarios o funciones). Si ambas son
+    consistentes, su promedio p(v) = (h_objetivo(v) - h_inicio(v)) / 2 es un potencial
+    válido para las dos direcciones y el resultado sigue siendo óptimo.
+    """
+    h_objetivo = heuristica_objetivo.__getitem__ if isinstance(heuristica_objetivo, dict) else heuristica_objetivo
+    h_inicio = heuristica_inicio.__getitem__ if isinstance(heuristica_inicio, dict) else heuristica_inicio
+    if estadisticas is not None:
+        h_objetivo, h_inicio = estadisticas.contar_heuristica(h_objetivo), estadisticas.contar_heuristica(h_inicio)
+    potencial = lambda nodo: (h_objetivo(nodo) - h_inicio(nodo)) / 2
+    return dijkstra_bidireccional(grafo, nodo_inicial, nodo_objetivo, potencial, inverso, estadisticas=estadisticas)
+
 # Función para reconstruir el camino desde los nodos inicial y objetivo
 def reconstruir_camino(padres_inicial, padres_objetivo, nodo_inicial, nodo_objetivo, nodo_comun):
     # Reconstruir el camino desde el nodo inicial hacia el nodo común
@@ -66,22 +256,46 @@ def reconstruir_camino(padres_inicial, padres_objetivo, nodo_inicial, nodo_objet
     # El camino completo es la concatenación del camino inicial y el camino objetivo
     return camino_inicial + camino_objetivo[1:]
 
-# Ejemplo de grafo representado como un diccionario de adyacencia
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
-
-# Usamos la función de Búsqueda Bidireccional
-nodo_inicial = 'A'
-nodo_objetivo = 'F'
-camino = busqueda_bidireccional(grafo, nodo_inicial, nodo_objetivo)
-
-if camino:
-    print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
-else:
-    print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+if __name__ == "__main__":
+    # Ejemplo de grafo representado como un diccionario de adyacencia
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    # Usamos la función de Búsqueda Bidireccional
+    nodo_inicial = 'A'
+    nodo_objetivo = 'F'
+    camino = busqueda_bidireccional(grafo, nodo_inicial, nodo_objetivo)
+
+    if camino:
+        print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
+    else:
+        print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+
+    # La misma búsqueda sobre el grafo en formato CSR
+    camino = busqueda_bidireccional(GrafoCSR.desde_dict(grafo), nodo_inicial, nodo_objetivo)
+    print(f"Camino con GrafoCSR: {camino}")
+
+    # Grafo ponderado para Dijkstra y A* bidireccionales
+    grafo_ponderado = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'D': 2, 'E': 5},
+        'C': {'A': 4, 'F': 3},
+        'D': {'B': 2},
+        'E': {'B': 5, 'F': 1},
+        'F': {'C': 3, 'E': 1}
+    }
+
+    # Estimaciones consistentes del costo hasta F y desde A
+    heuristica_hacia_F = {'A': 6, 'B': 5, 'C': 3, 'D': 7, 'E': 1, 'F': 0}
+    heuristica_desde_A = {'A': 0, 'B': 1, 'C': 4, 'D': 3, 'E': 5, 'F': 6}
+
+    costo, camino = dijkstra_bidireccional(grafo_ponderado, 'A', 'F')
+    print(f"Dijkstra bidireccional: costo {costo}, camino {camino}")
+    costo, camino = a_estrella_bidireccional(grafo_ponderado, 'A', 'F', heuristica_hacia_F, heuristica_desde_A)
+    print(f"A* bidireccional: costo {costo}, camino {camino}")
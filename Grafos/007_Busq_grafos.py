@@ -1,12 +1,22 @@
 from collections import deque
+import numpy as np
+from grafo_csr import GrafoCSR, reconstruir_camino_ids  # Representación compacta del grafo
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
 
 # Función de Búsqueda en Amplitud (BFS)
-def bfs(grafo, nodo_inicial, objetivo):
+@con_estadisticas
+def bfs(grafo, nodo_inicial, objetivo, estadisticas=None):
+    if isinstance(grafo, GrafoCSR):  # Versión con arreglos para grafos grandes
+        return bfs_csr(grafo, nodo_inicial, objetivo, estadisticas=estadisticas)
+
     # Inicializamos la cola de búsqueda y el conjunto de nodos visitados
     cola = deque([nodo_inicial])  # Usamos una cola para explorar por niveles
     visitados = set()  # Conjunto de nodos que hemos visitado
     visitados.add(nodo_inicial)  # Marcamos el nodo inicial como visitado
     padres = {nodo_inicial: None}  # Diccionario para rastrear los nodos padres
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(padres) - 1)
+        estadisticas.fase('busqueda')
 
     # Bucle de búsqueda
     while cola:
@@ -14,17 +24,54 @@ def bfs(grafo, nodo_inicial, objetivo):
         
         # Si encontramos el objetivo, reconstruimos el camino
         if nodo_actual == objetivo:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
             return reconstruir_camino(padres, nodo_inicial, objetivo)
 
         # Exploramos los vecinos del nodo actual
-        for vecino in grafo.get(nodo_actual, []):
+        vecinos = grafo.get(nodo_actual, [])
+        if estadisticas is not None:
+            estadisticas.expansion(len(cola), len(vecinos))
+        for vecino in vecinos:
             if vecino not in visitados:
                 visitados.add(vecino)  # Marcamos el vecino como visitado
                 cola.append(vecino)  # Añadimos el vecino a la cola para explorarlo
                 padres[vecino] = nodo_actual  # Guardamos el nodo actual como su padre
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(cola))
 
     return None  # Si no se encuentra el objetivo, devolvemos None
 
+# BFS sobre un GrafoCSR: los padres se guardan en un arreglo (-2 = no visitado, -1 = raíz)
+@con_estadisticas
+def bfs_csr(grafo, nodo_inicial, objetivo, estadisticas=None):
+    origen, destino = grafo.id(nodo_inicial), grafo.id(objetivo)
+    padres = np.full(grafo.num_nodos, -2, dtype=np.int32)
+    padres[origen] = -1
+    cola = deque([origen])
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: int(np.count_nonzero(padres != -2)) - 1)
+        estadisticas.fase('busqueda')
+
+    while cola:
+        nodo_actual = cola.popleft()
+        if nodo_actual == destino:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
+            return [grafo.nombre(i) for i in reconstruir_camino_ids(padres, nodo_actual)]
+
+        # Se marcan de una vez todos los vecinos no visitados
+        vecinos = grafo.vecinos(nodo_actual)
+        if estadisticas is not None:
+            estadisticas.expansion(len(cola), len(vecinos))
+        nuevos = vecinos[padres[vecinos] == -2]
+        padres[nuevos] = nodo_actual
+        cola.extend(nuevos.tolist())
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(cola))
+
+    return None
+
 # Función para reconstruir el camino desde el nodo inicial hasta el objetivo
 def reconstruir_camino(padres, nodo_inicial, nodo_objetivo):
     camino = []
@@ -37,22 +84,27 @@ def reconstruir_camino(padres, nodo_inicial, nodo_objetivo):
     camino.reverse()
     return camino
 
-# Ejemplo de grafo representado como un diccionario de adyacencia
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
-
-# Usamos la función de Búsqueda en Amplitud (BFS)
-nodo_inicial = 'A'
-nodo_objetivo = 'F'
-camino = bfs(grafo, nodo_inicial, nodo_objetivo)
-
-if camino:
-    print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
-else:
-    print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+if __name__ == "__main__":
+    # Ejemplo de grafo representado como un diccionario de adyacencia
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    # Usamos la función de Búsqueda en Amplitud (BFS)
+    nodo_inicial = 'A'
+    nodo_objetivo = 'F'
+    camino = bfs(grafo, nodo_inicial, nodo_objetivo)
+
+    if camino:
+        print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
+    else:
+        print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+
+    # La misma búsqueda sobre el grafo en formato CSR
+    camino = bfs(GrafoCSR.desde_dict(grafo), nodo_inicial, nodo_objetivo)
+    print(f"Camino con GrafoCSR: {camino}")
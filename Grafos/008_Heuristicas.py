@@ -1,34 +1,57 @@
-import heapq
+from cola_prioridad import crear_cola  # Cola de prioridad indexada con decremento de prioridad
+from estadisticas_busqueda import EstadisticasBusqueda, con_estadisticas  # Contadores opcionales
 
 # Función de búsqueda A*
-def a_star(grafo, inicio, objetivo, heuristica):
+@con_estadisticas
+def a_star(grafo, inicio, objetivo, heuristica, cola='binaria', estadisticas=None):
+    # La heurística puede ser un diccionario {nodo: h(n)} o una función h(nodo)
+    # (por ejemplo la heurística ALT de puntos_referencia.py)
+    if not callable(heuristica):
+        heuristica = heuristica.__getitem__
+    if estadisticas is not None:  # Se cuentan las evaluaciones de la heurística
+        heuristica = estadisticas.contar_heuristica(heuristica)
+
     # Inicializamos las estructuras de datos
-    open_list = []  # Lista de nodos por explorar (con prioridad)
-    heapq.heappush(open_list, (0 + heuristica[inicio], 0, inicio))  # (f(n), g(n), nodo)
-    came_from = {}  # Diccionario para rastrear el camino
+    # Cola de prioridad indexada: cada nodo aparece una sola vez y su prioridad se reduce en el sitio.
+    # Con 'binaria' la prioridad es (f(n), g(n)); con 'cubetas' (costos enteros) es solo f(n)
+    open_list = crear_cola(cola)
+    prioridad = (lambda f, g: (f, g)) if cola == 'binaria' else (lambda f, g: f)
+    open_list.insertar(inicio, prioridad(0 + heuristica(inicio), 0))
+    came_from = {}  # Diccionario para rastrear el camino (punteros a padres)
     g_score = {nodo: float('inf') for nodo in grafo}  # Costo real de inicio a cualquier nodo
     g_score[inicio] = 0  # El costo de llegar al nodo de inicio es 0
     f_score = {nodo: float('inf') for nodo in grafo}  # Estimación del costo total
-    f_score[inicio] = heuristica[inicio]  # f(n) = g(n) + h(n)
+    f_score[inicio] = heuristica(inicio)  # f(n) = g(n) + h(n)
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(came_from))
+        estadisticas.fase('busqueda')
 
     while open_list:
         # Extraemos el nodo con el menor f(n)
-        _, _, current_node = heapq.heappop(open_list)
+        current_node, _ = open_list.extraer_min()
 
         # Si hemos llegado al objetivo, reconstruimos el camino
         if current_node == objetivo:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
             return reconstruir_camino(came_from, current_node)
 
         # Exploramos los vecinos del nodo actual
-        for vecino, costo in grafo[current_node].items():
+        vecinos = grafo[current_node]
+        if estadisticas is not None:
+            estadisticas.expansion(len(open_list), len(vecinos))
+        for vecino, costo in vecinos.items():
             tentative_g_score = g_score[current_node] + costo  # Costo total desde inicio hasta el vecino
 
             # Si encontramos un camino mejor hacia el vecino, actualizamos los valores
             if tentative_g_score < g_score[vecino]:
                 came_from[vecino] = current_node  # Guardamos el camino
                 g_score[vecino] = tentative_g_score  # Actualizamos el costo g(n)
-                f_score[vecino] = g_score[vecino] + heuristica[vecino]  # Actualizamos f(n)
-                heapq.heappush(open_list, (f_score[vecino], tentative_g_score, vecino))  # Añadimos a la lista
+                f_score[vecino] = g_score[vecino] + heuristica(vecino)  # Actualizamos f(n)
+                # Se inserta el vecino o se reduce su prioridad si ya estaba en la lista
+                open_list.insertar_o_decrementar(vecino, prioridad(f_score[vecino], tentative_g_score))
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(open_list))
 
     return None  # Si no se encuentra un camino, devolvemos None
 
@@ -41,31 +64,42 @@ def reconstruir_camino(came_from, current_node):
     camino.reverse()
     return camino
 
-# Grafo representado como un diccionario de adyacencia
-# El grafo es un diccionario donde las claves son los nodos y los valores son otros diccionarios
-# que contienen los nodos vecinos y sus costos de conexión
-grafo = {
-    'A': {'B': 1, 'C': 4},
-    'B': {'A': 1, 'C': 2, 'D': 5},
-    'C': {'A': 4, 'B': 2, 'D': 1},
-    'D': {'B': 5, 'C': 1}
-}
+if __name__ == "__main__":
+    # Grafo representado como un diccionario de adyacencia
+    # El grafo es un diccionario donde las claves son los nodos y los valores son otros diccionarios
+    # que contienen los nodos vecinos y sus costos de conexión
+    grafo = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'C': 2, 'D': 5},
+        'C': {'A': 4, 'B': 2, 'D': 1},
+        'D': {'B': 5, 'C': 1}
+    }
+
+    # Heurísticas para cada nodo (estimación del costo restante hasta el objetivo)
+    # Estas heurísticas deben ser proporcionadas de acuerdo al problema específico
+    heuristica = {
+        'A': 7,  # Estimación del costo de A a D
+        'B': 6,  # Estimación del costo de B a D
+        'C': 2,  # Estimación del costo de C a D
+        'D': 0   # El objetivo (D) tiene heurística 0
+    }
+
+    # Usamos el algoritmo A* para encontrar el camino más corto de A a D
+    nodo_inicial = 'A'
+    nodo_objetivo = 'D'
+    camino = a_star(grafo, nodo_inicial, nodo_objetivo, heuristica)
 
-# Heurísticas para cada nodo (estimación del costo restante hasta el objetivo)
-# Estas heurísticas deben ser proporcionadas de acuerdo al problema específico
-heuristica = {
-    'A': 7,  # Estimación del costo de A a D
-    'B': 6,  # Estimación del costo de B a D
-    'C': 2,  # Estimación del costo de C a D
-    'D': 0   # El objetivo (D) tiene heurística 0
-}
+    if camino:
+        print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
+    else:
+        print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
 
-# Usamos el algoritmo A* para encontrar el camino más corto de A a D
-nodo_inicial = 'A'
-nodo_objetivo = 'D'
-camino = a_star(grafo, nodo_inicial, nodo_objetivo, heuristica)
+    # Con costos y heurística enteros también se puede usar la cola de cubetas
+    camino = a_star(grafo, nodo_inicial, nodo_objetivo, heuristica, cola='cubetas')
+    print(f"Camino con cola de cubetas: {camino}")
 
-if camino:
-    print(f"El camino más corto de {nodo_inicial} a {nodo_objetivo} es: {camino}")
-else:
-    print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+    # Lo que pasó dentro de la búsqueda: expandidos, generados, duplicados, frontera máxima,
+    # evaluaciones de la heurística y tiempo por fase
+    estadisticas = EstadisticasBusqueda()
+    a_star(grafo, nodo_inicial, nodo_objetivo, heuristica, estadisticas=estadisticas)
+    print(f"Estadísticas de A*: {estadisticas.resultado()}")
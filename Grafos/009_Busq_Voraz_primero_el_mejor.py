@@ -1,10 +1,14 @@
 import heapq
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
 
 # Función de Búsqueda Voraz Primero el Mejor
-def busqueda_voraz(grafo, inicio, objetivo, heuristica):
+@con_estadisticas
+def busqueda_voraz(grafo, inicio, objetivo, heuristica, estadisticas=None):
     # Si el nodo inicial ya es el objetivo, retornamos inmediatamente
     if inicio == objetivo:
         return [inicio]
+    if estadisticas is not None:  # Se cuentan las evaluaciones de la heurística
+        heuristica = estadisticas.contar_heuristica(heuristica)
 
     # Inicializamos la lista de nodos por explorar (cola de prioridad)
     open_list = []
@@ -18,6 +22,9 @@ def busqueda_voraz(grafo, inicio, objetivo, heuristica):
 
     # Conjunto para evitar agregar múltiples veces el mismo nodo a la cola de prioridad
     en_cola = {inicio}
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(came_from))
+        estadisticas.fase('busqueda')
 
     while open_list:
         # Extraemos el nodo con la heurística más baja
@@ -26,18 +33,25 @@ def busqueda_voraz(grafo, inicio, objetivo, heuristica):
 
         # Si hemos alcanzado el objetivo, reconstruimos el camino
         if current_node == objetivo:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
             return reconstruir_camino(came_from, current_node)
 
         # Marcamos el nodo como explorado
         explorados.add(current_node)
 
         # Exploramos los vecinos del nodo actual
-        for vecino in grafo[current_node]:
+        vecinos = grafo[current_node]
+        if estadisticas is not None:
+            estadisticas.expansion(len(open_list), len(vecinos))
+        for vecino in vecinos:
             # Solo exploramos si el vecino no ha sido explorado ni está en la cola
             if vecino not in explorados and vecino not in en_cola:
                 came_from[vecino] = current_node  # Guardamos el camino
                 heapq.heappush(open_list, (heuristica[vecino], vecino))
                 en_cola.add(vecino)  # Marcamos que este nodo está en la cola
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(open_list))
 
     return None  # Si no se encuentra el objetivo, devolvemos None
 
@@ -50,34 +64,35 @@ def reconstruir_camino(came_from, current_node):
     camino.append(current_node)  # Agregamos el nodo inicial
     return camino[::-1]  # Invertimos el camino para obtenerlo desde el inicio
 
-# Grafo representado como un diccionario de adyacencia
-# El grafo es un diccionario donde las claves son los nodos y los valores son listas de nodos vecinos
-grafo = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
+if __name__ == "__main__":
+    # Grafo representado como un diccionario de adyacencia
+    # El grafo es un diccionario donde las claves son los nodos y los valores son listas de nodos vecinos
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
 
-# Heurísticas para cada nodo (estimación del costo restante hasta el objetivo)
-# En un problema real, las heurísticas deben estar basadas en el dominio del problema
-heuristica = {
-    'A': 6,  # Heurística de A (estimación de costo hasta el objetivo)
-    'B': 2,  # Heurística de B
-    'C': 3,  # Heurística de C
-    'D': 1,  # Heurística de D
-    'E': 4,  # Heurística de E
-    'F': 0   # Heurística de F (objetivo, por lo que su heurística es 0)
-}
+    # Heurísticas para cada nodo (estimación del costo restante hasta el objetivo)
+    # En un problema real, las heurísticas deben estar basadas en el dominio del problema
+    heuristica = {
+        'A': 6,  # Heurística de A (estimación de costo hasta el objetivo)
+        'B': 2,  # Heurística de B
+        'C': 3,  # Heurística de C
+        'D': 1,  # Heurística de D
+        'E': 4,  # Heurística de E
+        'F': 0   # Heurística de F (objetivo, por lo que su heurística es 0)
+    }
 
-# Usamos la Búsqueda Voraz Primero el Mejor para encontrar el camino de A a F
-nodo_inicial = 'A'
-nodo_objetivo = 'F'
-camino = busqueda_voraz(grafo, nodo_inicial, nodo_objetivo, heuristica)
+    # Usamos la Búsqueda Voraz Primero el Mejor para encontrar el camino de A a F
+    nodo_inicial = 'A'
+    nodo_objetivo = 'F'
+    camino = busqueda_voraz(grafo, nodo_inicial, nodo_objetivo, heuristica)
 
-if camino:
-    print(f"El camino encontrado de {nodo_inicial} a {nodo_objetivo} es: {camino}")
-else:
-    print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
+    if camino:
+        print(f"El camino encontrado de {nodo_inicial} a {nodo_objetivo} es: {camino}")
+    else:
+        print(f"No se encontró un camino entre {nodo_inicial} y {nodo_objetivo}.")
@@ -1,14 +1,28 @@
 import heapq
+import itertools
+import random
+import time
+from cola_prioridad import crear_cola  # Cola de prioridad indexada con decremento de prioridad
+from estadisticas_busqueda import con_estadisticas  # Contadores opcionales (ver estadisticas_busqueda.py)
 
 ### --- Algoritmo A* (A Estrella) --- ###
 
-def busqueda_A_estrella(grafo, costos, inicio, objetivo, heuristica):
+@con_estadisticas
+def busqueda_A_estrella(grafo, costos, inicio, objetivo, heuristica, cola='binaria', estadisticas=None):
     """
     Implementación de A* para encontrar el camino más corto en un grafo.
+    - heuristica: diccionario {nodo: h(n)} o función h(nodo)
+    - cola: 'binaria' (montículo indexado) o 'cubetas' (costos y heurística enteros)
+    - estadisticas: EstadisticasBusqueda opcional (ver estadisticas_busqueda.py)
     """
-    # Lista de nodos abiertos (prioridad por f(n) = g(n) + h(n))
-    open_list = []
-    heapq.heappush(open_list, (heuristica[inicio], inicio, 0))  # (f(n), nodo, g(n))
+    if not callable(heuristica):
+        heuristica = heuristica.__getitem__
+    if estadisticas is not None:
+        heuristica = estadisticas.contar_heuristica(heuristica)
+
+    # Lista de nodos abiertos (prioridad por f(n) = g(n) + h(n)); cada nodo aparece una sola vez
+    open_list = crear_cola(cola)
+    open_list.insertar(inicio, heuristica(inicio))
 
     # Diccionario para rastrear de dónde viene cada nodo
     came_from = {}
@@ -16,24 +30,35 @@ def busqueda_A_estrella(grafo, costos, inicio, objetivo, heuristica):
     # Costos acumulados desde el nodo inicial
     g_score = {nodo: float('inf') for nodo in grafo}
     g_score[inicio] = 0
+    if estadisticas is not None:
+        estadisticas.vigilar(lambda: len(came_from))
+        estadisticas.fase('busqueda')
 
     while open_list:
         # Extraemos el nodo con menor f(n) de la lista abierta
-        _, current_node, g_actual = heapq.heappop(open_list)
+        current_node, _ = open_list.extraer_min()
+        g_actual = g_score[current_node]
 
         # Si llegamos al objetivo, reconstruimos el camino
         if current_node == objetivo:
+            if estadisticas is not None:
+                estadisticas.fase('reconstruccion')
             return reconstruir_camino(came_from, current_node)
 
         # Recorremos los vecinos del nodo actual
-        for vecino in grafo[current_node]:
+        vecinos = grafo[current_node]
+        if estadisticas is not None:
+            estadisticas.expansion(len(open_list), len(vecinos))
+        for vecino in vecinos:
             # Calculamos el nuevo costo g(n) para el vecino
             nuevo_g = g_actual + costos.get((current_node, vecino), float('inf'))
             if nuevo_g < g_score[vecino]:  # Si encontramos un mejor camino
                 came_from[vecino] = current_node  # Actualizamos el predecesor
                 g_score[vecino] = nuevo_g  # Actualizamos g(n)
-                f_nuevo = nuevo_g + heuristica[vecino]  # Calculamos f(n)
-                heapq.heappush(open_list, (f_nuevo, vecino, nuevo_g))  # Añadimos a la lista abierta
+                f_nuevo = nuevo_g + heuristica(vecino)  # Calculamos f(n)
+                open_list.insertar_o_decrementar(vecino, f_nuevo)  # Se inserta o se reduce su prioridad
+        if estadisticas is not None:
+            estadisticas.medir_frontera(len(open_list))
 
     return None  # No hay solución si salimos del bucle
 
@@ -53,6 +78,8 @@ def reconstruir_camino(came_from, nodo):
 class Nodo:
     """
     Representa un nodo en el grafo AND-OR para el algoritmo AO*.
+    Los resultados de AO* (costo, mejor conector y si está resuelto) se guardan en
+    el propio nodo, así que un subproblema compartido se resuelve una sola vez.
     """
     def __init__(self, nombre, es_meta=False):
         self.nombre = nombre  # Nombre del nodo
@@ -60,6 +87,11 @@ class Nodo:
         self.hijos = []  # Lista de (nodos hijos, costo)
         self.mejor_camino = None  # Guarda el camino óptimo
         self.costo = float('inf') if not es_meta else 0  # Costos iniciales (0 si es meta)
+        self.descubierto = es_meta  # Ya tiene un costo estimado (h o 0 si es meta)
+        self.expandido = es_meta  # Ya se revisaron sus conectores
+        self.resuelto = es_meta  # Su mejor conector lleva solo a nodos resueltos
+        self.padres = []  # Nodos expandidos que lo tienen en alguno de sus conectores
+        # Sin __eq__ propio, cada Nodo se compara y se hashea por identidad en sets y diccionarios
 
     def agregar_hijo(self, hijos, costo):
         """
@@ -67,93 +99,234 @@ class Nodo:
         """
         self.hijos.append((hijos, costo))
 
-def ao_star(nodo, heuristica):
+@con_estadisticas
+def ao_star(nodo, heuristica, estadisticas=None):
     """
-    Implementación del algoritmo AO* para grafos AND-OR con correcta actualización de costos.
+    Implementación del algoritmo AO* para grafos AND-OR.
+    - heuristica: diccionario {nombre: h(n)} o función h(nodo); los nodos sin valor usan 0
+
+    Repite dos fases hasta que la raíz queda resuelta (o su costo es infinito):
+    1. Marcado: se baja por los mejores conectores marcados y se expanden todas las
+       hojas sin expandir del grafo solución parcial (sus hijos reciben su costo heurístico).
+    2. Revisión: se recalculan los costos solo de los nodos expandidos y de sus ancestros
+       a través de conectores marcados, en orden creciente de costo (Dijkstra generalizado
+       de Knuth). Así un ciclo nunca se sostiene a sí mismo: un nodo cuyo mejor conector
+       solo lleva de vuelta a sus ancestros queda con costo infinito.
+    Todo se hace con pilas y montículos explícitos, sin recursión.
+    Con 'estadisticas', los tiempos se separan en las fases 'marcado', 'expansion' y 'revision'.
     """
-    if nodo.es_meta:  # Si el nodo es meta, su costo es 0
-        return nodo.costo
-
-    mejor_costo = float('inf')  # Inicializamos el mejor costo como infinito
-    mejor_opcion = None  # Para guardar la mejor opción de hijos
-
-    # Recorremos todas las conexiones del nodo actual
-    for hijos, costo in nodo.hijos:
-        # Calculamos el costo total de esta opción (costo + suma de costos de los hijos)
-        total = costo + sum(ao_star(hijo, heuristica) for hijo in hijos)
-        if total < mejor_costo:  # Si encontramos un mejor costo
-            mejor_costo = total
-            mejor_opcion = hijos
-
-    # Actualizamos el nodo con la mejor opción encontrada
-    if mejor_opcion:
-        nodo.mejor_camino = mejor_opcion  # Guardamos el mejor camino
-        nodo.costo = mejor_costo  # Actualizamos el costo del nodo
-        heuristica[nodo.nombre] = mejor_costo  # Actualizamos la heurística del nodo
+    if not callable(heuristica):
+        valores = heuristica
+        heuristica = lambda n: valores.get(n.nombre, 0)
+    if estadisticas is not None:
+        heuristica = estadisticas.contar_heuristica(heuristica)
+
+    descubrir(nodo, heuristica)
+    while not nodo.resuelto and nodo.costo < float('inf'):
+        if estadisticas is not None:
+            estadisticas.fase('marcado')
+        hojas = buscar_hojas(nodo)
+        if not hojas:
+            break
+        if estadisticas is not None:
+            estadisticas.fase('expansion')
+        for hoja in hojas:
+            if estadisticas is not None:  # La frontera son las hojas del grafo solución marcado
+                estadisticas.expansion(len(hojas), sum(len(hijos) for hijos, _ in hoja.hijos))
+            expandir(hoja, heuristica)
+        if estadisticas is not None:
+            estadisticas.fase('revision')
+        revisar_costos(hojas)
 
     return nodo.costo  # Retornamos el costo del nodo
 
+def descubrir(nodo, heuristica):
+    """Asigna el costo heurístico a un nodo la primera vez que aparece."""
+    if not nodo.descubierto:
+        nodo.descubierto = True
+        nodo.costo = heuristica(nodo)
+
+def buscar_hojas(raiz):
+    """Fase de marcado: nodos sin expandir del grafo solución marcado."""
+    hojas = []
+    pila = [raiz]
+    vistos = {raiz}
+    while pila:
+        nodo = pila.pop()
+        if nodo.resuelto:
+            continue
+        if not nodo.expandido:
+            hojas.append(nodo)
+            continue
+        for hijo in reversed(nodo.mejor_camino or []):  # Se respeta el orden de los hijos
+            if hijo not in vistos:
+                vistos.add(hijo)
+                pila.append(hijo)
+    return hojas
+
+def expandir(nodo, heuristica):
+    """Descubre los hijos de todos los conectores del nodo y los enlaza con su padre."""
+    nodo.expandido = True
+    enlazados = set()
+    for hijos, _ in nodo.hijos:
+        for hijo in hijos:
+            descubrir(hijo, heuristica)
+            if hijo not in enlazados:
+                enlazados.add(hijo)
+                hijo.padres.append(nodo)
+
+def revisar_costos(expandidos):
+    """
+    Fase de revisión: recalcula el costo, el conector marcado y si está resuelto
+    cada nodo cuyo costo puede cambiar, es decir, los nodos expandidos y sus ancestros
+    a través de conectores marcados. Los demás nodos conservan sus valores.
+    """
+    # Conjunto afectado: ancestros por conectores marcados (pila explícita); un dict
+    # en lugar de un set para que el orden, y con él los desempates, sea reproducible
+    afectados = dict.fromkeys(expandidos)
+    pila = list(expandidos)
+    while pila:
+        nodo = pila.pop()
+        for padre in nodo.padres:
+            if padre not in afectados and padre.mejor_camino is not None and \
+                    any(hijo is nodo for hijo in padre.mejor_camino):
+                afectados[padre] = None
+                pila.append(padre)
+
+    # Cada conector se puede evaluar cuando todos sus hijos afectados ya tienen costo final
+    faltan = {}  # (padre, índice del conector) -> hijos afectados sin costo final
+    usos = {}  # hijo afectado -> conectores que lo contienen
+    candidatos = []  # (costo, desempate, nodo, índice del conector)
+    contador = itertools.count()
+    for nodo in afectados:
+        for k, (hijos, costo) in enumerate(nodo.hijos):
+            pendientes = [hijo for hijo in hijos if hijo in afectados]
+            if pendientes:
+                faltan[nodo, k] = len(pendientes)
+                for hijo in pendientes:
+                    usos.setdefault(hijo, []).append((nodo, k))
+            else:
+                total = costo + sum(hijo.costo for hijo in hijos)
+                heapq.heappush(candidatos, (total, next(contador), nodo, k))
+
+    finales = set()
+    while candidatos:
+        total, _, nodo, k = heapq.heappop(candidatos)
+        if nodo in finales:
+            continue
+        finales.add(nodo)
+        nodo.costo = total
+        nodo.mejor_camino = nodo.hijos[k][0]
+        nodo.resuelto = all(hijo.resuelto for hijo in nodo.mejor_camino)
+        for padre, j in usos.get(nodo, ()):
+            faltan[padre, j] -= 1
+            if faltan[padre, j] == 0 and padre not in finales:
+                hijos, costo = padre.hijos[j]
+                heapq.heappush(candidatos, (costo + sum(hijo.costo for hijo in hijos), next(contador), padre, j))
+
+    # Los que nunca obtuvieron un costo final no tienen solución (o solo a través de ciclos)
+    for nodo in afectados:
+        if nodo not in finales:
+            nodo.costo = float('inf')
+            nodo.mejor_camino = None
+            nodo.resuelto = False
+
 def reconstruir_camino_AO(nodo):
     """
     Reconstruye el camino óptimo en un grafo AND-OR después de AO*.
+    Recorre el grafo solución en preorden con una pila explícita.
     """
-    if nodo.mejor_camino is None:  # Si no hay mejor camino, devolvemos solo este nodo
-        return [nodo.nombre]
-
-    camino = [nodo.nombre]  # Añadimos el nodo actual al camino
-    for hijo in nodo.mejor_camino:  # Recorremos los hijos del mejor camino
-        camino.extend(reconstruir_camino_AO(hijo))  # Añadimos los caminos de los hijos
+    camino = []
+    pila = [nodo]
+    while pila:
+        nodo = pila.pop()
+        camino.append(nodo.nombre)  # Añadimos el nodo actual al camino
+        if nodo.mejor_camino is not None:  # Los hijos del mejor camino se visitan en orden
+            pila.extend(reversed(nodo.mejor_camino))
 
     return camino
 
 ### --- Pruebas de los Algoritmos --- ###
 
-# Grafo para A*
-grafo_a_estrella = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
-
-# Costos de A*
-costos_a_estrella = {
-    ('A', 'B'): 1, ('A', 'C'): 4,
-    ('B', 'D'): 1, ('B', 'E'): 2,
-    ('C', 'F'): 3, ('E', 'F'): 2
-}
-
-# Heurística de A*
-heuristica_a_estrella = {'A': 6, 'B': 2, 'C': 3, 'D': 1, 'E': 4, 'F': 0}
-
-# Ejecutamos A*
-print("Ejecutando A*...")
-camino_a_estrella = busqueda_A_estrella(grafo_a_estrella, costos_a_estrella, 'A', 'F', heuristica_a_estrella)
-print(f"Camino óptimo con A*: {camino_a_estrella}\n")
-
-
-# Grafo AND-OR para AO*
-print("Ejecutando AO*...")
-A = Nodo('A')
-B = Nodo('B')
-C = Nodo('C')
-D = Nodo('D', es_meta=True)  # Meta
-E = Nodo('E', es_meta=True)  # Meta
-
-# Definimos conexiones en AO* (AND implica que ambos deben cumplirse)
-A.agregar_hijo([B], 3)   # Camino A → B con costo 3
-B.agregar_hijo([D], 2)   # Camino B → D con costo 2
-A.agregar_hijo([C], 4)   # Camino A → C con costo 4
-C.agregar_hijo([E], 1)   # Camino C → E con costo 1
-
-# Heurística inicial para AO*
-heuristica_ao = {'A': 6, 'B': 2, 'C': 3, 'D': 0, 'E': 0}
-
-# Ejecutamos AO*
-ao_star(A, heuristica_ao)
-
-# Obtenemos el camino óptimo en AO*
-camino_ao = reconstruir_camino_AO(A)
-print(f"Camino óptimo con AO*: {camino_ao}")
+if __name__ == "__main__":
+    # Grafo para A*
+    grafo_a_estrella = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    # Costos de A*
+    costos_a_estrella = {
+        ('A', 'B'): 1, ('A', 'C'): 4,
+        ('B', 'D'): 1, ('B', 'E'): 2,
+        ('C', 'F'): 3, ('E', 'F'): 2
+    }
+
+    # Heurística de A*
+    heuristica_a_estrella = {'A': 6, 'B': 2, 'C': 3, 'D': 1, 'E': 4, 'F': 0}
+
+    # Ejecutamos A*
+    print("Ejecutando A*...")
+    camino_a_estrella = busqueda_A_estrella(grafo_a_estrella, costos_a_estrella, 'A', 'F', heuristica_a_estrella)
+    print(f"Camino óptimo con A*: {camino_a_estrella}\n")
+
+
+    # Grafo AND-OR para AO*
+    print("Ejecutando AO*...")
+    A = Nodo('A')
+    B = Nodo('B')
+    C = Nodo('C')
+    D = Nodo('D', es_meta=True)  # Meta
+    E = Nodo('E', es_meta=True)  # Meta
+
+    # Definimos conexiones en AO* (AND implica que ambos deben cumplirse)
+    A.agregar_hijo([B], 3)   # Camino A → B con costo 3
+    B.agregar_hijo([D], 2)   # Camino B → D con costo 2
+    A.agregar_hijo([C], 4)   # Camino A → C con costo 4
+    C.agregar_hijo([E], 1)   # Camino C → E con costo 1
+
+    # Heurística inicial para AO*
+    heuristica_ao = {'A': 6, 'B': 2, 'C': 3, 'D': 0, 'E': 0}
+
+    # Ejecutamos AO*
+    ao_star(A, heuristica_ao)
+
+    # Obtenemos el camino óptimo en AO*
+    camino_ao = reconstruir_camino_AO(A)
+    print(f"Camino óptimo con AO*: {camino_ao}")
+
+
+    # Grafo AND-OR con un ciclo: X y Y se llaman entre sí, pero solo Y tiene salida a una meta
+    X, Y, G = Nodo('X'), Nodo('Y'), Nodo('G', es_meta=True)
+    X.agregar_hijo([Y], 1)
+    Y.agregar_hijo([X], 1)
+    Y.agregar_hijo([G], 10)
+    print(f"AO* con ciclo: costo {ao_star(X, {})}, camino {reconstruir_camino_AO(X)}")
+
+    # Grafo AND-OR grande con subproblemas compartidos (un DAG de 100 000 nodos):
+    # sin memoria, resolver cada subárbol una y otra vez tomaría tiempo exponencial
+    generador = random.Random(0)
+    num_nodos = 100_000
+    nodos = [Nodo(i, es_meta=generador.random() < 0.02 or i >= num_nodos - 50) for i in range(num_nodos)]
+    for i, nodo in enumerate(nodos):
+        if nodo.es_meta:
+            continue
+        for _ in range(2):  # Dos opciones OR, cada una con uno o dos subproblemas AND
+            hijos = [nodos[generador.randint(i + 1, min(i + 50, num_nodos - 1))]
+                     for _ in range(generador.randint(1, 2))]
+            nodo.agregar_hijo(hijos, generador.randint(1, 5))
+
+    inicio = time.perf_counter()
+    costo = ao_star(nodos[0], lambda nodo: 0)
+    print(f"AO* en un grafo AND-OR de {num_nodos} nodos: costo {costo} "
+          f"en {time.perf_counter() - inicio:.3f} s ({sum(n.expandido and not n.es_meta for n in nodos)} nodos expandidos)")
+
+    # Los resultados quedan guardados en cada Nodo: resolver todos los nodos reutiliza los subproblemas ya resueltos
+    inicio = time.perf_counter()
+    for nodo in reversed(nodos):
+        ao_star(nodo, lambda nodo: 0)
+    print(f"Los {num_nodos} nodos resueltos en {time.perf_counter() - inicio:.2f} s")
@@ -1,6 +1,63 @@
 import random
+import time
+import numpy as np
 
-def busqueda_tabu(funcion_evaluacion, generar_vecinos, estado_inicial, max_iter=100, tamano_tabu=5):
+class MemoriaTabu:
+    """
+    Memoria tabú de tamaño fijo: un anillo con los últimos 'permanencia' elementos y
+    un diccionario elemento -> veces que aparece en el anillo. Consultar y agregar
+    cuesta O(1) aunque la permanencia sea de miles (una lista cuesta O(k) en 'in'
+    y en pop(0)). Los elementos pueden ser estados (ya convertidos en claves) o
+    atributos de los movimientos.
+    """
+    def __init__(self, permanencia):
+        self.permanencia = permanencia
+        self.anillo = [None] * permanencia
+        self.posicion = 0  # Próxima casilla del anillo que se escribe
+        self.llenos = 0
+        self.conteo = {}
+
+    def __len__(self):
+        return self.llenos
+
+    def __contains__(self, elemento):
+        return elemento in self.conteo
+
+    def agregar(self, elemento):
+        """Agrega un elemento; si el anillo está lleno, olvida el más antiguo."""
+        if self.permanencia == 0:
+            return
+        if self.llenos == self.permanencia:
+            antiguo = self.anillo[self.posicion]
+            if self.conteo[antiguo] == 1:
+                del self.conteo[antiguo]
+            else:
+                self.conteo[antiguo] -= 1
+        else:
+            self.llenos += 1
+        self.anillo[self.posicion] = elemento
+        self.conteo[elemento] = self.conteo.get(elemento, 0) + 1
+        self.posicion = (self.posicion + 1) % self.permanencia
+
+def clave_estado(estado, cuantizacion=None):
+    """
+    Clave hashable de un estado. Con 'cuantizacion' los valores se redondean a
+    múltiplos de ese paso, así que dos estados continuos casi iguales tienen la
+    misma clave (con igualdad exacta de flotantes el tabú casi nunca se activa).
+    Acepta números, tuplas/listas de números y arreglos de NumPy.
+    """
+    if isinstance(estado, np.ndarray):
+        if cuantizacion is not None:
+            estado = np.round(estado / cuantizacion).astype(np.int64)
+        return estado.tobytes()
+    if cuantizacion is None:
+        return tuple(estado) if isinstance(estado, list) else estado
+    if isinstance(estado, (tuple, list)):
+        return tuple(round(valor / cuantizacion) for valor in estado)
+    return round(estado / cuantizacion)
+
+def busqueda_tabu(funcion_evaluacion, generar_vecinos, estado_inicial, max_iter=100, tamano_tabu=5,
+                  cuantizacion=None, atributo=None, aspiracion=True, en_lote=False):
     """
     Implementación de la Búsqueda Tabú.
     
@@ -8,42 +65,58 @@ def busqueda_tabu(funcion_evaluacion, generar_vecinos, estado_inicial, max_iter=
     - generar_vecinos: Función que genera estados vecinos.
     - estado_inicial: Estado de inicio.
     - max_iter: Máximo de iteraciones.
-    - tamano_tabu: Cantidad máxima de elementos en la lista tabú.
+    - tamano_tabu: Permanencia: cuántos estados o atributos recuerda la memoria tabú.
+    - cuantizacion: Paso para redondear los estados continuos antes de compararlos.
+    - atributo: Función (estado, vecino) -> atributo del movimiento (por ejemplo la
+      variable que cambia). Si se da, lo tabú son los atributos de los últimos
+      movimientos y no los estados visitados.
+    - aspiracion: Un vecino tabú se acepta si mejora la mejor solución encontrada.
+    - en_lote: generar_vecinos retorna un arreglo de NumPy (un vecino por fila) y
+      funcion_evaluacion evalúa todo el arreglo de una vez.
     
     Retorna la mejor solución encontrada.
     """
     estado_actual = estado_inicial  # Se establece el estado inicial
     mejor_estado = estado_actual  # Se guarda la mejor solución encontrada
-    mejor_valor = funcion_evaluacion(estado_actual)  # Se evalúa la solución inicial
+    mejor_valor = funcion_evaluacion(np.asarray([estado_actual]))[0] if en_lote else funcion_evaluacion(estado_actual)
 
-    lista_tabu = []  # Lista tabú para evitar ciclos
+    memoria_tabu = MemoriaTabu(tamano_tabu)  # Memoria tabú para evitar ciclos
 
     for _ in range(max_iter):  # Se itera hasta el máximo de iteraciones
         vecinos = generar_vecinos(estado_actual)  # Se generan vecinos del estado actual
 
-        # Se filtran vecinos que no están en la lista tabú
-        vecinos = [v for v in vecinos if v not in lista_tabu]
+        # Se evalúan todos los vecinos una sola vez (en lote: una llamada para todo el arreglo)
+        if en_lote:
+            vecinos = np.asarray(vecinos)
+            valores = np.asarray(funcion_evaluacion(vecinos))
+            orden = np.argsort(-valores, kind='stable')
+        else:
+            valores = [funcion_evaluacion(v) for v in vecinos]
+            orden = sorted(range(len(vecinos)), key=lambda i: -valores[i])
 
-        if not vecinos:
-            break  # Si no hay vecinos válidos, se detiene la búsqueda
+        # Se selecciona el mejor vecino que no es tabú (o que cumple la aspiración);
+        # las claves solo se calculan para los vecinos que se revisan
+        estado_siguiente = None
+        for i in orden:
+            if atributo is not None:
+                clave = atributo(estado_actual, vecinos[i])
+            else:
+                clave = clave_estado(vecinos[i], cuantizacion)
+            if clave not in memoria_tabu or (aspiracion and valores[i] > mejor_valor):
+                estado_siguiente, valor_siguiente = vecinos[i], valores[i]
+                break
 
-        # Se selecciona el mejor vecino disponible
-        estado_siguiente = max(vecinos, key=funcion_evaluacion)
-        valor_siguiente = funcion_evaluacion(estado_siguiente)
+        if estado_siguiente is None:
+            break  # Si no hay vecinos válidos, se detiene la búsqueda
 
         # Se actualiza la mejor solución encontrada
         if valor_siguiente > mejor_valor:
             mejor_estado = estado_siguiente
             mejor_valor = valor_siguiente
 
-        # Se mueve al siguiente estado
+        # Se mueve al siguiente estado y se actualiza la memoria tabú
         estado_actual = estado_siguiente
-
-        # Se actualiza la lista tabú
-        if estado_actual not in lista_tabu:  # Evitar duplicados
-            lista_tabu.append(estado_actual)
-        if len(lista_tabu) > tamano_tabu:  # Se mantiene un tamaño limitado
-            lista_tabu.pop(0)
+        memoria_tabu.agregar(clave)
 
     return mejor_estado, mejor_valor  # Se retorna la mejor solución encontrada
 
@@ -59,8 +132,35 @@ def generar_vecinos(x):
 estado_inicial = random.uniform(-10, 10)
 
 # 🔹 Ejecutamos la Búsqueda Tabú
-mejor_solucion, mejor_valor = busqueda_tabu(funcion_evaluacion, generar_vecinos, estado_inicial)
+# (los estados se redondean a centésimas para que volver a un x ya visitado sea tabú)
+mejor_solucion, mejor_valor = busqueda_tabu(funcion_evaluacion, generar_vecinos, estado_inicial, cuantizacion=0.01)
 
 # 🔹 Mostramos los resultados
 print(f"Mejor solución encontrada: x = {mejor_solucion}")
 print(f"Valor óptimo: f(x) = {mejor_valor}")
+
+# 🔹 Problema binario cuadrático (maximizar x^T Q x con x de 0 y 1) con 300 variables.
+# Los vecinos son todos los cambios de un bit, generados como un arreglo y evaluados en lote
+generador = np.random.default_rng(0)
+n = 300
+Q = generador.integers(-10, 11, (n, n))
+Q = ((Q + Q.T) // 2).astype(np.float64)  # En float64 el producto matricial usa BLAS
+
+def evaluar_lote(estados):
+    return ((estados @ Q) * estados).sum(axis=1)
+
+def vecinos_lote(x):
+    return np.abs(x - np.eye(n))  # Fila i: x con el bit i invertido
+
+x_inicial = generador.integers(0, 2, n).astype(np.float64)
+
+# Tabú por atributo: el bit que se acaba de cambiar no se puede volver a cambiar en 20 iteraciones
+inicio = time.perf_counter()
+_, valor = busqueda_tabu(evaluar_lote, vecinos_lote, x_inicial, max_iter=500, tamano_tabu=20,
+                         atributo=lambda x, vecino: int(np.argmax(x != vecino)), en_lote=True)
+print(f"\nBinario cuadrático, tabú por atributo (bit cambiado): valor {valor:.0f} en {time.perf_counter() - inicio:.2f} s")
+
+# Tabú por estado con permanencia de 5000: cada consulta sigue siendo O(1)
+inicio = time.perf_counter()
+_, valor = busqueda_tabu(evaluar_lote, vecinos_lote, x_inicial, max_iter=500, tamano_tabu=5000, en_lote=True)
+print(f"Binario cuadrático, tabú por estado (permanencia 5000): valor {valor:.0f} en {time.perf_counter() - inicio:.2f} s")
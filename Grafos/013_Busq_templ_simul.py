@@ -1,5 +1,7 @@
 import math
+import os
 import random
+from multiprocessing import Pool
 
 def temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial, temperatura_inicial=100, enfriamiento=0.99, iteraciones=1000, umbral_temperatura=0.01):
     """
@@ -16,24 +18,23 @@ def temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial, tempera
     Retorna la mejor solución encontrada.
     """
     estado_actual = estado_inicial  # Se establece el estado inicial
+    valor_actual = funcion_evaluacion(estado_actual)  # Se evalúa la solución inicial (y se guarda)
     mejor_estado = estado_actual  # Se guarda la mejor solución encontrada
-    mejor_valor = funcion_evaluacion(estado_actual)  # Se evalúa la solución inicial
+    mejor_valor = valor_actual
 
     temperatura = temperatura_inicial  # Se inicializa la temperatura
 
     for i in range(iteraciones):
         nuevo_estado = generar_vecinos(estado_actual)  # Se genera un nuevo estado vecino
-        nuevo_valor = funcion_evaluacion(nuevo_estado)  # Se evalúa la nueva solución
+        nuevo_valor = funcion_evaluacion(nuevo_estado)  # Única evaluación del paso
 
-        # Si la nueva solución es mejor, la aceptamos directamente
-        if nuevo_valor > mejor_valor:
-            mejor_estado = nuevo_estado
-            mejor_valor = nuevo_valor
-            estado_actual = nuevo_estado
+        # Si la nueva solución es mejor que la actual, la aceptamos directamente
+        if nuevo_valor >= valor_actual:
+            estado_actual, valor_actual = nuevo_estado, nuevo_valor
 
         else:
             # Si la solución es peor, se acepta con probabilidad basada en la temperatura
-            delta = nuevo_valor - mejor_valor  # Diferencia de calidad entre soluciones
+            delta = nuevo_valor - valor_actual  # Diferencia de calidad con la solución actual
             
             # Evitar división por cero en el cálculo de probabilidad
             if temperatura > 0:
@@ -42,7 +43,11 @@ def temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial, tempera
                 probabilidad = 0
 
             if random.random() < probabilidad:
-                estado_actual = nuevo_estado  # Se acepta la nueva solución peor
+                estado_actual, valor_actual = nuevo_estado, nuevo_valor  # Se acepta la nueva solución peor
+
+        # Se actualiza la mejor solución encontrada
+        if valor_actual > mejor_valor:
+            mejor_estado, mejor_valor = estado_actual, valor_actual
 
         # Reducimos la temperatura en cada iteración
         temperatura *= enfriamiento
@@ -53,6 +58,143 @@ def temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial, tempera
 
     return mejor_estado, mejor_valor, temperatura, i + 1  # Se retorna la mejor solución encontrada
 
+class Cadena:
+    """
+    Una réplica del temple paralelo: su estado y su valor (guardado para no volver
+    a evaluarlo), su temperatura fija, la mejor solución que ha visto y el estado
+    de su generador aleatorio, que viaja con ella para que el resultado no dependa
+    de qué proceso la ejecute.
+    """
+    def __init__(self, estado, valor, temperatura, semilla):
+        self.estado = estado
+        self.valor = valor
+        self.temperatura = temperatura
+        self.mejor_estado = estado
+        self.mejor_valor = valor
+        self.aleatorio = random.Random(semilla).getstate()
+
+def avanzar_cadena(cadena, pasos):
+    """
+    Da 'pasos' pasos de Metropolis a temperatura fija (una evaluación por paso).
+    El generador global 'random' toma el estado de la cadena, así que también
+    generar_vecinos usa la secuencia de la cadena.
+    """
+    random.setstate(cadena.aleatorio)
+    estado, valor = cadena.estado, cadena.valor
+    for _ in range(pasos):
+        nuevo_estado = funciones_trabajador[1](estado)
+        nuevo_valor = funciones_trabajador[0](nuevo_estado)
+        if nuevo_valor >= valor or random.random() < math.exp((nuevo_valor - valor) / cadena.temperatura):
+            estado, valor = nuevo_estado, nuevo_valor
+            if valor > cadena.mejor_valor:
+                cadena.mejor_estado, cadena.mejor_valor = estado, valor
+    cadena.estado, cadena.valor = estado, valor
+    cadena.aleatorio = random.getstate()
+    return cadena
+
+# Funciones (evaluación, vecinos) de cada proceso trabajador (se reciben una sola vez al crear el proceso)
+funciones_trabajador = None
+
+def iniciar_trabajador(funcion_evaluacion, generar_vecinos):
+    global funciones_trabajador
+    funciones_trabajador = (funcion_evaluacion, generar_vecinos)
+
+def crear_grupo(funcion_evaluacion, generar_vecinos, procesos, tareas):
+    """Grupo de procesos, o None si basta con el proceso actual."""
+    procesos = min(procesos or os.cpu_count() or 1, tareas)
+    iniciar_trabajador(funcion_evaluacion, generar_vecinos)  # Para cuando se trabaja sin procesos
+    if procesos == 1:
+        return None
+    return Pool(procesos, initializer=iniciar_trabajador, initargs=(funcion_evaluacion, generar_vecinos))
+
+def ejecutar_sin_grupo(funcion, tareas):
+    """
+    Ejecuta las tareas en el proceso actual. Como avanzar_cadena y reinicio_temple
+    cambian el generador global 'random', su estado se guarda antes y se restaura
+    después, para no alterar la secuencia de quien llamó.
+    """
+    estado = random.getstate()
+    try:
+        return [funcion(*tarea) for tarea in tareas]
+    finally:
+        random.setstate(estado)
+
+def temple_paralelo(funcion_evaluacion, generar_vecinos, estado_inicial, replicas=8, temperatura_minima=0.01,
+                    temperatura_maxima=10, rondas=200, pasos_por_ronda=50, semilla=None, procesos=None):
+    """
+    Temple paralelo (intercambio de réplicas): 'replicas' cadenas a temperaturas fijas en
+    escalera geométrica entre temperatura_minima y temperatura_maxima. En cada ronda cada
+    cadena da pasos_por_ronda pasos (las cadenas se reparten entre procesos) y después
+    se intenta intercambiar los estados de temperaturas vecinas (pares e impares en
+    rondas alternas) con probabilidad min(1, exp((v_j - v_i) (1/T_i - 1/T_j))).
+    Las cadenas calientes exploran y las frías refinan lo que reciben.
+
+    - funcion_evaluacion y generar_vecinos: funciones de módulo (se envían a los procesos)
+    - procesos: None = uno por núcleo, 1 = sin procesos extra (mismo resultado)
+
+    Retorna (mejor_estado, mejor_valor, tasas), con la tasa de intercambios aceptados
+    entre cada par de temperaturas vecinas.
+    """
+    aleatorio = random.Random(semilla)
+    razon = (temperatura_maxima / temperatura_minima) ** (1 / max(1, replicas - 1))
+    valor_inicial = funcion_evaluacion(estado_inicial)
+    cadenas = [Cadena(estado_inicial, valor_inicial, temperatura_minima * razon ** k, aleatorio.getrandbits(64))
+               for k in range(replicas)]
+    aceptados = [0] * (replicas - 1)
+    intentos = [0] * (replicas - 1)
+
+    grupo = crear_grupo(funcion_evaluacion, generar_vecinos, procesos, replicas)
+    try:
+        for ronda in range(rondas):
+            tareas = [(cadena, pasos_por_ronda) for cadena in cadenas]
+            cadenas = grupo.starmap(avanzar_cadena, tareas) if grupo else ejecutar_sin_grupo(avanzar_cadena, tareas)
+
+            # Intercambios entre temperaturas vecinas: solo se mueven estados y valores ya calculados
+            for k in range(ronda % 2, replicas - 1, 2):
+                fria, caliente = cadenas[k], cadenas[k + 1]
+                intentos[k] += 1
+                exponente = (caliente.valor - fria.valor) * (1 / fria.temperatura - 1 / caliente.temperatura)
+                if exponente >= 0 or aleatorio.random() < math.exp(exponente):
+                    fria.estado, caliente.estado = caliente.estado, fria.estado
+                    fria.valor, caliente.valor = caliente.valor, fria.valor
+                    aceptados[k] += 1
+    finally:
+        if grupo:
+            grupo.close()
+            grupo.join()
+
+    mejor = max(cadenas, key=lambda cadena: cadena.mejor_valor)
+    tasas = [a / i if i else 0.0 for a, i in zip(aceptados, intentos)]
+    return mejor.mejor_estado, mejor.mejor_valor, tasas
+
+def reinicio_temple(estado_inicial, semilla, opciones):
+    """Un temple simulado completo con su propia semilla (se ejecuta en un proceso trabajador)."""
+    random.seed(semilla)
+    funcion_evaluacion, generar_vecinos = funciones_trabajador
+    if callable(estado_inicial):  # Generador de estados iniciales al azar
+        estado_inicial = estado_inicial()
+    return temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial, **opciones)
+
+def temple_con_reinicios(funcion_evaluacion, generar_vecinos, estado_inicial, reinicios=8, semilla=None,
+                         procesos=None, **opciones):
+    """
+    Varios temples simulados independientes en paralelo; retorna el mejor resultado
+    (con el mismo formato que temple_simulado).
+    - estado_inicial: un estado o una función sin argumentos (de módulo) que genera
+      uno al azar, para que cada reinicio parta de un lugar distinto
+    - cada reinicio recibe su propia semilla derivada de 'semilla'
+    - opciones: se pasan a temple_simulado (temperatura_inicial, enfriamiento, ...)
+    """
+    aleatorio = random.Random(semilla)
+    tareas = [(estado_inicial, aleatorio.getrandbits(64), opciones) for _ in range(reinicios)]
+    grupo = crear_grupo(funcion_evaluacion, generar_vecinos, procesos, reinicios)
+    if grupo is None:
+        resultados = ejecutar_sin_grupo(reinicio_temple, tareas)
+    else:
+        with grupo:
+            resultados = grupo.starmap(reinicio_temple, tareas)
+    return max(resultados, key=lambda resultado: resultado[1])
+
 # 🔹 Definimos la función de evaluación (Ejemplo: buscar el máximo de una parábola)
 def funcion_evaluacion(x):
     return -(x - 3) ** 2 + 10  # Función con máximo en x = 3
@@ -61,14 +203,43 @@ def funcion_evaluacion(x):
 def generar_vecinos(x):
     return x + random.uniform(-0.5, 0.5)  # Se mueve aleatoriamente en un pequeño rango
 
-# 🔹 Estado inicial aleatorio
-estado_inicial = random.uniform(-10, 10)
-
-# 🔹 Ejecutamos el algoritmo de Temple Simulado
-mejor_solucion, mejor_valor, temperatura_final, iteraciones_realizadas = temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial)
-
-# 🔹 Mostramos los resultados
-print(f"Mejor solución encontrada: x = {mejor_solucion}")
-print(f"Valor óptimo: f(x) = {mejor_valor}")
-print(f"Temperatura final: {temperatura_final}")
-print(f"Iteraciones realizadas: {iteraciones_realizadas}")
+# 🔹 Función con muchos máximos locales (Rastrigin en 2 dimensiones, máximo 0 en el origen)
+def funcion_rugosa(estado):
+    return -sum(10 + x * x - 10 * math.cos(2 * math.pi * x) for x in estado)
+
+def vecino_rugoso(estado):
+    return tuple(x + random.gauss(0, 0.3) for x in estado)
+
+def inicial_rugoso():
+    return tuple(random.uniform(-5, 5) for _ in range(2))
+
+# Los procesos trabajadores vuelven a importar este archivo en algunos sistemas,
+# así que la demostración solo se ejecuta en el proceso principal
+if __name__ == "__main__":
+    # 🔹 Estado inicial aleatorio
+    estado_inicial = random.uniform(-10, 10)
+
+    # 🔹 Ejecutamos el algoritmo de Temple Simulado
+    mejor_solucion, mejor_valor, temperatura_final, iteraciones_realizadas = temple_simulado(funcion_evaluacion, generar_vecinos, estado_inicial)
+
+    # 🔹 Mostramos los resultados
+    print(f"Mejor solución encontrada: x = {mejor_solucion}")
+    print(f"Valor óptimo: f(x) = {mejor_valor}")
+    print(f"Temperatura final: {temperatura_final}")
+    print(f"Iteraciones realizadas: {iteraciones_realizadas}")
+
+    # 🔹 Temple paralelo y reinicios en paralelo sobre la función rugosa
+    inicio_rugoso = (4.5, -4.5)
+    random.seed(0)
+    _, valor_simple, _, _ = temple_simulado(funcion_rugosa, vecino_rugoso, inicio_rugoso, temperatura_inicial=10,
+                                            enfriamiento=0.999, iteraciones=10_000)
+    print(f"\nFunción rugosa, un solo temple: {valor_simple:.4f}")
+    estado, valor, tasas = temple_paralelo(funcion_rugosa, vecino_rugoso, inicio_rugoso, replicas=8, rondas=100,
+                                           pasos_por_ronda=100, semilla=0)
+    print(f"Temple paralelo con 8 réplicas: {valor:.4f} en ({estado[0]:.3f}, {estado[1]:.3f}), "
+          f"tasas de intercambio {[round(tasa, 2) for tasa in tasas]}")
+    assert (estado, valor, tasas) == temple_paralelo(funcion_rugosa, vecino_rugoso, inicio_rugoso, replicas=8,
+                                                     rondas=100, pasos_por_ronda=100, semilla=0, procesos=1)
+    estado, valor, _, _ = temple_con_reinicios(funcion_rugosa, vecino_rugoso, inicial_rugoso, reinicios=8, semilla=0,
+                                              temperatura_inicial=10, enfriamiento=0.995, iteraciones=10_000)
+    print(f"Mejor de 8 reinicios: {valor:.4f} en ({estado[0]:.3f}, {estado[1]:.3f})")
@@ -1,4 +1,9 @@
+import bisect
+import itertools
 import random
+import time
+import numpy as np
+from genetico_vectorizado import GenomaBits, GenomaEntero, GenomaReal, algoritmo_genetico_vectorizado
 
 # 🔹 Definimos la función de aptitud (Ejemplo: Maximizar f(x) = x^2)
 def funcion_aptitud(x):
@@ -9,14 +14,13 @@ def crear_poblacion(tamano, rango_min, rango_max):
     return [random.randint(rango_min, rango_max) for _ in range(tamano)]
 
 # 🔹 Selección de padres (Ruleta)
-def seleccion_ruleta(poblacion):
-    total_aptitud = sum(funcion_aptitud(ind) for ind in poblacion)
-    seleccion = random.uniform(0, total_aptitud)
-    acumulado = 0
-    for ind in poblacion:
-        acumulado += funcion_aptitud(ind)
-        if acumulado >= seleccion:
-            return ind
+# 'acumulados' son las aptitudes acumuladas de la población; se calculan una vez por
+# generación para no evaluar toda la población en cada selección
+def seleccion_ruleta(poblacion, acumulados=None):
+    if acumulados is None:
+        acumulados = list(itertools.accumulate(funcion_aptitud(ind) for ind in poblacion))
+    seleccion = random.uniform(0, acumulados[-1])
+    return poblacion[min(bisect.bisect_left(acumulados, seleccion), len(poblacion) - 1)]  # Búsqueda binaria
 
 # 🔹 Cruza de dos individuos (Promedio simple)
 def cruzar(padre1, padre2):
@@ -36,9 +40,10 @@ def algoritmo_genetico(tamano_poblacion=10, generaciones=20, rango_min=-10, rang
     
     for _ in range(generaciones):
         nueva_poblacion = []
+        acumulados = list(itertools.accumulate(funcion_aptitud(ind) for ind in poblacion))
         for _ in range(tamano_poblacion):
-            padre1 = seleccion_ruleta(poblacion)
-            padre2 = seleccion_ruleta(poblacion)
+            padre1 = seleccion_ruleta(poblacion, acumulados)
+            padre2 = seleccion_ruleta(poblacion, acumulados)
             hijo = cruzar(padre1, padre2)
             hijo = mutar(hijo, rango_min=rango_min, rango_max=rango_max)  # Aplicamos mutación
             nueva_poblacion.append(hijo)
@@ -54,3 +59,40 @@ mejor_x, mejor_y = algoritmo_genetico()
 # 🔹 Mostramos el resultado
 print(f"Mejor solución encontrada: x = {mejor_x}")
 print(f"Valor óptimo: f(x) = {mejor_y}")
+
+# 🔹 El mismo problema con el motor vectorizado: la población es un arreglo de NumPy
+# y funcion_aptitud se evalúa sobre toda la población de una vez.
+# Para aptitudes costosas, genetico_islas.py reparte el trabajo entre procesos
+# (modelo de islas o solo la evaluación de la aptitud)
+mejor, aptitud, _ = algoritmo_genetico_vectorizado(lambda poblacion: funcion_aptitud(poblacion[:, 0]),
+                                                   GenomaEntero(1, -10, 10), tamano_poblacion=10,
+                                                   generaciones=20, semilla=0)
+print(f"\nMotor vectorizado: x = {mejor[0]}, f(x) = {aptitud}")
+
+# 🔹 Genoma real: minimizar la función de Rastrigin en 10 dimensiones (mínimo 0 en el origen)
+def rastrigin(poblacion):
+    return 10 * poblacion.shape[1] + (poblacion ** 2 - 10 * np.cos(2 * np.pi * poblacion)).sum(axis=1)
+
+inicio = time.perf_counter()
+mejor, aptitud, historial = algoritmo_genetico_vectorizado(lambda poblacion: -rastrigin(poblacion),
+                                                           GenomaReal(10, -5.12, 5.12), tamano_poblacion=100_000,
+                                                           generaciones=50, elite=10, semilla=0)
+print(f"Rastrigin con 100 000 individuos y 50 generaciones: {time.perf_counter() - inicio:.1f} s, "
+      f"mejor valor {-aptitud:.4f} (generación 0: {-historial[0]:.2f})")
+
+# 🔹 Genoma de bits: problema de la mochila con 100 objetos (se penaliza el exceso de peso)
+generador = np.random.default_rng(1)
+# En float64 el producto matricial usa BLAS (con enteros NumPy lo hace mucho más lento)
+pesos_objetos = generador.integers(1, 50, 100).astype(np.float64)
+valores_objetos = generador.integers(1, 100, 100).astype(np.float64)
+capacidad = pesos_objetos.sum() // 3
+
+def aptitud_mochila(poblacion):
+    peso = poblacion @ pesos_objetos
+    return poblacion @ valores_objetos - 10 * np.maximum(0, peso - capacidad)
+
+inicio = time.perf_counter()
+mejor, aptitud, _ = algoritmo_genetico_vectorizado(aptitud_mochila, GenomaBits(100), tamano_poblacion=100_000,
+                                                   generaciones=50, seleccion='sus', elite=10, semilla=0)
+print(f"Mochila con 100 000 individuos y 50 generaciones (SUS): {time.perf_counter() - inicio:.1f} s, "
+      f"valor {aptitud:.0f} con peso {mejor @ pesos_objetos:.0f} de {capacidad:.0f}")
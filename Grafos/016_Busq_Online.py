@@ -1,4 +1,9 @@
+import heapq
+import itertools
+import os
+import pickle
 import random
+import tempfile
 
 def busqueda_online(grafo, inicio, meta):
     """
@@ -34,6 +39,151 @@ def busqueda_online(grafo, inicio, meta):
     camino.append(meta)  # Se agrega el nodo meta al camino
     return camino, "Camino encontrado"
 
+def vecinos_con_costo(grafo, nodo):
+    """Vecinos con el costo de cada arista: dict de dicts {vecino: costo} o listas (costo 1)."""
+    vecinos = grafo.get(nodo, [])
+    return list(vecinos.items()) if isinstance(vecinos, dict) else [(vecino, 1) for vecino in vecinos]
+
+class TablaHeuristica:
+    """
+    Tabla de heurísticas aprendidas h(s) para la búsqueda en tiempo real.
+    Los estados que nunca se han actualizado usan la heurística inicial
+    (diccionario, función o 0). La tabla se guarda en disco con pickle para que
+    los ensayos siguientes sobre el mismo entorno partan de lo ya aprendido.
+    """
+    def __init__(self, inicial=None):
+        if inicial is None:
+            self.inicial = lambda estado: 0
+        elif callable(inicial):
+            self.inicial = inicial
+        else:
+            self.inicial = lambda estado: inicial.get(estado, 0)
+        self.aprendida = {}  # Estado -> h(s) actualizada
+
+    def __getitem__(self, estado):
+        if estado in self.aprendida:
+            return self.aprendida[estado]
+        return self.inicial(estado)
+
+    def __setitem__(self, estado, valor):
+        self.aprendida[estado] = valor
+
+    def guardar(self, ruta):
+        """Guarda solo los valores aprendidos (escritura atómica: archivo temporal y reemplazo)."""
+        temporal = ruta + '.tmp'
+        with open(temporal, 'wb') as archivo:
+            pickle.dump(self.aprendida, archivo)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta, inicial=None):
+        """Carga una tabla guardada; si el archivo no existe, empieza con la heurística inicial."""
+        tabla = cls(inicial)
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as archivo:
+                tabla.aprendida = pickle.load(archivo)
+        return tabla
+
+def lrta_estrella(grafo, inicio, meta, tabla, max_pasos=10_000, generador=random):
+    """
+    LRTA* (Learning Real-Time A*): en cada paso mira solo a los vecinos del estado actual,
+    actualiza h(s) = max(h(s), min(c(s, s') + h(s'))) y se mueve al vecino más prometedor
+    (los empates se rompen al azar). Un callejón sin salida recibe h = inf, así que los
+    ensayos siguientes lo evitan.
+
+    Retorna (camino, costo) o (None, inf) si no llega a la meta en max_pasos.
+    """
+    actual = inicio
+    camino = [actual]
+    costo = 0
+    for _ in range(max_pasos):
+        if actual == meta:
+            return camino, costo
+        opciones = [(c + tabla[vecino], c, vecino) for vecino, c in vecinos_con_costo(grafo, actual)]
+        mejor = min((f for f, _, _ in opciones), default=float('inf'))
+        tabla[actual] = max(tabla[actual], mejor)  # Aprendizaje
+        if mejor == float('inf'):  # Sin salida: se abandona el ensayo
+            return None, float('inf')
+        _, c, actual = generador.choice([opcion for opcion in opciones if opcion[0] == mejor])
+        camino.append(actual)
+        costo += c
+    return None, float('inf')
+
+def rtaa_estrella(grafo, inicio, meta, tabla, anticipacion=5, max_pasos=10_000):
+    """
+    RTAA* (Real-Time Adaptive A*): desde el estado actual hace una búsqueda A*
+    limitada a 'anticipacion' expansiones, actualiza h(x) = f* - g(x) para todos los
+    estados expandidos (f* es el menor f de la frontera) y avanza por el camino
+    hasta el mejor estado de la frontera. Con anticipacion=1 se comporta como LRTA*.
+
+    Retorna (camino, costo) o (None, inf).
+    """
+    if anticipacion < 1:  # Sin expansiones el agente nunca se movería
+        raise ValueError("La anticipación debe ser de al menos 1 estado.")
+    actual = inicio
+    camino = [actual]
+    costo = 0
+    pasos = 0
+    while actual != meta:
+        if pasos >= max_pasos:
+            return None, float('inf')
+        # Búsqueda A* local con punteros a padres
+        g = {actual: 0}
+        padres = {actual: None}
+        contador = itertools.count(1)  # Desempate sin comparar estados
+        frontera = [(tabla[actual], 0, 0, actual)]
+        cerrados = []
+        while frontera:
+            _, g_estado, _, estado = frontera[0]
+            if g_estado > g[estado]:  # Entrada vieja de un estado que ya mejoró
+                heapq.heappop(frontera)
+                continue
+            if estado == meta or len(cerrados) >= anticipacion:
+                break  # frontera[0] es el mejor estado de la frontera
+            heapq.heappop(frontera)
+            cerrados.append(estado)
+            for vecino, c in vecinos_con_costo(grafo, estado):
+                if g_estado + c < g.get(vecino, float('inf')):
+                    g[vecino] = g_estado + c
+                    padres[vecino] = estado
+                    heapq.heappush(frontera, (g[vecino] + tabla[vecino], g[vecino], next(contador), vecino))
+
+        if not frontera or frontera[0][0] == float('inf'):  # La meta no es alcanzable
+            for estado in cerrados:
+                tabla[estado] = float('inf')
+            return None, float('inf')
+        f_estrella, _, _, destino = frontera[0]
+
+        # Aprendizaje: h(x) = f* - g(x) para cada estado expandido
+        for estado in cerrados:
+            tabla[estado] = max(tabla[estado], f_estrella - g[estado])
+
+        # Se ejecuta el camino hasta el mejor estado de la frontera
+        tramo = []
+        estado = destino
+        while estado != actual:
+            tramo.append(estado)
+            estado = padres[estado]
+        camino.extend(reversed(tramo))
+        costo += g[destino]
+        pasos += len(tramo)
+        actual = destino
+    return camino, costo
+
+def ejecutar_ensayos(grafo, inicio, meta, tabla, ensayos=20, algoritmo=lrta_estrella, ruta=None, **opciones):
+    """
+    Repite la búsqueda en tiempo real sobre el mismo entorno conservando la tabla
+    aprendida. Si se indica 'ruta', la tabla se guarda después de cada ensayo.
+    Retorna la lista de costos por ensayo (inf si el ensayo no llegó a la meta).
+    """
+    costos = []
+    for _ in range(ensayos):
+        _, costo = algoritmo(grafo, inicio, meta, tabla, **opciones)
+        costos.append(costo)
+        if ruta is not None:
+            tabla.guardar(ruta)
+    return costos
+
 # Definimos un grafo de ejemplo
 grafo = {
     'A': ['B', 'C'],
@@ -53,3 +203,39 @@ if resultado:
     print("Camino encontrado:", " -> ".join(resultado))
 else:
     print("Camino encontrado: Ninguno")
+
+# Entorno en cuadrícula de 12 x 12 con un muro en forma de U que engaña a la distancia Manhattan
+lado = 12
+muro = {(i, 8) for i in range(2, 10)} | {(2, j) for j in range(3, 9)} | {(9, j) for j in range(3, 9)}
+cuadricula = {}
+for i in range(lado):
+    for j in range(lado):
+        if (i, j) in muro:
+            continue
+        cuadricula[(i, j)] = [(i + di, j + dj) for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                              if 0 <= i + di < lado and 0 <= j + dj < lado and (i + di, j + dj) not in muro]
+inicio_cuadricula, meta_cuadricula = (5, 4), (5, 11)
+manhattan = lambda estado: abs(estado[0] - meta_cuadricula[0]) + abs(estado[1] - meta_cuadricula[1])
+
+# La tabla aprendida se guarda en disco después de cada ensayo
+ruta = os.path.join(tempfile.gettempdir(), 'tabla_lrta.pkl')
+if os.path.exists(ruta):
+    os.remove(ruta)
+random.seed(0)
+print("\nLRTA* en la cuadrícula:")
+tabla = TablaHeuristica.cargar(ruta, manhattan)
+costos = ejecutar_ensayos(cuadricula, inicio_cuadricula, meta_cuadricula, tabla, ensayos=10, ruta=ruta)
+print("  Costos por ensayo:", costos)
+
+# Una nueva ejecución carga la tabla del disco y continúa desde lo aprendido
+print("LRTA* con la tabla cargada del disco:")
+tabla = TablaHeuristica.cargar(ruta, manhattan)
+nuevos_costos = ejecutar_ensayos(cuadricula, inicio_cuadricula, meta_cuadricula, tabla, ensayos=5, ruta=ruta)
+print("  Costos por ensayo:", nuevos_costos)
+costos += nuevos_costos
+print(f"Costo del primer ensayo: {costos[0]}, del último: {costos[-1]}")
+
+print("RTAA* con anticipación de 10 estados y una tabla nueva:")
+print("  Costos por ensayo:", ejecutar_ensayos(cuadricula, inicio_cuadricula, meta_cuadricula,
+                                               TablaHeuristica(manhattan), ensayos=8,
+                                               algoritmo=rtaa_estrella, anticipacion=10))
@@ -52,3 +52,17 @@ if solucion:
         print(f"Región {region} -> Color {color}")
 else:
     print("No se encontró solución")
+
+# El mismo problema con el motor de motor_csp.py: dominios como conjuntos de bits,
+# MRV con desempate por grado, valor menos restrictivo y rastro para deshacer
+from motor_csp import CSP, grafo_coloreable, resolver
+
+csp = CSP.diferentes(mapa, {region: colores for region in mapa}, mapa)
+solucion, nodos = resolver(csp)
+print(f"\nCon el motor CSP ({nodos} nodos):", solucion)
+
+# Un mapa grande: 3000 regiones y 6000 fronteras con 4 colores
+mapa_grande = grafo_coloreable(3000, 6000, 4)
+solucion, nodos = resolver(CSP.diferentes(mapa_grande, {region: colores + ['Amarillo'] for region in mapa_grande},
+                                          mapa_grande))
+print(f"Mapa de 3000 regiones: {'coloreado' if solucion else 'sin solución'} con {nodos} nodos")
@@ -1,3 +1,9 @@
+import os
+import time
+from itertools import islice
+from multiprocessing import Pool
+import numpy as np
+
 def es_valido(tablero, fila, columna, n):
     """
     Verifica si es seguro colocar una reina en la posición (fila, columna) del tablero.
@@ -20,9 +26,10 @@ def es_valido(tablero, fila, columna, n):
     return True
 
 
-def resolver_n_reinas(tablero, fila, n):
+def resolver_n_reinas(tablero, fila, n, soluciones):
     """
     Algoritmo de vuelta atrás (Backtracking) para resolver el problema de las N reinas.
+    Las soluciones se agregan a la lista 'soluciones'.
     """
     if fila == n:
         soluciones.append(tablero[:])  # Guardamos una copia de la solución encontrada
@@ -31,10 +38,118 @@ def resolver_n_reinas(tablero, fila, n):
     for columna in range(n):
         if es_valido(tablero, fila, columna, n):
             tablero[fila] = columna  # Colocamos la reina
-            resolver_n_reinas(tablero, fila + 1, n)  # Llamada recursiva para la siguiente fila
+            resolver_n_reinas(tablero, fila + 1, n, soluciones)  # Llamada recursiva para la siguiente fila
             tablero[fila] = -1  # Retrocedemos (backtracking)
 
 
+# Versión con máscaras de bits: la columna c es el bit 1 << c y cada fila se
+# describe con tres máscaras de casillas atacadas:
+# - columnas: columnas ya ocupadas
+# - izquierda: diagonales que bajan hacia la izquierda (se desplazan << 1 en cada fila)
+# - derecha: diagonales que bajan hacia la derecha (se desplazan >> 1 en cada fila)
+# Las casillas libres de la fila son ~(columnas | izquierda | derecha), sin recorrer el tablero.
+
+BLOQUE_REINAS = 1 << 16  # Estados que se expanden juntos en el conteo vectorizado
+
+def soluciones_reinas(n):
+    """
+    Generador de todas las soluciones (tuplas con la columna de cada fila), una a una
+    y solo cuando se piden: no se guarda ninguna lista de soluciones.
+    """
+    todas = (1 << n) - 1
+    tablero = [0] * n
+
+    def colocar(fila, columnas, izquierda, derecha):
+        if fila == n:
+            yield tuple(tablero)
+            return
+        libres = todas & ~(columnas | izquierda | derecha)
+        while libres:
+            bit = libres & -libres  # Bit libre más bajo
+            libres ^= bit
+            tablero[fila] = bit.bit_length() - 1
+            yield from colocar(fila + 1, columnas | bit, ((izquierda | bit) << 1) & todas, (derecha | bit) >> 1)
+
+    return colocar(0, 0, 0, 0)
+
+
+def contar_subarbol(n, fila, columnas, izquierda, derecha):
+    """
+    Cuenta las soluciones que completan los tableros parciales dados (arreglos de
+    máscaras, todos en la misma fila). Se avanza fila por fila con NumPy sobre todos
+    los estados a la vez: en cada vuelta se separa el bit libre más bajo de cada
+    estado, así que el trabajo es proporcional al número de hijos. Si una fila tiene
+    demasiados estados, se sigue por bloques para acotar la memoria.
+    """
+    todas = np.uint32((1 << n) - 1)
+    libres = ~(columnas | izquierda | derecha) & todas
+    if fila == n - 1:
+        return int(np.count_nonzero(libres))
+
+    hijos_columnas, hijos_izquierda, hijos_derecha = [], [], []
+    while len(libres):
+        activos = np.flatnonzero(libres)
+        if len(activos) < len(libres):  # Se descartan los estados sin más casillas libres
+            libres, columnas, izquierda, derecha = libres[activos], columnas[activos], izquierda[activos], derecha[activos]
+        bit = libres & -libres
+        hijos_columnas.append(columnas | bit)
+        hijos_izquierda.append(((izquierda | bit) << 1) & todas)
+        hijos_derecha.append((derecha | bit) >> 1)
+        libres = libres ^ bit
+    if not hijos_columnas:
+        return 0
+
+    columnas, izquierda, derecha = (np.concatenate(hijos_columnas), np.concatenate(hijos_izquierda),
+                                    np.concatenate(hijos_derecha))
+    return sum(contar_subarbol(n, fila + 1, columnas[i:i + BLOQUE_REINAS], izquierda[i:i + BLOQUE_REINAS],
+                               derecha[i:i + BLOQUE_REINAS])
+               for i in range(0, len(columnas), BLOQUE_REINAS))
+
+
+def tareas_reinas(n):
+    """
+    Reparte el árbol según las reinas de las dos primeras filas, usando la simetría
+    de espejo (columna c <-> n - 1 - c): en la primera fila solo se prueba la mitad
+    izquierda y cada solución cuenta doble. Si n es impar y la reina va en la
+    columna del medio, la de la segunda fila se limita a la mitad izquierda.
+    Retorna tuplas (columnas, izquierda, derecha, multiplicador) en la fila 2.
+    """
+    todas = (1 << n) - 1
+    tareas = []
+    for primera in range((n + 1) // 2):
+        bit = 1 << primera
+        libres = todas & ~(bit | (bit << 1) | (bit >> 1))
+        if n % 2 and primera == n // 2:
+            libres &= (1 << (n // 2)) - 1  # Mitad izquierda: la otra mitad es su reflejo
+        while libres:
+            segunda = libres & -libres
+            libres ^= segunda
+            tareas.append((bit | segunda, (((bit << 1) | segunda) << 1) & todas, ((bit >> 1) | segunda) >> 1, 2))
+    return tareas
+
+
+def contar_tarea(n, columnas, izquierda, derecha, multiplicador):
+    mascaras = [np.array([mascara], dtype=np.uint32) for mascara in (columnas, izquierda, derecha)]
+    return multiplicador * contar_subarbol(n, 2, *mascaras)
+
+
+def contar_soluciones_reinas(n, procesos=None):
+    """
+    Número de soluciones de las N reinas (n <= 31), sin construir ninguna.
+    Las tareas de las dos primeras filas se reparten entre un grupo de procesos
+    (procesos: None = uno por núcleo, 1 = sin procesos extra).
+    """
+    if n < 4:  # Tableros demasiado chicos para repartir dos filas
+        return sum(1 for _ in soluciones_reinas(n))
+    tareas = [(n, *tarea) for tarea in tareas_reinas(n)]
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        return sum(contar_tarea(*tarea) for tarea in tareas)
+    with Pool(procesos) as grupo:
+        # Las tareas tienen tamaños muy distintos: se envían de a una para repartir mejor la carga
+        return sum(grupo.starmap(contar_tarea, tareas, chunksize=1))
+
+
 def imprimir_soluciones(soluciones, n):
     """
     Muestra todas las soluciones del problema de las N reinas en formato de tablero.
@@ -50,13 +165,23 @@ def imprimir_soluciones(soluciones, n):
 def main():
     # Número de reinas
     n = 5  # Puedes cambiar el valor para resolver con más reinas
-    global soluciones
     soluciones = []  # Lista para almacenar las soluciones
-    resolver_n_reinas([-1] * n, 0, n)
+    resolver_n_reinas([-1] * n, 0, n, soluciones)
 
     # Imprimir las soluciones encontradas
     imprimir_soluciones(soluciones, n)
 
+    # Conteo con máscaras de bits, simetría y procesos (sin guardar las soluciones)
+    for n in (8, 12, 14):
+        inicio = time.perf_counter()
+        total = contar_soluciones_reinas(n)
+        print(f"{n} reinas: {total} soluciones, contadas en {time.perf_counter() - inicio:.2f} s")
+
+    # El generador da tableros bajo demanda, incluso si hay millones de soluciones
+    print("Primeras 3 soluciones de 20 reinas:")
+    for solucion in islice(soluciones_reinas(20), 3):
+        print(solucion)
+
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,6 @@
+import random
+import time
+
 def forward_checking(variables, domains, constraints, assignment):
     """
     Implementación del algoritmo de verificación hacia adelante (forward checking).
@@ -70,6 +73,101 @@ def forward_check_domains(variable, value, domains, constraints, assignment):
     return new_domains
 
 
+def forward_checking_trail(variables, domains, neighbors, compatible):
+    """
+    Verificación hacia adelante sin copiar asignaciones ni dominios.
+
+    Parámetros:
+    - variables: Lista de variables del problema (se asignan en este orden).
+    - domains: Diccionario variable -> dominio (no se modifica).
+    - neighbors: Diccionario variable -> variables con las que tiene una restricción.
+    - compatible: Función compatible(x, vx, y, vy) -> True si x = vx y y = vy cumplen
+      la restricción entre x y y.
+
+    Al asignar una variable solo se podan sus vecinos sin asignar, comprobando cada
+    par con 'compatible' a través del índice 'neighbors' (nunca la asignación completa).
+    Cada valor eliminado se anota en el rastro (trail) con su posición, y al retroceder
+    se reinsertan en orden inverso, así que los dominios quedan exactamente como estaban.
+
+    Retorna:
+    - (solución, nodos): la asignación completa o None, y el número de asignaciones probadas.
+    """
+    current = {var: list(domains[var]) for var in variables}  # Única copia de los dominios
+    assignment = {}
+    trail = []  # (variable, posición, valor) de cada valor eliminado
+    nodes = 0
+
+    def prune(variable, value):
+        """Elimina de los vecinos sin asignar los valores incompatibles; False si alguno queda vacío."""
+        for other in neighbors.get(variable, ()):
+            if other in assignment:
+                continue
+            domain = current[other]
+            for position in range(len(domain) - 1, -1, -1):  # De atrás hacia delante para borrar en el sitio
+                if not compatible(variable, value, other, domain[position]):
+                    trail.append((other, position, domain[position]))
+                    del domain[position]
+            if not domain:
+                return False
+        return True
+
+    def undo(mark):
+        while len(trail) > mark:
+            other, position, value = trail.pop()
+            current[other].insert(position, value)
+
+    def search(index):
+        nonlocal nodes
+        if index == len(variables):
+            return dict(assignment)
+        variable = variables[index]
+        for value in current[variable]:  # Su dominio no cambia mientras está asignada
+            nodes += 1
+            mark = len(trail)
+            assignment[variable] = value
+            if prune(variable, value):
+                result = search(index + 1)
+                if result is not None:
+                    return result
+            undo(mark)
+            del assignment[variable]
+        return None
+
+    return search(0), nodes
+
+
+def random_csp(variables, domain_size, density, tightness, seed=0):
+    """
+    CSP binario aleatorio (modelo B): cada par de variables tiene restricción con
+    probabilidad 'density' y cada restricción prohíbe una fracción 'tightness' de
+    los pares de valores. Retorna (variables, dominios, vecinos, compatible, constraints),
+    con 'constraints' en el formato de forward_checking (asignación completa).
+    """
+    generator = random.Random(seed)
+    names = list(range(variables))
+    domains = {var: list(range(domain_size)) for var in names}
+    neighbors = {var: [] for var in names}
+    forbidden = {}
+    pairs = [(a, b) for a in range(domain_size) for b in range(domain_size)]
+    for x in names:
+        for y in names[x + 1:]:
+            if generator.random() < density:
+                prohibited = set(generator.sample(pairs, round(tightness * len(pairs))))
+                forbidden[(x, y)] = prohibited
+                forbidden[(y, x)] = {(b, a) for a, b in prohibited}
+                neighbors[x].append(y)
+                neighbors[y].append(x)
+
+    def compatible(x, vx, y, vy):
+        return (vx, vy) not in forbidden.get((x, y), ())
+
+    def constraints(assignment):
+        items = list(assignment.items())
+        return all(compatible(x, vx, y, vy) for k, (x, vx) in enumerate(items) for y, vy in items[k + 1:])
+
+    return names, domains, neighbors, compatible, constraints
+
+
 # Ejemplo de uso: Problema de coloreado de grafos
 if __name__ == "__main__":
     # Variables del problema: Nodos del grafo
@@ -107,4 +205,24 @@ if __name__ == "__main__":
     solution = forward_checking(variables, domains, constraints, {})
 
     # Imprimimos la solución encontrada
-    print("Solución:", solution)
\ No newline at end of file
+    print("Solución:", solution)
+
+    # Con rastro y comprobaciones por pares
+    solution, nodes = forward_checking_trail(variables, domains, neighbors,
+                                             lambda x, vx, y, vy: vx != vy)
+    print(f"Solución con rastro ({nodes} nodos):", solution)
+
+    # Comparación en CSPs aleatorios. Las dos versiones recorren el mismo árbol (mismo
+    # orden de variables y valores, mismas podas), así que se compara el costo por nodo
+    print("\nCSPs aleatorios (n variables, dominio 6, densidad 0.3, estrechez 0.3):")
+    for n in (10, 15, 20):
+        names, domains, neighbors, compatible, constraints = random_csp(n, 6, 0.3, 0.3, seed=n)
+        start = time.perf_counter()
+        solution, nodes = forward_checking_trail(names, domains, neighbors, compatible)
+        trail_time = time.perf_counter() - start
+        start = time.perf_counter()
+        original = forward_checking(names, domains, constraints, {})
+        original_time = time.perf_counter() - start
+        assert original == solution
+        print(f"  n={n}: {nodes} nodos, original {1e6 * original_time / nodes:.0f} us/nodo, "
+              f"con rastro {1e6 * trail_time / nodes:.0f} us/nodo ({original_time / trail_time:.0f}x)")
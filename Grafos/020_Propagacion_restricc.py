@@ -1,4 +1,6 @@
 from collections import deque
+import time
+import numpy as np
 
 def ac3(variables, dominios, restricciones):
     """
@@ -38,6 +40,85 @@ def revisar_arco(xi, xj, dominios):
     return False
 
 
+def ac2001(variables, dominios, restricciones, relaciones=None):
+    """
+    Consistencia de arcos AC-2001 (AC-3.1) con relaciones binarias arbitrarias.
+    - restricciones: diccionario variable -> vecinos (como en ac3)
+    - relaciones: diccionario {(xi, xj): relación}, donde la relación es una función
+      relacion(valor_xi, valor_xj) -> bool o una matriz booleana (por ejemplo de NumPy)
+      indexada por la posición de los valores en los dominios iniciales. Basta con dar
+      un sentido: el otro se obtiene transponiendo. Los pares sin relación usan la
+      desigualdad, como ac3.
+
+    Para cada valor a de xi y cada vecino xj se guarda su último soporte (el último
+    valor de xj compatible con a). Al revisar el arco, si ese soporte sigue en el
+    dominio no se busca nada, y si se eliminó la búsqueda sigue desde ahí, sin volver
+    a empezar; así cada par de valores se compara a lo más una vez por arco (O(ed^2)).
+    La cola guarda variables (las que perdieron valores) en lugar de arcos.
+    Los dominios se reducen en el sitio; retorna False si alguno queda vacío.
+    """
+    relaciones = relaciones or {}
+    valores = {x: list(dominios[x]) for x in variables}
+    presentes = {x: bytearray([1]) * len(valores[x]) for x in variables}  # Presencia por posición inicial
+
+    def comparador(xi, xj):
+        """Función (a, b) -> compatibles, con a y b posiciones en los dominios iniciales."""
+        vi, vj = valores[xi], valores[xj]
+        if (xi, xj) in relaciones:
+            relacion, transpuesta = relaciones[(xi, xj)], False
+        elif (xj, xi) in relaciones:
+            relacion, transpuesta = relaciones[(xj, xi)], True
+        else:
+            return lambda a, b: vi[a] != vj[b]
+        if callable(relacion):
+            if transpuesta:
+                return lambda a, b: relacion(vj[b], vi[a])
+            return lambda a, b: relacion(vi[a], vj[b])
+        filas = (np.asarray(relacion, dtype=bool).T if transpuesta else np.asarray(relacion, dtype=bool)).tolist()
+        return lambda a, b: filas[a][b]
+
+    # Arcos (xi, xj): comparador y último soporte de cada valor de xi (-1 = sin buscar)
+    arcos = {x: [] for x in variables}  # xj -> arcos (xi, xj) que hay que revisar si xj pierde valores
+    for xi in variables:
+        for xj in restricciones.get(xi, []):
+            arcos[xj].append((xi, comparador(xi, xj), [-1] * len(valores[xi])))
+
+    cola = deque(variables)
+    en_cola = set(variables)
+    while cola:
+        xj = cola.popleft()
+        en_cola.discard(xj)
+        presente_j, tamano_j = presentes[xj], len(valores[xj])
+        for xi, compatibles, ultimos in arcos[xj]:
+            presente_i = presentes[xi]
+            cambio = False
+            for a in range(len(presente_i)):
+                if not presente_i[a]:
+                    continue
+                b = ultimos[a]
+                if b >= 0 and presente_j[b]:
+                    continue  # El último soporte sigue vigente
+                b += 1
+                while b < tamano_j and not (presente_j[b] and compatibles(a, b)):
+                    b += 1
+                if b < tamano_j:
+                    ultimos[a] = b
+                else:  # a ya no tiene soporte en xj
+                    presente_i[a] = 0
+                    cambio = True
+            if cambio:
+                if not any(presente_i):
+                    dominios[xi] = []
+                    return False
+                if xi not in en_cola:
+                    cola.append(xi)
+                    en_cola.add(xi)
+
+    for x in variables:
+        dominios[x] = [valor for valor, presente in zip(valores[x], presentes[x]) if presente]
+    return True
+
+
 # Definimos el problema de coloreo de mapas con 4 regiones y 3 colores
 variables = ['A', 'B', 'C', 'D']
 dominios = {
@@ -58,3 +139,49 @@ if ac3(variables, dominios, restricciones):
     print("Dominios reducidos tras AC-3:", dominios)
 else:
     print("No hay solución posible después de AC-3.")
+
+# El mismo problema con AC-2001
+dominios = {'A': ['rojo', 'azul'], 'B': ['rojo'], 'C': ['rojo', 'azul', 'verde'], 'D': ['rojo', 'azul', 'verde']}
+if ac2001(variables, dominios, restricciones):
+    print("Dominios reducidos tras AC-2001:", dominios)
+
+# Sudoku: 81 casillas, cada una distinta de las de su fila, columna y caja
+pistas = ("530070000600195000098000060800060003400803001700020006060000280000419005000080079")
+casillas = [(f, c) for f in range(9) for c in range(9)]
+vecinos_sudoku = {(f, c): [(g, d) for g, d in casillas if (g, d) != (f, c) and
+                           (g == f or d == c or (g // 3, d // 3) == (f // 3, c // 3))] for f, c in casillas}
+
+def dominios_sudoku():
+    return {(f, c): [int(pistas[9 * f + c])] if pistas[9 * f + c] != '0' else list(range(1, 10))
+            for f, c in casillas}
+
+for nombre, algoritmo in (("AC-3", ac3), ("AC-2001", ac2001)):
+    dominios = dominios_sudoku()
+    inicio = time.perf_counter()
+    algoritmo(casillas, dominios, vecinos_sudoku)
+    resueltas = sum(len(dominio) == 1 for dominio in dominios.values())
+    print(f"Sudoku con {nombre}: {resueltas} de 81 casillas fijas en {1000 * (time.perf_counter() - inicio):.1f} ms")
+
+# Calendarización: 40 tareas con inicio entre 0 y 99, precedencias como matrices de NumPy
+# (inicio_i + duracion_i <= inicio_j) y tareas que comparten máquina sin solaparse (funciones)
+generador = np.random.default_rng(0)
+tareas = list(range(40))
+duraciones = generador.integers(1, 6, len(tareas))
+horizonte = np.arange(100)
+restricciones_tareas = {tarea: [] for tarea in tareas}
+relaciones = {}
+for j in tareas[1:]:
+    for i in generador.choice(j, size=min(j, 2), replace=False):  # Dos predecesoras por tarea
+        relaciones[(int(i), j)] = np.add.outer(horizonte + duraciones[i], -horizonte) <= 0
+        restricciones_tareas[int(i)].append(j)
+        restricciones_tareas[j].append(int(i))
+for i, j in [(0, 39), (5, 17), (8, 30), (12, 25)]:  # Misma máquina: una termina antes de que empiece la otra
+    if (i, j) not in relaciones:
+        relaciones[(i, j)] = lambda si, sj, di=duraciones[i], dj=duraciones[j]: si + di <= sj or sj + dj <= si
+        restricciones_tareas[i].append(j)
+        restricciones_tareas[j].append(i)
+dominios = {tarea: list(horizonte) for tarea in tareas}
+inicio = time.perf_counter()
+consistente = ac2001(tareas, dominios, restricciones_tareas, relaciones)
+print(f"Calendarización con AC-2001: consistente={consistente} en {1000 * (time.perf_counter() - inicio):.1f} ms, "
+      f"ventana de la última tarea: {min(dominios[39])}..{max(dominios[39])}")
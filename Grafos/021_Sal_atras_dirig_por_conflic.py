@@ -1,5 +1,7 @@
 # Definimos un problema de satisfacción de restricciones (CSP)
 # usando el algoritmo de Salto Atrás Dirigido por Conflictos (CBJ).
+import heapq
+from collections import OrderedDict
 
 # Diccionario que representa las regiones y sus vecinos
 mapa = {
@@ -13,7 +15,7 @@ mapa = {
 # Lista de colores disponibles
 colores = ['Rojo', 'Verde', 'Azul']
 
-def es_valida(region, color, asignacion):
+def es_valida(region, color, asignacion, mapa=mapa):
     """
     Verifica si asignar 'color' a 'region' es válido.
     No debe haber conflictos con los vecinos ya asignados.
@@ -23,39 +25,152 @@ def es_valida(region, color, asignacion):
             return False  # Hay conflicto si un vecino ya tiene el mismo color
     return True
 
-def salto_atras_conflicto(asignacion, orden, conflictos, indice):
+def orden_por_conexiones(mapa):
     """
-    Algoritmo de Salto Atrás Dirigido por Conflictos (CBJ).
+    Orden estático de las regiones: cada vez se elige la región con más vecinos ya
+    ordenados (empates por grado), así cada región se revisa pronto contra sus
+    vecinos y los conflictos apuntan a regiones cercanas en el orden.
     """
-    if indice == len(orden):  # Si todas las regiones tienen color, terminamos
-        return asignacion
-
-    region = orden[indice]  # Seleccionamos la región actual a colorear
-
-    for color in colores:
-        if es_valida(region, color, asignacion):
-            asignacion[region] = color  # Asignamos el color
-            conflictos[indice] = set()  # Limpiamos conflictos previos
-            resultado = salto_atras_conflicto(asignacion, orden, conflictos, indice + 1)
-            if resultado:
-                return resultado  # Si encontramos solución, la retornamos
-            asignacion.pop(region)  # Si no funcionó, eliminamos la asignación
-
-    # Si ningún color funciona, identificamos el conflicto
-    conflicto_salto = max(conflictos[indice], default=0)
-    conflictos[indice - 1].add(conflicto_salto)  # Guardamos el conflicto en la región anterior
-    return None if conflicto_salto == 0 else salto_atras_conflicto(asignacion, orden, conflictos, conflicto_salto)
-
-# Definimos el orden de las regiones a colorear
-orden_regiones = list(mapa.keys())
-
-# Ejecutamos el algoritmo CBJ
-solucion = salto_atras_conflicto({}, orden_regiones, [set() for _ in orden_regiones], 0)
-
-# Mostramos el resultado
-if solucion:
-    print("Coloreo válido encontrado:")
-    for region, color in solucion.items():
-        print(f"Región {region} -> Color {color}")
-else:
-    print("No se encontró solución")
+    conexiones = {region: 0 for region in mapa}
+    pendientes = [(0, -len(mapa[region]), k, region) for k, region in enumerate(mapa)]
+    heapq.heapify(pendientes)
+    orden, ordenadas = [], set()
+    while pendientes:
+        _, _, k, region = heapq.heappop(pendientes)
+        if region in ordenadas:
+            continue  # Entrada vieja del montículo
+        ordenadas.add(region)
+        orden.append(region)
+        for vecino in mapa[region]:
+            if vecino not in ordenadas:
+                conexiones[vecino] += 1
+                heapq.heappush(pendientes, (-conexiones[vecino], -len(mapa[vecino]), k, vecino))
+    return orden
+
+def salto_atras_conflicto(mapa, colores, orden=None, max_nogoods=0, max_nodos=None):
+    """
+    Algoritmo de Salto Atrás Dirigido por Conflictos (CBJ) con pila explícita.
+
+    - Las regiones se asignan en 'orden' (por defecto orden_por_conexiones) y cada
+      nivel del orden guarda su color actual y su conjunto de conflictos: las regiones
+      anteriores (por su posición en el orden) culpables de descartar sus colores.
+    - Un color que choca con vecinos anteriores agrega como culpable al primero de
+      ellos en el orden.
+    - Si una región se queda sin colores, se salta a la culpable más reciente h, se
+      le pasan los demás culpables (conflictos[h] |= conflictos[i] - {h}) y se
+      desasignan todas las regiones entre h e i. El salto es un ciclo, no una
+      llamada, así que la profundidad no depende del número de regiones.
+    - max_nogoods > 0: cada fallo se aprende como nogood (los colores actuales de sus
+      culpables no pueden repetirse juntos). Se guardan a lo más max_nogoods; al
+      llenarse se olvida el más viejo. Como el orden es fijo, un nogood solo se revisa
+      al probar el color de su región más profunda (las demás ya están asignadas); si
+      todas tienen sus colores del nogood, el color se rechaza y ellas son las culpables.
+    - max_nodos: corta la búsqueda después de ese número de colores probados.
+
+    Retorna (asignacion, nodos): la asignación región -> color (o None) y el número
+    de colores probados.
+    """
+    orden = orden_por_conexiones(mapa) if orden is None else list(orden)
+    n, d = len(orden), len(colores)
+    posicion = {region: i for i, region in enumerate(orden)}
+    # Vecinos anteriores de cada nivel, de menor a mayor posición
+    anteriores = [sorted(posicion[vecino] for vecino in mapa[region] if posicion[vecino] < i)
+                  for i, region in enumerate(orden)]
+
+    valor = [-1] * n          # Índice del color asignado en cada nivel (-1 = sin asignar)
+    siguiente = [0] * n       # Próximo color a probar en cada nivel
+    conflictos = [set() for _ in range(n)]
+    nogoods = OrderedDict()   # id -> tupla de (nivel, color)
+    por_literal = {}          # (nivel, color) de su región más profunda -> ids de los nogoods
+    aprendidos = 0
+
+    def culpables(i, c):
+        """Niveles culpables de que el color c no sirva en el nivel i (None si sirve)."""
+        for h in anteriores[i]:
+            if valor[h] == c:
+                return (h,)
+        for id_nogood in por_literal.get((i, c), ()):
+            otros = nogoods[id_nogood][:-1]
+            if all(valor[h] == color for h, color in otros):
+                return [h for h, _ in otros]
+        return None
+
+    def aprender(nogood):
+        nonlocal aprendidos
+        if len(nogoods) == max_nogoods:  # Se olvida el nogood más viejo
+            id_viejo, viejo = nogoods.popitem(last=False)
+            por_literal[viejo[-1]].discard(id_viejo)
+        nogoods[aprendidos] = nogood  # Ordenado por nivel: el último literal es el más profundo
+        por_literal.setdefault(nogood[-1], set()).add(aprendidos)
+        aprendidos += 1
+
+    nodos = 0
+    i = 0
+    while 0 <= i < n:
+        # Probamos los colores que le quedan a la región del nivel i
+        while siguiente[i] < d:
+            c = siguiente[i]
+            siguiente[i] += 1
+            if max_nodos is not None and nodos >= max_nodos:
+                return None, nodos
+            nodos += 1
+            culpa = culpables(i, c)
+            if culpa is None:
+                valor[i] = c
+                break
+            conflictos[i].update(culpa)
+
+        if valor[i] != -1:  # Avanzamos al siguiente nivel con sus conflictos limpios
+            i += 1
+            if i < n:
+                siguiente[i] = 0
+                conflictos[i].clear()
+            continue
+
+        # Ningún color funciona: saltamos a la culpable más reciente
+        if not conflictos[i]:
+            return None, nodos  # Fallo sin culpables: el problema no tiene solución
+        h = max(conflictos[i])
+        if max_nogoods > 0:
+            aprender(tuple((k, valor[k]) for k in sorted(conflictos[i])))
+        conflictos[h] |= conflictos[i]
+        conflictos[h].discard(h)
+        for k in range(h, i + 1):  # Se desasignan h y todas las regiones que saltamos
+            valor[k] = -1
+        i = h
+
+    if i < 0:
+        return None, nodos
+    return {orden[k]: colores[valor[k]] for k in range(n)}, nodos
+
+
+if __name__ == "__main__":
+    import time
+    from motor_csp import grafo_coloreable
+
+    # Ejecutamos el algoritmo CBJ sobre el mapa pequeño
+    solucion, nodos = salto_atras_conflicto(mapa, colores, orden=list(mapa.keys()))
+
+    # Mostramos el resultado
+    if solucion:
+        print("Coloreo válido encontrado:")
+        for region, color in solucion.items():
+            print(f"Región {region} -> Color {color}")
+    else:
+        print("No se encontró solución")
+
+    # Mapas grandes: 10^4 regiones, sin límite de recursión. En los más densos, sin
+    # nogoods la búsqueda se corta en max_nodos; con nogoods encuentra la solución
+    for aristas, numero_colores in ((20_000, 4), (18_000, 3), (30_000, 4)):
+        vecinos = grafo_coloreable(10_000, aristas, numero_colores, semilla=1)
+        paleta = list(range(numero_colores))
+        for max_nogoods in (0, 1000):
+            inicio = time.perf_counter()
+            solucion, nodos = salto_atras_conflicto(vecinos, paleta, max_nogoods=max_nogoods,
+                                                    max_nodos=2_000_000)
+            segundos = time.perf_counter() - inicio
+            valida = solucion is not None and all(es_valida(region, solucion[region],
+                                                            {v: solucion[v] for v in vecinos[region]}, vecinos)
+                                                  for region in vecinos)
+            print(f"10^4 regiones, {aristas} fronteras, {numero_colores} colores, max_nogoods={max_nogoods}: "
+                  f"{nodos} nodos en {segundos:.2f} s, solución válida: {valida}")
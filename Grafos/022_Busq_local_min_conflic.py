@@ -1,79 +1,268 @@
 import random
+import time
+import numpy as np
 
-def contar_conflictos(tablero, fila, columna):
+# Tablero de N reinas: tablero[fila] = columna de la reina de esa fila.
+# El tablero siempre es una permutación de 0..N-1 (las reinas solo intercambian
+# columnas), así que nunca hay dos reinas en la misma fila ni en la misma columna
+# y solo hay que contar las diagonales:
+# - suma[fila + columna]: reinas en cada diagonal
+# - resta[fila - columna + N - 1]: reinas en cada antidiagonal
+# Los contadores son arreglos de NumPy; en los ciclos de Python se leen y escriben
+# a través de memoryview, que es varias veces más rápido que indexar el arreglo.
+
+def colocacion_voraz(N, aleatorio, generador, libres=50, max_intentos=100):
     """
-    Cuenta cuántas reinas atacan a la posición dada en el tablero.
+    Colocación inicial voraz: fila por fila se prueba con columnas al azar de las que
+    quedan hasta encontrar una cuyas diagonales estén libres (o agotar max_intentos).
+    Las últimas 'libres' filas, donde casi no quedan columnas buenas, se dejan al azar.
+    Retorna (tablero, suma, resta) con los contadores ya llenos.
     """
-    conflictos = 0
-    N = len(tablero)
-
-    for i in range(N):
-        if i == fila:
-            continue  # No comparar con sí misma
-
-        # Verificar si hay otra reina en la misma columna
-        if tablero[i] == columna:
-            conflictos += 1
-        
-        # Verificar diagonales
-        if abs(i - fila) == abs(tablero[i] - columna):
-            conflictos += 1
-    
-    return conflictos
-
-def encontrar_menor_conflicto(tablero, fila):
+    tablero = generador.permutation(N)
+    suma = np.zeros(2 * N - 1, dtype=np.int32)
+    resta = np.zeros(2 * N - 1, dtype=np.int32)
+    t, s, r = memoryview(tablero), memoryview(suma), memoryview(resta)
+    desplazamiento = N - 1
+    azar = aleatorio.random
+
+    for fila in range(max(0, N - libres)):
+        restantes = N - fila
+        for _ in range(max_intentos):
+            j = fila + int(azar() * restantes)  # Una de las columnas que todavía no se usan
+            columna = t[j]
+            if not (s[fila + columna] or r[fila - columna + desplazamiento]):
+                break
+        t[j] = t[fila]
+        t[fila] = columna
+        s[fila + columna] += 1
+        r[fila - columna + desplazamiento] += 1
+
+    filas = np.arange(max(0, N - libres), N)
+    np.add.at(suma, filas + tablero[filas], 1)
+    np.add.at(resta, filas - tablero[filas] + desplazamiento, 1)
+    return tablero, suma, resta
+
+def filas_en_conflicto(tablero, suma, resta):
+    """Todas las filas cuya reina es atacada por otra (vectorizado, O(N))."""
+    filas = np.arange(len(tablero))
+    return np.flatnonzero((suma[filas + tablero] > 1) | (resta[filas - tablero + len(tablero) - 1] > 1))
+
+def verificar_reinas(tablero):
+    """True si ninguna reina ataca a otra (columnas distintas y diagonales sin repetir)."""
+    tablero = np.asarray(tablero)
+    filas = np.arange(len(tablero))
+    return all(len(np.unique(linea)) == len(tablero) for linea in (tablero, filas + tablero, filas - tablero))
+
+def minimos_conflictos(N, max_intentos=100_000, semilla=None, muestras=20):
     """
-    Encuentra la columna con el menor número de conflictos para la fila dada.
+    Algoritmo de búsqueda local por Mínimos-Conflictos para el problema de las N reinas.
+
+    Parte de una colocación voraz y repara las filas en conflicto: se elige una al
+    azar y se intercambia su columna con la de otra fila, buscando entre 'muestras'
+    filas al azar el intercambio que deja menos colisiones (el primero que las reduce
+    se acepta de inmediato). Consultar los conflictos de una reina y mover una reina
+    cuesta O(1) con los contadores de diagonales.
+    Las filas en conflicto se guardan en una lista con marcas; cuando se saca una se
+    comprueba si sigue en conflicto (puede haberse arreglado al mover otra reina).
+    - max_intentos: máximo de movimientos de reparación
+
+    Retorna el tablero (arreglo de NumPy) o None si no se encontró solución.
     """
-    N = len(tablero)
-    min_conflictos = float('inf')
-    mejores_columnas = []
-
-    for columna in range(N):
-        conflictos = contar_conflictos(tablero, fila, columna)
-        
-        if conflictos < min_conflictos:
-            min_conflictos = conflictos
-            mejores_columnas = [columna]
-        elif conflictos == min_conflictos:
-            mejores_columnas.append(columna)
-
-    return random.choice(mejores_columnas)  # Elegir una aleatoria si hay empate
-
-def minimos_conflictos(N, max_intentos=1000):
+    aleatorio = random.Random(semilla)
+    generador = np.random.default_rng(semilla)
+    tablero, suma, resta = colocacion_voraz(N, aleatorio, generador)
+    t, s, r = memoryview(tablero), memoryview(suma), memoryview(resta)
+    desplazamiento = N - 1
+    azar = aleatorio.random
+
+    def en_conflicto(fila):
+        columna = t[fila]
+        return s[fila + columna] > 1 or r[fila - columna + desplazamiento] > 1
+
+    def mover(fila, columna, cambio):
+        """Suma 'cambio' (+1 o -1) a las diagonales de (fila, columna); retorna cuánto cambian las colisiones."""
+        k1, k2 = fila + columna, fila - columna + desplazamiento
+        if cambio > 0:
+            colisiones = (s[k1] > 0) + (r[k2] > 0)
+        else:
+            colisiones = -(s[k1] > 1) - (r[k2] > 1)
+        s[k1] += cambio
+        r[k2] += cambio
+        return colisiones
+
+    def intercambiar(i, j):
+        """Intercambia las columnas de las filas i y j; retorna el cambio en colisiones."""
+        a, b = t[i], t[j]
+        cambio = mover(i, a, -1) + mover(j, b, -1) + mover(i, b, 1) + mover(j, a, 1)
+        t[i], t[j] = b, a
+        return cambio
+
+    pendientes = filas_en_conflicto(tablero, suma, resta).tolist()
+    marcadas = bytearray(N)  # 1 si la fila está en 'pendientes'
+    for fila in pendientes:
+        marcadas[fila] = 1
+
+    movimientos = 0
+    while pendientes:
+        # Se saca una fila al azar (intercambio con la última: O(1))
+        k = int(azar() * len(pendientes))
+        fila = pendientes[k]
+        pendientes[k] = pendientes[-1]
+        pendientes.pop()
+        marcadas[fila] = 0
+        if not en_conflicto(fila):
+            continue
+        if movimientos >= max_intentos:
+            return None
+        movimientos += 1
+
+        # Se prueba el intercambio con varias filas al azar y se deshacen los que no sirven
+        mejor_cambio, mejor_fila = None, None
+        for _ in range(muestras):
+            j = int(azar() * N)
+            if j == fila:
+                continue
+            cambio = intercambiar(fila, j)
+            if cambio < 0:  # Reduce las colisiones: se queda
+                mejor_cambio, mejor_fila = None, j
+                break
+            intercambiar(fila, j)
+            if mejor_cambio is None or cambio < mejor_cambio:
+                mejor_cambio, mejor_fila = cambio, j
+        if mejor_cambio is not None:  # Ninguno mejoró: se hace el menos malo para salir del mínimo local
+            intercambiar(fila, mejor_fila)
+
+        for f in (fila, mejor_fila):
+            if f is not None and not marcadas[f] and en_conflicto(f):
+                pendientes.append(f)
+                marcadas[f] = 1
+
+    return tablero
+
+class MinimosConflictosCSP:
     """
-    Algoritmo de búsqueda local por Mínimos-Conflictos para el problema de las N reinas.
+    Mínimos-Conflictos para un CSP binario cualquiera, con la misma idea de contadores
+    incrementales: conflictos[i][v] es cuántos vecinos de la variable i chocan con el
+    valor v (un arreglo de NumPy por variable). Consultar los conflictos del valor
+    actual cuesta O(1), elegir el mejor valor es un argmin sobre el dominio, y cambiar
+    una variable solo actualiza los contadores de sus vecinos, sumando una fila de la
+    matriz de incompatibilidad de cada restricción.
+    - variables: lista de variables
+    - dominios: diccionario variable -> lista de valores
+    - restricciones: diccionario variable -> vecinos (como en 020)
+    - compatibles(xi, vi, xj, vj): True si los valores son compatibles (por defecto vi != vj)
     """
-    # Paso 1: Generar una solución inicial aleatoria
-    tablero = [random.randint(0, N - 1) for _ in range(N)]
-    
-    for _ in range(max_intentos):
-        # Contar conflictos en cada fila
-        conflictos = [contar_conflictos(tablero, fila, tablero[fila]) for fila in range(N)]
+    def __init__(self, variables, dominios, restricciones, compatibles=None):
+        compatibles = compatibles or (lambda xi, vi, xj, vj: vi != vj)
+        self.variables = list(variables)
+        indice = {variable: i for i, variable in enumerate(self.variables)}
+        self.dominios = [list(dominios[variable]) for variable in self.variables]
+        # vecinos[i] = lista de (j, matriz) donde matriz[vi][vj] = 1 si i=vi y j=vj chocan
+        self.vecinos = [[] for _ in self.variables]
+        for xi in self.variables:
+            for xj in restricciones.get(xi, []):
+                i, j = indice[xi], indice[xj]
+                if i < j or xi not in restricciones.get(xj, []):  # Cada restricción se construye una vez
+                    matriz = np.array([[not compatibles(xi, vi, xj, vj) for vj in self.dominios[j]]
+                                       for vi in self.dominios[i]], dtype=np.int32).reshape(
+                                           len(self.dominios[i]), len(self.dominios[j]))
+                    self.vecinos[i].append((j, matriz))
+                    self.vecinos[j].append((i, matriz.T))
 
-        # Si no hay conflictos, hemos encontrado la solución
-        if sum(conflictos) == 0:
-            return tablero
+    def resolver(self, max_pasos=100_000, semilla=None, ruido=0.02):
+        """
+        Asignación inicial voraz (cada variable toma el valor con menos conflictos con
+        las ya asignadas) y reparación por mínimos conflictos. Con probabilidad 'ruido'
+        la variable elegida toma un valor al azar en lugar del de menos conflictos.
+        Retorna un diccionario variable -> valor, o None si se agotan los pasos.
+        """
+        aleatorio = random.Random(semilla)
+        azar = aleatorio.random
+        conflictos = [np.zeros(len(dominio), dtype=np.int32) for dominio in self.dominios]
+        valores = [-1] * len(self.variables)
 
-        # Seleccionar una reina con conflictos al azar
-        filas_con_conflictos = [fila for fila in range(N) if conflictos[fila] > 0]
-        fila_elegida = random.choice(filas_con_conflictos)
+        def menor_conflicto(i):
+            candidatos = np.flatnonzero(conflictos[i] == conflictos[i].min())
+            return int(candidatos[int(azar() * len(candidatos))])  # Empates al azar
 
-        # Mover la reina a la columna con menos conflictos
-        tablero[fila_elegida] = encontrar_menor_conflicto(tablero, fila_elegida)
+        for i in range(len(self.variables)):
+            valores[i] = menor_conflicto(i)
+            for j, matriz in self.vecinos[i]:
+                conflictos[j] += matriz[valores[i]]
 
-    return None  # No se encontró solución en el número de intentos
+        pendientes = [i for i in range(len(self.variables)) if conflictos[i][valores[i]] > 0]
+        marcadas = bytearray(len(self.variables))
+        for i in pendientes:
+            marcadas[i] = 1
+
+        pasos = 0
+        while pendientes:
+            k = int(azar() * len(pendientes))
+            i = pendientes[k]
+            pendientes[k] = pendientes[-1]
+            pendientes.pop()
+            marcadas[i] = 0
+            if conflictos[i][valores[i]] == 0:
+                continue
+            if pasos >= max_pasos:
+                return None
+            pasos += 1
+
+            anterior = valores[i]
+            if azar() < ruido:  # Paseo aleatorio: ayuda a salir de las mesetas
+                nuevo = int(azar() * len(self.dominios[i]))
+            else:
+                nuevo = menor_conflicto(i)
+            valores[i] = nuevo
+            for j, matriz in self.vecinos[i]:
+                if nuevo != anterior:
+                    conflictos[j] += matriz[nuevo] - matriz[anterior]
+                if not marcadas[j] and conflictos[j][valores[j]] > 0:
+                    pendientes.append(j)
+                    marcadas[j] = 1
+            if conflictos[i][nuevo] > 0:
+                pendientes.append(i)
+                marcadas[i] = 1
+
+        return {variable: self.dominios[i][valores[i]] for i, variable in enumerate(self.variables)}
 
 # Definir el tamaño del tablero
 N = 8  # Puedes cambiar este valor para probar con otros tamaños de tablero
 
 # Ejecutar el algoritmo
-solucion = minimos_conflictos(N)
+solucion = minimos_conflictos(N, semilla=0)
 
 # Mostrar el resultado
-if solucion:
+if solucion is not None:
     print("Solución encontrada:")
     for fila in range(N):
         print(" ".join("Q" if solucion[fila] == col else "." for col in range(N)))
 else:
     print("No se encontró solución dentro del límite de intentos.")
+
+# Un millón de reinas
+inicio = time.perf_counter()
+solucion = minimos_conflictos(1_000_000, semilla=0)
+print(f"\n1 000 000 reinas en {time.perf_counter() - inicio:.1f} s, solución válida: {verificar_reinas(solucion)}")
+
+# Coloreo de mapas con el CSP general (el mapa de 017)
+mapa = {'A': ['B', 'C'], 'B': ['A', 'C', 'D'], 'C': ['A', 'B', 'D', 'E'], 'D': ['B', 'C', 'E'], 'E': ['C', 'D']}
+colores = ['Rojo', 'Verde', 'Azul']
+csp = MinimosConflictosCSP(list(mapa), {region: colores for region in mapa}, mapa)
+print("\nColoreo del mapa:", csp.resolver(semilla=0))
+
+# Grafo aleatorio de 5000 nodos que se sabe 4-coloreable (las aristas solo unen nodos
+# de colores distintos en un coloreo escondido)
+generador = random.Random(1)
+escondido = [generador.randrange(4) for _ in range(5000)]
+vecinos = {nodo: set() for nodo in range(5000)}
+while sum(map(len, vecinos.values())) < 2 * 12_000:
+    u, v = generador.randrange(5000), generador.randrange(5000)
+    if escondido[u] != escondido[v]:
+        vecinos[u].add(v)
+        vecinos[v].add(u)
+inicio = time.perf_counter()
+csp = MinimosConflictosCSP(list(vecinos), {nodo: range(4) for nodo in vecinos}, vecinos)
+coloreo = csp.resolver(semilla=0)
+valido = coloreo is not None and all(coloreo[u] != coloreo[v] for u in vecinos for v in vecinos[u])
+print(f"Grafo de 5000 nodos y 12 000 aristas con 4 colores: {time.perf_counter() - inicio:.2f} s, válido: {valido}")
@@ -1,4 +1,5 @@
 from collections import deque
+from busqueda_rejilla import Rejilla, bfs_rejilla, jps  # Búsquedas directas sobre una rejilla de NumPy
 
 def generar_grafo(laberinto):
     """
@@ -67,3 +68,10 @@ if camino:
     print("Camino encontrado:", camino)
 else:
     print("No hay camino posible")
+
+
+# El mismo laberinto sin construir el grafo: búsquedas directas sobre la rejilla de NumPy
+rejilla = Rejilla(laberinto)
+print("Camino con BFS sobre la rejilla:", bfs_rejilla(rejilla, inicio, objetivo))
+camino, costo = jps(rejilla, inicio, objetivo)
+print(f"Camino con JPS (8 direcciones): {camino}, costo {costo:.2f}")
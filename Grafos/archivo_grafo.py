@@ -0,0 +1,228 @@
+"""
+Formato binario para guardar un GrafoCSR en disco y abrirlo con np.memmap.
+
+El archivo tiene una cabecera de 64 bytes seguida de las secciones, cada una
+alineada a 8 bytes:
+    cabecera | desplazamientos (int64, n + 1) | destinos (int32, m) | pesos (m) | ids originales (int64, n)
+La conversión desde texto (DIMACS .gr o lista de aristas) se hace una sola vez;
+después el archivo se abre en milisegundos porque no se lee nada hasta que se usa,
+y todos los procesos que lo abren comparten las mismas páginas en memoria.
+"""
+import os
+import numpy as np
+from grafo_csr import GrafoCSR
+
+MAGIA = b'GRAFOCSR'
+VERSION = 1
+CABECERA = np.dtype([
+    ('magia', 'S8'),
+    ('version', '<u4'),
+    ('reservado', '<u4'),
+    ('num_nodos', '<u8'),
+    ('num_aristas', '<u8'),
+    ('tipo_pesos', 'S8'),  # dtype de los pesos ('<i8', '<f8') o vacío si no hay pesos
+    ('con_ids', '<u8'),  # 1 si se guardan los identificadores originales de los nodos
+    ('relleno', 'S16'),
+])
+
+
+def leer_dimacs(ruta):
+    """
+    Lee un grafo en formato DIMACS (.gr del 9th DIMACS Challenge):
+        c comentario
+        p sp <nodos> <arcos>
+        a <origen> <destino> <peso>
+    Los nodos se numeran desde 1 en el archivo y desde 0 en el GrafoCSR.
+    """
+    num_nodos = None
+    with open(ruta) as archivo:
+        for linea in archivo:
+            if linea.startswith('p'):
+                num_nodos = int(linea.split()[2])
+                break
+    if num_nodos is None:
+        raise ValueError(f"{ruta}: falta la línea 'p sp <nodos> <arcos>'.")
+
+    # np.loadtxt está escrito en C: ignora los comentarios y la columna de la 'a'
+    arcos = np.loadtxt(ruta, comments=('c', 'p'), usecols=(1, 2, 3), dtype=np.int64, ndmin=2)
+    return GrafoCSR.desde_arreglos(num_nodos, arcos[:, 0] - 1, arcos[:, 1] - 1, arcos[:, 2])
+
+
+def leer_lista_aristas(ruta, dirigido=True, renumerar=False):
+    """
+    Lee una lista de aristas en texto, una por línea: 'origen destino [peso]'
+    (las líneas que empiezan con '#' se ignoran, como en los archivos de SNAP).
+    - dirigido=False: cada arista se agrega en ambos sentidos
+    - renumerar=True: los identificadores se compactan a 0..n-1 y los originales
+      se guardan en grafo.ids_originales (útil cuando son dispersos)
+    """
+    # Los identificadores se leen como enteros: como float64 los mayores que 2^53 se mezclarían
+    ids = np.loadtxt(ruta, comments='#', usecols=(0, 1), dtype=np.int64, ndmin=2)
+    if ids.size == 0:  # Archivo sin aristas
+        ids = np.zeros((0, 2), dtype=np.int64)
+    origenes, destinos = ids[:, 0], ids[:, 1]
+    pesos = None
+    if len(ids) and columnas_lista_aristas(ruta) > 2:  # Solo la columna del peso se lee como real
+        pesos = np.loadtxt(ruta, comments='#', usecols=2, dtype=np.float64, ndmin=1)
+        if np.all(pesos == np.round(pesos)):  # Los pesos enteros se conservan enteros
+            pesos = pesos.astype(np.int64)
+
+    ids_originales = None
+    if renumerar:
+        ids_originales, inversos = np.unique(np.concatenate((origenes, destinos)), return_inverse=True)
+        origenes, destinos = inversos[:len(origenes)], inversos[len(origenes):]
+        num_nodos = len(ids_originales)
+    else:
+        num_nodos = max(int(origenes.max(initial=-1)), int(destinos.max(initial=-1))) + 1
+
+    if not dirigido:
+        origenes, destinos = np.concatenate((origenes, destinos)), np.concatenate((destinos, origenes))
+        pesos = None if pesos is None else np.concatenate((pesos, pesos))
+
+    grafo = GrafoCSR.desde_arreglos(num_nodos, origenes, destinos, pesos)
+    grafo.ids_originales = ids_originales
+    return grafo
+
+
+def columnas_lista_aristas(ruta):
+    """Número de columnas de la primera línea con datos de una lista de aristas."""
+    with open(ruta) as archivo:
+        for linea in archivo:
+            if linea.strip() and not linea.startswith('#'):
+                return len(linea.split())
+    return 0
+
+
+def alinear(archivo):
+    """Rellena con ceros hasta la siguiente posición múltiplo de 8."""
+    archivo.write(b'\0' * (-archivo.tell() % 8))
+
+
+def guardar_binario(grafo, ruta):
+    """Guarda un GrafoCSR en el formato binario (escritura atómica con un archivo temporal)."""
+    ids_originales = getattr(grafo, 'ids_originales', None)
+    pesos = None if grafo.pesos is None else np.ascontiguousarray(
+        grafo.pesos, dtype=np.int64 if grafo.pesos.dtype.kind in 'iu' else np.float64)
+    cabecera = np.zeros(1, dtype=CABECERA)
+    cabecera['magia'] = MAGIA
+    cabecera['version'] = VERSION
+    cabecera['num_nodos'] = grafo.num_nodos
+    cabecera['num_aristas'] = grafo.num_aristas
+    cabecera['tipo_pesos'] = b'' if pesos is None else pesos.dtype.str.encode()
+    cabecera['con_ids'] = ids_originales is not None
+
+    temporal = ruta + '.tmp'
+    with open(temporal, 'wb') as archivo:
+        archivo.write(cabecera.tobytes())
+        for arreglo in (grafo.desplazamientos.astype(np.int64, copy=False),
+                        grafo.destinos.astype(np.int32, copy=False),
+                        pesos,
+                        None if ids_originales is None else np.asarray(ids_originales, dtype=np.int64)):
+            if arreglo is not None:
+                np.ascontiguousarray(arreglo).tofile(archivo)
+                alinear(archivo)
+    os.replace(temporal, ruta)
+
+
+def abrir_binario(ruta):
+    """
+    Abre un grafo binario con np.memmap en modo de solo lectura: no se copia nada
+    a memoria hasta que se accede a los arreglos, y el sistema operativo comparte
+    esas páginas entre todos los procesos que abren el mismo archivo.
+    El grafo recuerda su ruta (grafo.ruta) para que otros procesos lo reabran.
+    """
+    cabecera = np.fromfile(ruta, dtype=CABECERA, count=1)
+    if len(cabecera) == 0 or cabecera['magia'][0] != MAGIA:
+        raise ValueError(f"{ruta} no es un grafo binario.")
+    if cabecera['version'][0] != VERSION:
+        raise ValueError(f"{ruta}: versión {cabecera['version'][0]} no soportada.")
+    num_nodos, num_aristas = int(cabecera['num_nodos'][0]), int(cabecera['num_aristas'][0])
+    tipo_pesos = cabecera['tipo_pesos'][0].decode()
+
+    posicion = CABECERA.itemsize
+    def seccion(tipo, cantidad):
+        nonlocal posicion
+        tipo = np.dtype(tipo)
+        if cantidad == 0:
+            arreglo = np.empty(0, dtype=tipo)  # np.memmap no acepta secciones vacías
+        else:
+            arreglo = np.memmap(ruta, dtype=tipo, mode='r', offset=posicion, shape=(cantidad,))
+        posicion += cantidad * tipo.itemsize
+        posicion += -posicion % 8
+        return arreglo
+
+    desplazamientos = seccion(np.int64, num_nodos + 1)
+    destinos = seccion(np.int32, num_aristas)
+    pesos = seccion(tipo_pesos, num_aristas) if tipo_pesos else None
+    ids_originales = seccion(np.int64, num_nodos) if cabecera['con_ids'][0] else None
+
+    grafo = GrafoCSR(desplazamientos, destinos, pesos)
+    grafo.ids_originales = ids_originales
+    grafo.ruta = ruta
+    return grafo
+
+
+def convertir(ruta_texto, ruta_binaria=None, formato=None, **opciones):
+    """
+    Convierte un archivo de texto al formato binario y retorna la ruta binaria.
+    - formato: 'dimacs' o 'aristas' (por defecto según la extensión: .gr es DIMACS)
+    - opciones: se pasan a leer_lista_aristas (dirigido, renumerar)
+    """
+    ruta_binaria = ruta_binaria or ruta_texto + '.csr'
+    formato = formato or ('dimacs' if ruta_texto.endswith('.gr') else 'aristas')
+    if formato == 'dimacs':
+        grafo = leer_dimacs(ruta_texto)
+    elif formato == 'aristas':
+        grafo = leer_lista_aristas(ruta_texto, **opciones)
+    else:
+        raise ValueError(f"Formato desconocido: {formato!r}")
+    guardar_binario(grafo, ruta_binaria)
+    return ruta_binaria
+
+
+def cargar_grafo(ruta_texto, formato=None, **opciones):
+    """
+    Abre el grafo de un archivo de texto a través de su versión binaria (ruta + '.csr'),
+    que se genera la primera vez o cuando el texto es más nuevo que el binario.
+    """
+    ruta_binaria = ruta_texto + '.csr'
+    if not os.path.exists(ruta_binaria) or os.path.getmtime(ruta_binaria) < os.path.getmtime(ruta_texto):
+        convertir(ruta_texto, ruta_binaria, formato, **opciones)
+    return abrir_binario(ruta_binaria)
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from grafo_csr import dijkstra_csr
+    from tablas_distancia import muchos_a_muchos
+
+    # Se escribe un archivo DIMACS de prueba con 200 000 nodos y 1 000 000 de arcos
+    generador = np.random.default_rng(0)
+    num_nodos, num_arcos = 200_000, 1_000_000
+    ruta = os.path.join(tempfile.gettempdir(), 'prueba.gr')
+    arcos = np.column_stack((generador.integers(1, num_nodos + 1, num_arcos),
+                             generador.integers(1, num_nodos + 1, num_arcos),
+                             generador.integers(1, 100, num_arcos)))
+    with open(ruta, 'w') as archivo:
+        archivo.write(f"c grafo aleatorio\np sp {num_nodos} {num_arcos}\n")
+        np.savetxt(archivo, arcos, fmt='a %d %d %d')
+    if os.path.exists(ruta + '.csr'):
+        os.remove(ruta + '.csr')
+
+    inicio = time.perf_counter()
+    grafo = cargar_grafo(ruta)
+    print(f"Primera carga (texto -> binario): {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    grafo = cargar_grafo(ruta)
+    print(f"Cargas siguientes (np.memmap): {1000 * (time.perf_counter() - inicio):.2f} ms, "
+          f"{grafo.num_nodos} nodos y {grafo.num_aristas} aristas")
+
+    distancias = dijkstra_csr(grafo, 0)
+    print(f"Dijkstra desde el nodo 0: {np.isfinite(distancias).sum()} nodos alcanzados")
+
+    # Los procesos trabajadores reabren el mismo archivo en lugar de recibir una copia del grafo
+    puntos = generador.integers(0, num_nodos, 8)
+    matriz = muchos_a_muchos(grafo, puntos, puntos, procesos=4)
+    print(f"Matriz de distancias {matriz.shape} calculada con 4 procesos que comparten el archivo")
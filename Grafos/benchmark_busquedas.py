@@ -0,0 +1,494 @@
+"""
+Banco de pruebas (benchmark) de las búsquedas de la carpeta Grafos.
+
+Genera grafos sintéticos con semilla fija, de 10^3 a 10^7 aristas:
+- 'geometrico': grafo geométrico aleatorio (puntos en el cuadrado unitario unidos
+  si están a menos de un radio; costo = distancia euclidiana * 1000, redondeada hacia arriba)
+- 'rejilla': rejilla de 4 vecinos con obstáculos al azar (costo 1)
+- 'libre_escala': grafo libre de escala de Chung-Lu (grados esperados con ley de
+  potencias; costos enteros al azar de 1 a 9)
+
+Cada búsqueda se ejecuta en un proceso hijo (con límite de tiempo) y se registran
+el tiempo de pared, el pico de memoria residente (RSS), el costo del camino y, en
+una ejecución aparte con EstadisticasBusqueda, los nodos expandidos, generados y
+duplicados, la frontera máxima y las evaluaciones de la heurística (ver
+estadisticas_busqueda.py). Los resultados se guardan en JSON y CSV, etiquetados con
+el commit, y se comparan con la ejecución anterior para que las regresiones se
+noten entre commits.
+"""
+import contextlib
+import csv
+import json
+import math
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+import numpy as np
+from cargar_script import cargar_script
+from estadisticas_busqueda import EstadisticasBusqueda
+from grafo_csr import GrafoCSR, aristas_de, bfs_niveles
+from puntos_referencia import TablaPuntosReferencia
+
+CAMPOS = ('familia', 'aristas_objetivo', 'num_nodos', 'num_aristas', 'busqueda', 'formato', 'estado',
+          'tiempo_s', 'tiempo_estadisticas_s', 'rss_pico_mb', 'rss_extra_mb', 'expandidos', 'generados',
+          'duplicados', 'frontera_maxima', 'evaluaciones_heuristica', 'costo', 'longitud')
+
+### --- Generadores de grafos --- ###
+
+def grafo_geometrico(num_aristas, grado=8, semilla=0):
+    """
+    Grafo geométrico aleatorio no dirigido con ~num_aristas aristas dirigidas y grado medio 'grado'.
+    Retorna (grafo, cotas), donde cotas(objetivo) es el arreglo de heurísticas admisibles
+    y consistentes hacia 'objetivo' (distancia euclidiana * 1000, redondeada hacia abajo).
+    """
+    generador = np.random.default_rng(semilla)
+    num_nodos = max(2, num_aristas // grado)
+    radio = math.sqrt(grado / (math.pi * num_nodos))
+    puntos = generador.random((num_nodos, 2))
+
+    # Cubetas de lado >= radio: los vecinos de un punto están en su celda o en las 8 de alrededor.
+    # Los nodos se numeran por celda, así que los vecinos quedan cerca también en memoria
+    lado = max(1, int(1 / radio))
+    celdas = np.minimum((puntos * lado).astype(np.int64), lado - 1)
+    orden = np.argsort(celdas[:, 0] * lado + celdas[:, 1], kind='stable')
+    puntos, celdas = puntos[orden], celdas[orden]
+    desplazamientos = np.zeros(lado * lado + 1, dtype=np.int64)
+    np.cumsum(np.bincount(celdas[:, 0] * lado + celdas[:, 1], minlength=lado * lado), out=desplazamientos[1:])
+
+    origenes, destinos = [], []
+    # Media vecindad: cada par de celdas se revisa una sola vez
+    for di, dj in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        fila, columna = celdas[:, 0] + di, celdas[:, 1] + dj
+        validos = np.flatnonzero((fila < lado) & (columna >= 0) & (columna < lado))
+        vecinas = fila[validos] * lado + columna[validos]
+        candidatos, _ = aristas_de(desplazamientos, vecinas)  # Todos los puntos de las celdas vecinas
+        fuentes = np.repeat(validos, desplazamientos[vecinas + 1] - desplazamientos[vecinas])
+        cerca = np.hypot(*(puntos[fuentes] - puntos[candidatos]).T) < radio
+        if (di, dj) == (0, 0):
+            cerca &= candidatos > fuentes  # Dentro de la misma celda, cada par una vez
+        origenes.append(fuentes[cerca])
+        destinos.append(candidatos[cerca])
+
+    origenes, destinos = np.concatenate(origenes), np.concatenate(destinos)
+    pesos = np.maximum(1, np.ceil(1000 * np.hypot(*(puntos[origenes] - puntos[destinos]).T))).astype(np.int64)
+    grafo = GrafoCSR.desde_arreglos(num_nodos, np.concatenate((origenes, destinos)),
+                                    np.concatenate((destinos, origenes)), np.concatenate((pesos, pesos)))
+    # floor(1000 d(v, t)) nunca supera la suma de los ceil(1000 d) de las aristas del camino
+    cotas = lambda objetivo: np.floor(1000 * np.hypot(*(puntos - puntos[objetivo]).T)).astype(np.int64)
+    return grafo, cotas
+
+
+def rejilla_con_obstaculos(num_aristas, obstaculos=0.2, semilla=0):
+    """
+    Rejilla cuadrada de 4 vecinos con una fracción 'obstaculos' de celdas bloqueadas
+    (nodos sin aristas) y ~num_aristas aristas dirigidas de costo 1.
+    Retorna (grafo, cotas) con la distancia Manhattan como heurística.
+    """
+    generador = np.random.default_rng(semilla)
+    # Cada celda libre tiene en promedio 4 (1 - obstaculos) vecinos libres
+    lado = max(2, int(math.sqrt(num_aristas / (4 * (1 - obstaculos) ** 2))))
+    libres = generador.random((lado, lado)) >= obstaculos
+    indices = np.arange(lado * lado).reshape(lado, lado)
+
+    horizontales = libres[:, :-1] & libres[:, 1:]
+    verticales = libres[:-1, :] & libres[1:, :]
+    origenes = np.concatenate((indices[:, :-1][horizontales], indices[:-1, :][verticales]))
+    destinos = np.concatenate((indices[:, 1:][horizontales], indices[1:, :][verticales]))
+    grafo = GrafoCSR.desde_arreglos(lado * lado, np.concatenate((origenes, destinos)),
+                                    np.concatenate((destinos, origenes)),
+                                    np.ones(2 * len(origenes), dtype=np.int64))
+    filas, columnas = np.divmod(np.arange(lado * lado), lado)
+    cotas = lambda objetivo: np.abs(filas - filas[objetivo]) + np.abs(columnas - columnas[objetivo])
+    return grafo, cotas
+
+
+def grafo_libre_de_escala(num_aristas, grado=8, exponente=2.5, semilla=0):
+    """
+    Grafo libre de escala no dirigido (modelo de Chung-Lu): cada extremo de una arista se
+    elige con probabilidad proporcional a w_i = i^(-1 / (exponente - 1)), lo que da grados
+    con distribución de ley de potencias. No tiene coordenadas, así que la heurística es
+    la cota ALT de puntos_referencia.py, calculada para todos los nodos a la vez.
+    """
+    generador = np.random.default_rng(semilla)
+    num_nodos = max(2, num_aristas // grado)
+    probabilidades = (np.arange(1, num_nodos + 1) ** (-1 / (exponente - 1)))
+    probabilidades /= probabilidades.sum()
+    etiquetas = generador.permutation(num_nodos)  # Los nodos de grado alto no son los primeros ids
+    origenes = etiquetas[generador.choice(num_nodos, num_aristas // 2, p=probabilidades)]
+    destinos = etiquetas[generador.choice(num_nodos, num_aristas // 2, p=probabilidades)]
+
+    # Sin lazos ni aristas repetidas
+    menores, mayores = np.minimum(origenes, destinos), np.maximum(origenes, destinos)
+    pares = np.unique(menores[menores != mayores] * num_nodos + mayores[menores != mayores])
+    origenes, destinos = np.divmod(pares, num_nodos)
+    pesos = generador.integers(1, 10, len(pares))
+    grafo = GrafoCSR.desde_arreglos(num_nodos, np.concatenate((origenes, destinos)),
+                                    np.concatenate((destinos, origenes)), np.concatenate((pesos, pesos)))
+
+    tabla = None
+    def cotas(objetivo):
+        nonlocal tabla
+        if tabla is None:  # Las tablas solo se calculan si alguna búsqueda usa heurística
+            tabla = TablaPuntosReferencia.construir(grafo, k=4, semilla=semilla)
+        with np.errstate(invalid='ignore'):  # inf - inf (componentes distintas) da nan y se ignora
+            cotas = np.concatenate((tabla.desde[:, [objetivo]] - tabla.desde,
+                                    tabla.hacia - tabla.hacia[:, [objetivo]]))
+        return np.maximum(np.nan_to_num(cotas, nan=0.0, neginf=0.0).max(axis=0), 0.0)
+    return grafo, cotas
+
+
+GENERADORES = {
+    'geometrico': grafo_geometrico,
+    'rejilla': rejilla_con_obstaculos,
+    'libre_escala': grafo_libre_de_escala,
+}
+
+
+def elegir_consulta(grafo, semilla=0, intentos=10):
+    """
+    Elige (inicio, meta, saltos) con semilla: el inicio en la componente más grande
+    encontrada en 'intentos' y la meta al azar entre los nodos alcanzables que están
+    al menos a la mediana de la distancia en saltos.
+    """
+    generador = np.random.default_rng(semilla)
+    con_aristas = np.flatnonzero(np.diff(grafo.desplazamientos) > 0)
+    mejor = None
+    for _ in range(intentos):
+        inicio = int(generador.choice(con_aristas))
+        distancias, _ = bfs_niveles(grafo, inicio)
+        alcanzados = np.flatnonzero(distancias > 0)
+        if mejor is None or len(alcanzados) > len(mejor[2]):
+            mejor = (inicio, distancias, alcanzados)
+        if len(alcanzados) >= len(con_aristas) // 2:
+            break
+    inicio, distancias, alcanzados = mejor
+    lejanos = alcanzados[distancias[alcanzados] >= np.median(distancias[alcanzados])]
+    meta = int(generador.choice(lejanos))
+    return inicio, meta, int(distancias[meta])
+
+### --- Formatos de grafo que usan los scripts --- ###
+
+def a_listas(grafo):
+    """dict {nodo: [vecinos]} (003, 004, 005, 006, 007, 009)."""
+    desplazamientos, destinos = grafo.desplazamientos.tolist(), grafo.destinos.tolist()
+    return {i: destinos[desplazamientos[i]:desplazamientos[i + 1]] for i in range(grafo.num_nodos)}
+
+
+def a_pesos(grafo):
+    """dict de dicts {nodo: {vecino: costo}} (002, 005, 006, 008)."""
+    desplazamientos, destinos, pesos = grafo.desplazamientos.tolist(), grafo.destinos.tolist(), grafo.pesos.tolist()
+    return {i: dict(zip(destinos[desplazamientos[i]:desplazamientos[i + 1]],
+                        pesos[desplazamientos[i]:desplazamientos[i + 1]]))
+            for i in range(grafo.num_nodos)}
+
+
+def a_costos(grafo):
+    """Listas de vecinos y diccionario {(origen, destino): costo} (busqueda_A_estrella de 010)."""
+    origenes = np.repeat(np.arange(grafo.num_nodos), np.diff(grafo.desplazamientos))
+    return a_listas(grafo), dict(zip(zip(origenes.tolist(), grafo.destinos.tolist()), grafo.pesos.tolist()))
+
+
+FORMATOS = {'listas': a_listas, 'pesos': a_pesos, 'costos': a_costos, 'csr': lambda grafo: grafo}
+
+
+### --- Búsquedas a comparar --- ###
+
+def casos_busqueda():
+    """
+    Lista de (nombre, formato, ejecutar), donde ejecutar(grafo, inicio, meta, consulta, estadisticas)
+    llama a la búsqueda con la firma de su script y retorna el camino (None si no lo
+    encuentra, True si la búsqueda solo informa que la meta es alcanzable).
+    'consulta' trae las heurísticas h (hacia la meta) y h_inicio como listas, el límite
+    de profundidad para la búsqueda limitada y los grafos invertidos de los formatos dict
+    ('inverso_listas', 'inverso_pesos') que usan las búsquedas bidireccionales.
+    """
+    s002, s003, s004, s005, s006, s007, s008, s009, s010 = (
+        cargar_script(prefijo) for prefijo in ('002', '003', '004', '005', '006', '007', '008', '009', '010'))
+    casos = []
+    for formato_sin_pesos in ('listas', 'csr'):  # Las búsquedas no ponderadas tienen versión CSR
+        sufijo = '' if formato_sin_pesos == 'listas' else '_csr'
+        casos += [
+            ('bfs' + sufijo, formato_sin_pesos, lambda g, i, m, c, e: s007.bfs(g, i, m, estadisticas=e)),
+            ('bidireccional' + sufijo, formato_sin_pesos,
+             lambda g, i, m, c, e: s006.busqueda_bidireccional(g, i, m, c.get('inverso_listas'), estadisticas=e)),
+            ('profundidad' + sufijo, formato_sin_pesos, lambda g, i, m, c, e: s003.busqueda_profundidad(g, i, m, estadisticas=e)),
+            ('profundidad_limitada' + sufijo, formato_sin_pesos,
+             lambda g, i, m, c, e: s004.busqueda_profundidad_limitada(g, i, m, c['limite'], estadisticas=e)),
+            ('profundidad_iterativa' + sufijo, formato_sin_pesos,
+             lambda g, i, m, c, e: s005.busqueda_profundidad_iterativa(g, i, m, estadisticas=e)),
+        ]
+    for formato_con_pesos in ('pesos', 'csr'):
+        sufijo = '' if formato_con_pesos == 'pesos' else '_csr'
+        casos += [
+            ('costo_uniforme' + sufijo, formato_con_pesos,
+             lambda g, i, m, c, e: s002.busqueda_costo_uniforme(g, i, m, estadisticas=e)[1]),
+            ('dijkstra_bidireccional' + sufijo, formato_con_pesos,
+             lambda g, i, m, c, e: s006.dijkstra_bidireccional(g, i, m, inverso=c.get('inverso_pesos'),
+                                                               estadisticas=e)[1]),
+        ]
+    casos += [
+        ('a_star', 'pesos', lambda g, i, m, c, e: s008.a_star(g, i, m, c['h'], estadisticas=e)),
+        ('a_estrella_010', 'costos', lambda g, i, m, c, e: s010.busqueda_A_estrella(g[0], g[1], i, m, c['h'], estadisticas=e)),
+        ('a_estrella_bidireccional', 'pesos',
+         lambda g, i, m, c, e: s006.a_estrella_bidireccional(g, i, m, c['h'].__getitem__,
+                                                          c['h_inicio'].__getitem__, c['inverso_pesos'],
+                                                          estadisticas=e)[1]),
+        ('voraz', 'listas', lambda g, i, m, c, e: s009.busqueda_voraz(g, i, m, c['h'], estadisticas=e)),
+        ('ida_estrella', 'pesos', lambda g, i, m, c, e: s005.ida_estrella(g, i, m, c['h'], estadisticas=e)[0]),
+        ('sma_estrella', 'pesos', lambda g, i, m, c, e: s005.sma_estrella(g, i, m, c['h'], estadisticas=e)[0]),
+    ]
+    return casos
+
+### --- Medición --- ###
+
+def reiniciar_pico_memoria():
+    """En Linux, escribir 5 en clear_refs reinicia el pico de RSS (VmHWM) del proceso."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as archivo:
+            archivo.write('5')
+    except OSError:
+        pass
+
+
+def memoria_proceso():
+    """(RSS actual, pico de RSS) en MB; fuera de Linux ambos son ru_maxrss."""
+    try:
+        with open('/proc/self/status') as archivo:
+            campos = dict(linea.split(':', 1) for linea in archivo)
+        return int(campos['VmRSS'].split()[0]) / 1024, int(campos['VmHWM'].split()[0]) / 1024
+    except (OSError, KeyError):
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        pico /= 1024 * 1024 if sys.platform == 'darwin' else 1024  # bytes en macOS, KB en Linux
+        return pico, pico
+
+
+def costo_camino(grafo, camino):
+    """Costo del camino en el GrafoCSR ponderado; ValueError si usa una arista que no existe."""
+    costo = 0
+    for origen, destino in zip(camino, camino[1:]):
+        vecinos = grafo.vecinos(origen)
+        posiciones = np.flatnonzero(vecinos == destino)
+        if len(posiciones) == 0:
+            raise ValueError(f"camino inválido: no existe la arista {origen} -> {destino}")
+        costo += grafo.pesos_de(origen)[posiciones].min().item()
+    return costo
+
+
+def medir(ejecutar, grafo, csr, inicio, meta, consulta, repeticiones):
+    """
+    Ejecuta una búsqueda y retorna sus métricas: el menor tiempo de 'repeticiones'
+    ejecuciones, el pico de RSS y, en una ejecución aparte con EstadisticasBusqueda,
+    los contadores de la búsqueda y el tiempo con las estadísticas activadas.
+    """
+    rss_antes, _ = memoria_proceso()
+    reiniciar_pico_memoria()
+    tiempos = []
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):  # 005 imprime cada profundidad
+        for _ in range(repeticiones):
+            comienzo = time.perf_counter()
+            camino = ejecutar(grafo, inicio, meta, consulta, None)
+            tiempos.append(time.perf_counter() - comienzo)
+        _, pico = memoria_proceso()
+        estadisticas = EstadisticasBusqueda()
+        comienzo = time.perf_counter()
+        ejecutar(grafo, inicio, meta, consulta, estadisticas)
+        tiempo_estadisticas = time.perf_counter() - comienzo
+
+    resultado = {'estado': 'ok', 'tiempo_s': min(tiempos), 'tiempo_estadisticas_s': tiempo_estadisticas,
+                 'rss_pico_mb': round(pico, 1), 'rss_extra_mb': round(pico - rss_antes, 1)}
+    resultado.update(estadisticas.resultado())
+    del resultado['tiempos']
+    if not camino:
+        resultado['estado'] = 'sin camino'
+    elif camino is not True:  # True: la búsqueda no reconstruye el camino
+        resultado['costo'] = costo_camino(csr, camino)
+        resultado['longitud'] = len(camino)
+    return resultado
+
+
+def medir_en_hijo(conexion, *argumentos):
+    """Cuerpo del proceso hijo: envía las métricas o el error por la tubería."""
+    try:
+        conexion.send(medir(*argumentos))
+    except BaseException as error:
+        conexion.send({'estado': f'error: {type(error).__name__}: {error}'[:200]})
+    finally:
+        conexion.close()
+
+
+def medir_aislado(argumentos, limite_tiempo):
+    """
+    Mide en un proceso hijo creado con fork: hereda los grafos sin copiarlos, su pico de
+    memoria no se mezcla con el de otras búsquedas y se termina si pasa 'limite_tiempo'.
+    Donde no hay fork, se mide en el mismo proceso y sin límite de tiempo.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        try:
+            return medir(*argumentos)
+        except Exception as error:
+            return {'estado': f'error: {type(error).__name__}: {error}'[:200]}
+
+    contexto = multiprocessing.get_context('fork')
+    recibir, enviar = contexto.Pipe(duplex=False)
+    proceso = contexto.Process(target=medir_en_hijo, args=(enviar, *argumentos))
+    proceso.start()
+    enviar.close()
+    try:
+        if recibir.poll(limite_tiempo):
+            return recibir.recv()
+        return {'estado': 'tiempo agotado'}
+    except EOFError:  # El hijo murió sin responder (por ejemplo, sin memoria)
+        proceso.join()
+        return {'estado': f'error: el proceso terminó con código {proceso.exitcode}'}
+    finally:
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+        recibir.close()
+
+
+def ejecutar_benchmark(tamanos=(10**3, 10**4, 10**5), familias=None, busquedas=None, semilla=0,
+                       limite_tiempo=10.0, repeticiones=3, max_aristas_dict=10**6):
+    """
+    Ejecuta cada búsqueda sobre cada familia de grafos y cada tamaño (en aristas).
+    - familias / busquedas: nombres a incluir (None = todos)
+    - max_aristas_dict: por encima de este tamaño solo corren las versiones CSR
+      (un dict de Python con 10^7 aristas ocupa varios GB)
+    Una búsqueda que agota el tiempo o falla en un tamaño se omite en los siguientes
+    de la misma familia. Retorna la lista de resultados (un diccionario por medición).
+    """
+    casos = [caso for caso in casos_busqueda() if busquedas is None or caso[0] in busquedas]
+    resultados = []
+    for familia in familias or GENERADORES:
+        descartadas = set()
+        for num_aristas in sorted(tamanos):
+            csr, cotas = GENERADORES[familia](num_aristas, semilla=semilla)
+            inicio, meta, saltos = elegir_consulta(csr, semilla)
+            consulta = {'limite': 2 * saltos}
+            formatos = {'csr': csr}
+            for nombre, formato, ejecutar in casos:
+                fila = {'familia': familia, 'aristas_objetivo': num_aristas, 'num_nodos': csr.num_nodos,
+                        'num_aristas': csr.num_aristas, 'busqueda': nombre, 'formato': formato}
+                if nombre in descartadas:
+                    fila['estado'] = 'omitido'
+                elif formato != 'csr' and num_aristas > max_aristas_dict:
+                    fila['estado'] = 'omitido (dict)'
+                else:
+                    if formato not in formatos:  # Cada formato se construye una vez por grafo
+                        formatos[formato] = FORMATOS[formato](csr)
+                    if 'h' not in consulta and nombre in ('a_star', 'a_estrella_010', 'a_estrella_bidireccional',
+                                                          'voraz', 'ida_estrella', 'sma_estrella'):
+                        consulta['h'] = cotas(meta).tolist()
+                        consulta['h_inicio'] = cotas(inicio).tolist()
+                    if 'bidireccional' in nombre:  # El grafo invertido se prepara una vez, fuera de la medición
+                        if formato == 'csr':
+                            csr.invertido()  # Queda guardado en el GrafoCSR
+                        elif f'inverso_{formato}' not in consulta:
+                            consulta[f'inverso_{formato}'] = cargar_script('006').invertir_grafo(formatos[formato])
+                    argumentos = (ejecutar, formatos[formato], csr, inicio, meta, consulta, repeticiones)
+                    fila.update(medir_aislado(argumentos, limite_tiempo))
+                    if fila['estado'] not in ('ok', 'sin camino'):
+                        descartadas.add(nombre)
+                resultados.append(fila)
+                imprimir_fila(fila)
+            del formatos
+    return resultados
+
+### --- Resultados --- ###
+
+def imprimir_fila(fila):
+    tiempo = f"{fila['tiempo_s']:9.4f} s" if 'tiempo_s' in fila else ' ' * 11
+    memoria = f"{fila['rss_pico_mb']:8.1f} MB" if 'rss_pico_mb' in fila else ' ' * 11
+    print(f"{fila['familia']:13s}{fila['aristas_objetivo']:>10d}  {fila['busqueda']:28s}"
+          f"{tiempo}{memoria}  expandidos={fila.get('expandidos')}  costo={fila.get('costo')}  {fila['estado']}")
+
+
+def commit_actual():
+    """Hash corto del commit de la carpeta (None si no es un repositorio de git)."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def guardar_resultados(resultados, directorio, etiqueta=None):
+    """
+    Escribe <directorio>/<etiqueta>.json (con los datos del entorno) y <etiqueta>.csv.
+    La etiqueta por defecto es el commit actual, o la fecha si no hay git. Retorna la ruta del JSON.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    etiqueta = etiqueta or commit_actual() or time.strftime('%Y%m%d-%H%M%S')
+    ruta = os.path.join(directorio, etiqueta)
+    datos = {'etiqueta': etiqueta, 'fecha': time.strftime('%Y-%m-%d %H:%M:%S'), 'python': platform.python_version(),
+             'numpy': np.__version__, 'plataforma': platform.platform(), 'resultados': resultados}
+    with open(ruta + '.json', 'w') as archivo:
+        json.dump(datos, archivo, indent=1)
+    with open(ruta + '.csv', 'w', newline='') as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS, extrasaction='ignore')
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    return ruta + '.json'
+
+
+def comparar(ruta_anterior, ruta_nueva, tolerancia=0.25, minimo=0.005):
+    """
+    Compara dos ejecuciones guardadas y retorna la lista de regresiones:
+    búsquedas que tardan más de (1 + tolerancia) veces lo anterior (y al menos 'minimo'
+    segundos más), que cambiaron el costo del camino o que dejaron de terminar bien.
+    """
+    with open(ruta_anterior) as archivo:
+        anteriores = {(r['familia'], r['aristas_objetivo'], r['busqueda']): r for r in json.load(archivo)['resultados']}
+    with open(ruta_nueva) as archivo:
+        nuevos = json.load(archivo)['resultados']
+
+    regresiones = []
+    for nuevo in nuevos:
+        anterior = anteriores.get((nuevo['familia'], nuevo['aristas_objetivo'], nuevo['busqueda']))
+        if anterior is None:
+            continue
+        caso = f"{nuevo['busqueda']} en {nuevo['familia']} ({nuevo['aristas_objetivo']} aristas)"
+        if anterior['estado'] == 'ok' and nuevo['estado'] != 'ok':
+            regresiones.append(f"{caso}: {anterior['estado']} -> {nuevo['estado']}")
+        elif anterior.get('costo') != nuevo.get('costo'):
+            regresiones.append(f"{caso}: costo {anterior.get('costo')} -> {nuevo.get('costo')}")
+        elif 'tiempo_s' in anterior and 'tiempo_s' in nuevo and \
+                nuevo['tiempo_s'] > (1 + tolerancia) * anterior['tiempo_s'] and \
+                nuevo['tiempo_s'] - anterior['tiempo_s'] > minimo:
+            regresiones.append(f"{caso}: {anterior['tiempo_s']:.4f} s -> {nuevo['tiempo_s']:.4f} s")
+    return regresiones
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark de las búsquedas de Grafos.")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[10**3, 10**4, 10**5],
+                        help="número de aristas de cada grafo (hasta 10**7)")
+    parser.add_argument('--familias', nargs='+', choices=list(GENERADORES))
+    parser.add_argument('--busquedas', nargs='+', help="nombres de las búsquedas a medir")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--limite', type=float, default=10.0, help="segundos por búsqueda")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--directorio', default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                             'resultados_benchmark'))
+    parser.add_argument('--comparar', help="JSON de una ejecución anterior (por defecto la más reciente)")
+    opciones = parser.parse_args()
+
+    anteriores = sorted((os.path.join(opciones.directorio, nombre) for nombre in os.listdir(opciones.directorio)
+                         if nombre.endswith('.json')), key=os.path.getmtime) if os.path.isdir(opciones.directorio) else []
+    resultados = ejecutar_benchmark(opciones.tamanos, opciones.familias, opciones.busquedas, opciones.semilla,
+                                    opciones.limite, opciones.repeticiones)
+    ruta = guardar_resultados(resultados, opciones.directorio)
+    print(f"\nResultados guardados en {ruta} y {ruta[:-5]}.csv")
+
+    referencia = opciones.comparar or next((r for r in reversed(anteriores) if r != ruta), None)
+    if referencia:
+        regresiones = comparar(referencia, ruta)
+        print(f"Comparación con {os.path.basename(referencia)}: {len(regresiones)} regresiones")
+        for regresion in regresiones:
+            print("  " + regresion)
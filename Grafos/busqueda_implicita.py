@@ -0,0 +1,281 @@
+"""
+Búsquedas sobre grafos implícitos: en lugar de un diccionario con todo el grafo,
+el problema se describe con dos funciones
+- sucesores(estado): generador de (sucesor, costo); se consume de forma perezosa,
+  así que nunca se construye la lista completa de sucesores ni el grafo
+- es_meta(estado): True si el estado es una meta
+Esto permite buscar en espacios de estados demasiado grandes para enumerarlos.
+
+Cada estado se guarda con una clave compacta (ver los codificadores) y el camino
+se recupera con punteros a padres, en lugar de copiar 'camino + [estado]' en cada
+entrada de la cola. Con un codificador no reversible (Zobrist) solo se guardan los
+estados de la frontera: cada clave apunta a su padre y a la posición del sucesor en
+sucesores(padre), y el camino se rehace repitiendo esos movimientos desde el inicio
+(por eso 'sucesores' debe generar siempre en el mismo orden).
+"""
+import functools
+import itertools
+import operator
+import random
+from collections import deque
+from cola_prioridad import crear_cola  # Cola de prioridad indexada con decremento de prioridad
+
+class CodificadorIdentidad:
+    """El estado es su propia clave (cualquier valor hashable)."""
+    def codificar(self, estado):
+        return estado
+
+    def decodificar(self, clave):
+        return clave
+
+
+class CodificadorEmpaquetado:
+    """
+    Empaqueta una tupla de enteros pequeños (por ejemplo una permutación de 0..n-1)
+    en un solo entero de Python, con 'bits' bits por posición. Un entero ocupa
+    mucho menos memoria que una tupla y se compara y se hashea más rápido.
+    """
+    def __init__(self, longitud, valor_maximo):
+        self.longitud = longitud
+        self.bits = max(1, int(valor_maximo).bit_length())
+        self.mascara = (1 << self.bits) - 1
+
+    def codificar(self, estado):
+        clave = 0
+        for valor in estado:
+            clave = (clave << self.bits) | valor
+        return clave
+
+    def decodificar(self, clave):
+        valores = []
+        for _ in range(self.longitud):
+            valores.append(clave & self.mascara)
+            clave >>= self.bits
+        return tuple(reversed(valores))
+
+
+class CodificadorZobrist:
+    """
+    Hash de Zobrist: un número aleatorio de 64 bits por cada par (posición, valor),
+    y la clave de un estado es el XOR de los números de sus posiciones.
+    No es reversible: las búsquedas no guardan los estados cerrados y rehacen el
+    camino desde el inicio. Sirve para estados que no caben en un entero empaquetado
+    pequeño; dos estados distintos podrían chocar con probabilidad ~ 2^-64 por par.
+    """
+    def __init__(self, longitud, valores, semilla=0):
+        generador = random.Random(semilla)
+        self.tabla = [{valor: generador.getrandbits(64) for valor in valores} for _ in range(longitud)]
+
+    def codificar(self, estado):
+        # map recorre la tabla y el estado a la vez, sin un ciclo de Python por posición
+        return functools.reduce(operator.xor, map(dict.__getitem__, self.tabla, estado), 0)
+
+
+def reconstruir_camino_claves(padres, clave, estado_de):
+    """Camino de estados desde la raíz (padre None) hasta la clave."""
+    camino = []
+    while clave is not None:
+        camino.append(estado_de(clave))
+        clave = padres[clave]
+    camino.reverse()
+    return camino
+
+
+def reconstruir_camino_movimientos(padres, clave, inicial, sucesores):
+    """
+    Camino desde 'inicial' hasta la clave cuando padres[clave] = (clave del padre,
+    posición del sucesor en sucesores(padre)): se repiten los movimientos desde el inicio.
+    """
+    posiciones = []
+    while padres[clave] is not None:
+        clave, posicion = padres[clave]
+        posiciones.append(posicion)
+    camino = [inicial]
+    for posicion in reversed(posiciones):
+        sucesor, _ = next(itertools.islice(sucesores(camino[-1]), posicion, None))
+        camino.append(sucesor)
+    return camino
+
+
+def preparar_codificador(codificador, inicial, sucesores):
+    """
+    Retorna (codificar, decodificar, reconstruir):
+    - decodificar: None si el codificador no es reversible. Si lo es, padres[clave] es
+      la clave del padre; si no, es (clave del padre, posición del sucesor) y el camino
+      se rehace desde el inicio
+    - reconstruir(padres, clave): camino de estados desde el inicio hasta la clave
+    """
+    codificador = codificador or CodificadorIdentidad()
+    decodificar = getattr(codificador, 'decodificar', None)
+    if decodificar is not None:
+        return codificador.codificar, decodificar, lambda padres, clave: reconstruir_camino_claves(padres, clave, decodificar)
+    return (codificador.codificar, None,
+            lambda padres, clave: reconstruir_camino_movimientos(padres, clave, inicial, sucesores))
+
+
+def bfs_implicita(inicial, sucesores, es_meta, codificador=None):
+    """
+    Búsqueda en anchura sobre un grafo implícito (los costos de 'sucesores' se ignoran).
+    La meta se comprueba al generar cada sucesor y el generador deja de consumirse
+    en cuanto aparece, así que no se calculan los sucesores restantes.
+    Retorna (camino, pasos, estadisticas) o (None, inf, estadisticas).
+    """
+    codificar, decodificar, reconstruir = preparar_codificador(codificador, inicial, sucesores)
+    reversible = decodificar is not None
+    clave_inicial = codificar(inicial)
+    padres = {clave_inicial: None}
+    estadisticas = {'expandidos': 0, 'generados': 0}
+    if es_meta(inicial):
+        return [inicial], 0, estadisticas
+
+    cola = deque([(inicial, clave_inicial)])  # Solo la frontera guarda estados completos
+    while cola:
+        estado, clave = cola.popleft()
+        estadisticas['expandidos'] += 1
+        for posicion, (sucesor, _) in enumerate(sucesores(estado)):
+            estadisticas['generados'] += 1
+            clave_sucesor = codificar(sucesor)
+            if clave_sucesor in padres:
+                continue
+            padres[clave_sucesor] = clave if reversible else (clave, posicion)
+            if es_meta(sucesor):
+                camino = reconstruir(padres, clave_sucesor)
+                return camino, len(camino) - 1, estadisticas
+            cola.append((sucesor, clave_sucesor))
+
+    return None, float('inf'), estadisticas
+
+
+def a_estrella_implicita(inicial, sucesores, es_meta, heuristica=None, codificador=None, cola='binaria'):
+    """
+    A* sobre un grafo implícito; sin heurística es búsqueda de costo uniforme.
+    La frontera es la cola indexada de cola_prioridad.py, con las claves compactas
+    como elementos, y se supone una heurística consistente (un estado cerrado no se reabre).
+    Retorna (camino, costo, estadisticas) o (None, inf, estadisticas).
+    """
+    codificar, decodificar, reconstruir = preparar_codificador(codificador, inicial, sucesores)
+    reversible = decodificar is not None
+    if heuristica is None:
+        heuristica = lambda estado: 0
+    clave_inicial = codificar(inicial)
+    padres = {clave_inicial: None}
+    costos = {clave_inicial: 0}
+    # Con un codificador reversible la frontera solo guarda claves y el estado se
+    # decodifica al extraerlo; si no, se guardan aparte los estados de la frontera
+    # (y se descartan al cerrarlos)
+    pendientes = None if reversible else {clave_inicial: inicial}
+    cerrados = set()
+    estadisticas = {'expandidos': 0, 'generados': 0}
+
+    frontera = crear_cola(cola)
+    prioridad = (lambda f, g: (f, g)) if cola == 'binaria' else (lambda f, g: f)
+    frontera.insertar(clave_inicial, prioridad(heuristica(inicial), 0))
+
+    while frontera:
+        clave, _ = frontera.extraer_min()
+        estado = decodificar(clave) if reversible else pendientes.pop(clave)
+        if es_meta(estado):
+            return reconstruir(padres, clave), costos[clave], estadisticas
+        cerrados.add(clave)
+        estadisticas['expandidos'] += 1
+
+        g = costos[clave]
+        for posicion, (sucesor, costo) in enumerate(sucesores(estado)):
+            estadisticas['generados'] += 1
+            clave_sucesor = codificar(sucesor)
+            nuevo_g = g + costo
+            if clave_sucesor in cerrados or nuevo_g >= costos.get(clave_sucesor, float('inf')):
+                continue
+            costos[clave_sucesor] = nuevo_g
+            padres[clave_sucesor] = clave if reversible else (clave, posicion)
+            if pendientes is not None:
+                pendientes[clave_sucesor] = sucesor
+            frontera.insertar_o_decrementar(clave_sucesor, prioridad(nuevo_g + heuristica(sucesor), nuevo_g))
+
+    return None, float('inf'), estadisticas
+
+
+def ucs_implicita(inicial, sucesores, es_meta, codificador=None, cola='binaria'):
+    """Búsqueda de costo uniforme sobre un grafo implícito (A* sin heurística)."""
+    return a_estrella_implicita(inicial, sucesores, es_meta, None, codificador, cola)
+
+
+def sucesores_de_grafo(grafo):
+    """Adapta un grafo de diccionarios (como los de 002 u 008) a la función sucesores."""
+    def sucesores(nodo):
+        vecinos = grafo.get(nodo, ())
+        if isinstance(vecinos, dict):
+            yield from vecinos.items()
+        else:
+            for vecino in vecinos:
+                yield vecino, 1
+    return sucesores
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    # Rompecabezas de las tortitas (pancakes) con n = 12: 12! ~ 4.8e8 estados, imposible de enumerar
+    n = 12
+
+    def voltear(estado):
+        # Cada movimiento invierte el prefijo de los primeros k elementos
+        for k in range(2, len(estado) + 1):
+            yield estado[:k][::-1] + estado[k:], 1
+
+    def huecos(estado):
+        # Heurística de huecos: pares vecinos que no son consecutivos (cada volteo arregla a lo más uno)
+        completo = estado + (len(estado),)
+        return sum(abs(a - b) != 1 for a, b in zip(completo, completo[1:]))
+
+    generador = random.Random(3)
+    inicial = tuple(generador.sample(range(n), n))
+    meta = tuple(range(n))
+
+    for nombre, codificador in (('tuplas', None),
+                                ('empaquetado', CodificadorEmpaquetado(n, n - 1)),
+                                ('Zobrist', CodificadorZobrist(n, range(n)))):
+        tracemalloc.start()
+        comienzo = time.perf_counter()
+        camino, costo, estadisticas = a_estrella_implicita(inicial, voltear, lambda e: e == meta,
+                                                           huecos, codificador)
+        segundos = time.perf_counter() - comienzo
+        _, pico = tracemalloc.get_traced_memory()  # Incluye la frontera, los padres y los costos
+        tracemalloc.stop()
+        assert camino[0] == inicial and camino[-1] == meta and len(camino) == costo + 1
+        print(f"A* con claves {nombre}: {costo} volteos, {estadisticas['expandidos']} expandidos "
+              f"en {segundos:.2f} s, pico de memoria {pico / 2**20:.1f} MB")
+
+    # BFS en el rompecabezas de 15 piezas: cada estado es una tupla de 16 casillas.
+    # Con Zobrist los estados cerrados no se guardan (solo su clave, la de su padre y
+    # la posición del movimiento); la frontera sí guarda estados completos
+    def deslizar(estado):
+        hueco = estado.index(0)
+        fila, columna = divmod(hueco, 4)
+        for df, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= fila + df < 4 and 0 <= columna + dc < 4:
+                casillas = list(estado)
+                destino = (fila + df) * 4 + columna + dc
+                casillas[hueco], casillas[destino] = casillas[destino], casillas[hueco]
+                yield tuple(casillas), 1
+
+    resuelto = tuple(range(16))
+    revuelto = resuelto
+    generador = random.Random(3)
+    for _ in range(34):  # Paseo al azar desde el estado resuelto
+        revuelto = generador.choice([sucesor for sucesor, _ in deslizar(revuelto)])
+    for nombre, codificador in (('tuplas', None),
+                                ('empaquetado', CodificadorEmpaquetado(16, 15)),
+                                ('Zobrist', CodificadorZobrist(16, range(16)))):
+        tracemalloc.start()
+        camino, pasos, estadisticas = bfs_implicita(revuelto, deslizar, lambda e: e == resuelto, codificador)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert camino[0] == revuelto and camino[-1] == resuelto
+        print(f"BFS (15 piezas) con claves {nombre}: {pasos} movimientos, {estadisticas['expandidos']} expandidos, "
+              f"pico de memoria {pico / 2**20:.1f} MB")
+
+    # Los grafos de diccionarios también se pueden recorrer con la misma interfaz
+    grafo = {'A': {'B': 1, 'C': 4}, 'B': {'C': 2, 'D': 5}, 'C': {'D': 1}, 'D': {}}
+    print("UCS en un grafo de diccionarios:", ucs_implicita('A', sucesores_de_grafo(grafo), lambda e: e == 'D')[:2])
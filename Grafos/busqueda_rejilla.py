@@ -0,0 +1,345 @@
+import heapq
+import math
+import numpy as np
+
+RAIZ2 = math.sqrt(2)
+
+class Rejilla:
+    """
+    Rejilla de ocupación guardada como un solo arreglo plano de bytes (1 = libre, 0 = pared).
+
+    Se agrega un borde de paredes alrededor, así que los vecinos de cualquier celda
+    libre siempre existen y no hace falta comprobar los límites en cada paso:
+    - la celda (i, j) tiene el índice plano k = (i + 1) * ancho + (j + 1)
+    - sus vecinos son k - ancho (arriba), k + ancho (abajo), k - 1 y k + 1
+
+    Nunca se construye un grafo de diccionarios: las búsquedas trabajan
+    directamente con los índices planos.
+    """
+    def __init__(self, laberinto):
+        celdas = np.asarray(laberinto)
+        self.filas, self.columnas = celdas.shape
+        self.ancho = self.columnas + 2
+        con_borde = np.zeros((self.filas + 2, self.ancho), dtype=np.uint8)
+        con_borde[1:-1, 1:-1] = celdas != 0
+        self.celdas = con_borde.ravel()  # Arreglo plano para las operaciones vectorizadas
+        self.libre = self.celdas.tobytes()  # Indexar bytes en Python es mucho más rápido que NumPy
+
+    def __len__(self):
+        return len(self.celdas)
+
+    def indice(self, celda):
+        """Índice plano de la celda (i, j)."""
+        i, j = celda
+        if not (0 <= i < self.filas and 0 <= j < self.columnas):
+            raise ValueError(f"La celda {celda} está fuera de la rejilla.")
+        return (i + 1) * self.ancho + (j + 1)
+
+    def celda(self, k):
+        """Celda (i, j) de un índice plano."""
+        i, j = divmod(int(k), self.ancho)
+        return (i - 1, j - 1)
+
+
+def como_rejilla(laberinto):
+    """Acepta una Rejilla, un arreglo de NumPy o una lista de listas."""
+    return laberinto if isinstance(laberinto, Rejilla) else Rejilla(laberinto)
+
+
+def reconstruir_camino_rejilla(rejilla, padres, k):
+    """Camino de celdas desde la raíz (padre -1) hasta el índice k."""
+    camino = []
+    while k != -1:
+        camino.append(rejilla.celda(k))
+        k = padres[k]
+    camino.reverse()
+    return camino
+
+
+def bfs_rejilla(laberinto, inicio, objetivo):
+    """
+    Camino más corto con movimientos en 4 direcciones.
+
+    Se avanza capa por capa con operaciones de NumPy sobre toda la frontera:
+    - visitados es un conjunto de bits (un bit por celda, 8 veces menos memoria que un bool)
+    - padres es un arreglo int32 con el índice plano del padre de cada celda
+    Retorna la lista de celdas del camino o None si no hay camino.
+    """
+    rejilla = como_rejilla(laberinto)
+    origen, destino = rejilla.indice(inicio), rejilla.indice(objetivo)
+    if not (rejilla.libre[origen] and rejilla.libre[destino]):
+        return None
+
+    visitados = np.zeros((len(rejilla) + 7) >> 3, dtype=np.uint8)
+    padres = np.full(len(rejilla), -1, dtype=np.int32)
+    pasos = np.array([-rejilla.ancho, rejilla.ancho, -1, 1])
+    frontera = np.array([origen])
+    marcar_bits(visitados, frontera)
+
+    while frontera.size and not leer_bits(visitados, np.array([destino]))[0]:
+        candidatos = (frontera[:, None] + pasos).ravel()
+        origenes = np.repeat(frontera, len(pasos))
+        # Solo celdas libres que no se han visitado (el borde de paredes evita salirse)
+        nuevos = rejilla.celdas[candidatos].astype(bool) & ~leer_bits(visitados, candidatos)
+        candidatos, origenes = candidatos[nuevos], origenes[nuevos]
+        # Una celda alcanzada desde varios padres se queda con el primero
+        candidatos, primeros = np.unique(candidatos, return_index=True)
+        padres[candidatos] = origenes[primeros]
+        marcar_bits(visitados, candidatos)
+        frontera = candidatos
+
+    if not leer_bits(visitados, np.array([destino]))[0]:
+        return None
+    return reconstruir_camino_rejilla(rejilla, padres, destino)
+
+
+def leer_bits(bits, indices):
+    """Arreglo booleano con el bit de cada índice."""
+    return ((bits[indices >> 3] >> (indices & 7).astype(np.uint8)) & 1).astype(bool)
+
+
+def marcar_bits(bits, indices):
+    """Enciende el bit de cada índice (bitwise_or.at acumula los que comparten byte)."""
+    np.bitwise_or.at(bits, indices >> 3, (1 << (indices & 7)).astype(np.uint8))
+
+
+def a_estrella_rejilla(laberinto, inicio, objetivo, diagonal=False):
+    """
+    A* sobre la rejilla con índices planos.
+    - diagonal=False: 4 direcciones con costo 1 y distancia Manhattan
+    - diagonal=True: 8 direcciones (diagonal con costo raíz de 2, sin cortar esquinas)
+      y distancia octil
+    Los cerrados son un conjunto de bits y los padres un arreglo int32.
+    Retorna (camino, costo) o (None, inf).
+    """
+    rejilla = como_rejilla(laberinto)
+    origen, destino = rejilla.indice(inicio), rejilla.indice(objetivo)
+    libre, ancho = rejilla.libre, rejilla.ancho
+    if not (libre[origen] and libre[destino]):
+        return None, float('inf')
+
+    heuristica = octil if diagonal else manhattan
+    fila_destino, columna_destino = divmod(destino, ancho)
+    cerrados = bytearray((len(rejilla) + 7) >> 3)
+    padres = np.full(len(rejilla), -1, dtype=np.int32)
+    costos = np.full(len(rejilla), np.inf)
+    costos[origen] = 0
+    rectos = (-ancho, ancho, -1, 1)
+    diagonales = ((-ancho - 1, -ancho, -1), (-ancho + 1, -ancho, 1),
+                  (ancho - 1, ancho, -1), (ancho + 1, ancho, 1))  # (paso, lados que deben estar libres)
+    cola = [(heuristica(origen, ancho, fila_destino, columna_destino), 0, origen)]
+
+    while cola:
+        _, g, k = heapq.heappop(cola)
+        if cerrados[k >> 3] >> (k & 7) & 1:
+            continue
+        if k == destino:
+            return reconstruir_camino_rejilla(rejilla, padres, k), g
+        cerrados[k >> 3] |= 1 << (k & 7)
+
+        sucesores = [(k + paso, 1) for paso in rectos]
+        if diagonal:
+            sucesores += [(k + paso, RAIZ2) for paso, lado1, lado2 in diagonales
+                          if libre[k + lado1] and libre[k + lado2]]
+        for vecino, costo in sucesores:
+            if not libre[vecino] or cerrados[vecino >> 3] >> (vecino & 7) & 1:
+                continue
+            nuevo_g = g + costo
+            if nuevo_g < costos[vecino]:
+                costos[vecino] = nuevo_g
+                padres[vecino] = k
+                f = nuevo_g + heuristica(vecino, ancho, fila_destino, columna_destino)
+                heapq.heappush(cola, (f, nuevo_g, vecino))
+
+    return None, float('inf')
+
+
+def manhattan(k, ancho, fila_destino, columna_destino):
+    fila, columna = divmod(k, ancho)
+    return abs(fila - fila_destino) + abs(columna - columna_destino)
+
+
+def octil(k, ancho, fila_destino, columna_destino):
+    fila, columna = divmod(k, ancho)
+    di, dj = abs(fila - fila_destino), abs(columna - columna_destino)
+    return max(di, dj) + (RAIZ2 - 1) * min(di, dj)
+
+
+def saltar_recto(libre, ancho, k, di, dj, destino):
+    """
+    Avanza en línea recta desde k hasta encontrar un punto de salto:
+    el destino o una celda con un vecino forzado (una pared a un lado que termina).
+    Retorna el índice del punto de salto o -1 si se choca con una pared.
+    """
+    paso = di * ancho + dj
+    lado = 1 if di else ancho  # Los dos lados perpendiculares a la dirección
+    while libre[k]:
+        if k == destino:
+            return k
+        if ((libre[k - lado] and not libre[k - lado - paso]) or
+                (libre[k + lado] and not libre[k + lado - paso])):
+            return k
+        k += paso
+    return -1
+
+
+def saltar(libre, ancho, k, di, dj, destino):
+    """
+    Salto de JPS desde la celda k en la dirección (di, dj), sin recursión.
+    En diagonal, la celda es punto de salto si desde ella alguno de los dos
+    saltos rectos encuentra algo; si no, se sigue en diagonal mientras los
+    dos lados estén libres (no se cortan esquinas).
+    """
+    if not (di and dj):
+        return saltar_recto(libre, ancho, k, di, dj, destino)
+    vertical, horizontal = di * ancho, dj
+    while libre[k]:
+        if k == destino:
+            return k
+        if (saltar_recto(libre, ancho, k + horizontal, 0, dj, destino) != -1 or
+                saltar_recto(libre, ancho, k + vertical, di, 0, destino) != -1):
+            return k
+        if not (libre[k + horizontal] and libre[k + vertical]):
+            return -1
+        k += vertical + horizontal
+    return -1
+
+
+def direcciones_podadas(libre, ancho, k, di, dj):
+    """
+    Direcciones que hay que explorar desde k al llegar moviéndose en (di, dj),
+    con las reglas de poda de JPS cuando no se permite cortar esquinas.
+    Sin dirección de llegada (el inicio) se exploran las 8.
+    """
+    if di == 0 and dj == 0:
+        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        direcciones += [(a, b) for a in (-1, 1) for b in (-1, 1)
+                        if libre[k + a * ancho] and libre[k + b]]
+        return direcciones
+
+    if di and dj:
+        vertical, horizontal = libre[k + di * ancho], libre[k + dj]
+        direcciones = []
+        if vertical:
+            direcciones.append((di, 0))
+        if horizontal:
+            direcciones.append((0, dj))
+        if vertical and horizontal:
+            direcciones.append((di, dj))
+        return direcciones
+
+    # Movimiento recto: además de seguir, se revisan los lados (vecinos forzados)
+    paso = di * ancho + dj
+    lado = 1 if di else ancho
+    a, b = (0, 1) if di else (1, 0)  # Dirección del lado positivo
+    siguiente = libre[k + paso]
+    lado_menos, lado_mas = libre[k - lado], libre[k + lado]
+    direcciones = []
+    if siguiente:
+        direcciones.append((di, dj))
+        if lado_mas:
+            direcciones.append((di + a, dj + b))
+        if lado_menos:
+            direcciones.append((di - a, dj - b))
+    if lado_mas:
+        direcciones.append((a, b))
+    if lado_menos:
+        direcciones.append((-a, -b))
+    return direcciones
+
+
+def jps(laberinto, inicio, objetivo):
+    """
+    Jump Point Search para rejillas de costo uniforme con 8 direcciones
+    (diagonal con costo raíz de 2, sin cortar esquinas), con las mismas reglas que
+    PathFinding.js. En lugar de meter cada celda a la cola, se salta en línea recta
+    hasta los puntos de salto, así que la frontera solo contiene unos pocos nodos;
+    por eso sus costos y padres se guardan en diccionarios y no en arreglos.
+
+    Retorna (camino, costo) con el camino celda por celda, o (None, inf).
+    El costo es el mismo que el de a_estrella_rejilla con diagonal=True.
+    """
+    rejilla = como_rejilla(laberinto)
+    origen, destino = rejilla.indice(inicio), rejilla.indice(objetivo)
+    libre, ancho = rejilla.libre, rejilla.ancho
+    if not (libre[origen] and libre[destino]):
+        return None, float('inf')
+
+    fila_destino, columna_destino = divmod(destino, ancho)
+    costos = {origen: 0}
+    padres = {origen: -1}
+    cerrados = set()
+    cola = [(octil(origen, ancho, fila_destino, columna_destino), 0, origen)]
+
+    while cola:
+        _, g, k = heapq.heappop(cola)
+        if k in cerrados:
+            continue
+        if k == destino:
+            return expandir_saltos(rejilla, padres, k), g
+        cerrados.add(k)
+
+        # Dirección de llegada desde el padre (0, 0 en el inicio)
+        di = dj = 0
+        if padres[k] != -1:
+            fila, columna = divmod(k, ancho)
+            fila_padre, columna_padre = divmod(padres[k], ancho)
+            di, dj = (fila > fila_padre) - (fila < fila_padre), (columna > columna_padre) - (columna < columna_padre)
+
+        for a, b in direcciones_podadas(libre, ancho, k, di, dj):
+            salto = saltar(libre, ancho, k + a * ancho + b, a, b, destino)
+            if salto == -1 or salto in cerrados:
+                continue
+            fila, columna = divmod(k, ancho)
+            fila_salto, columna_salto = divmod(salto, ancho)
+            distancia_i, distancia_j = abs(fila_salto - fila), abs(columna_salto - columna)
+            nuevo_g = g + max(distancia_i, distancia_j) + (RAIZ2 - 1) * min(distancia_i, distancia_j)
+            if nuevo_g < costos.get(salto, float('inf')):
+                costos[salto] = nuevo_g
+                padres[salto] = k
+                f = nuevo_g + octil(salto, ancho, fila_destino, columna_destino)
+                heapq.heappush(cola, (f, nuevo_g, salto))
+
+    return None, float('inf')
+
+
+def expandir_saltos(rejilla, padres, k):
+    """Convierte la cadena de puntos de salto en el camino completo celda por celda."""
+    saltos = []
+    while k != -1:
+        saltos.append(rejilla.celda(k))
+        k = padres[k]
+    saltos.reverse()
+
+    camino = [saltos[0]]
+    for (i1, j1), (i2, j2) in zip(saltos, saltos[1:]):
+        di, dj = (i2 > i1) - (i2 < i1), (j2 > j1) - (j2 < j1)
+        i, j = i1, j1
+        while (i, j) != (i2, j2):  # Cada salto es recto o diagonal puro
+            i, j = i + di, j + dj
+            camino.append((i, j))
+    return camino
+
+
+if __name__ == "__main__":
+    import time
+
+    # Rejilla de 1000 x 1000 con 25 % de paredes al azar y las esquinas libres
+    generador = np.random.default_rng(0)
+    mapa = (generador.random((1000, 1000)) > 0.25).astype(np.uint8)
+    mapa[:2, :2] = mapa[-2:, -2:] = 1
+    rejilla = Rejilla(mapa)
+    inicio, objetivo = (0, 0), (999, 999)
+
+    comienzo = time.perf_counter()
+    camino = bfs_rejilla(rejilla, inicio, objetivo)
+    print(f"BFS vectorizado: {len(camino) - 1 if camino else None} pasos "
+          f"en {time.perf_counter() - comienzo:.2f} s")
+
+    comienzo = time.perf_counter()
+    camino, costo = a_estrella_rejilla(rejilla, inicio, objetivo, diagonal=True)
+    print(f"A* con 8 direcciones: costo {costo:.2f} en {time.perf_counter() - comienzo:.2f} s")
+
+    comienzo = time.perf_counter()
+    camino, costo = jps(rejilla, inicio, objetivo)
+    print(f"JPS: costo {costo:.2f}, {len(camino)} celdas en {time.perf_counter() - comienzo:.2f} s")
@@ -0,0 +1,19 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+def cargar_script(prefijo):
+    """
+    Importa como módulo uno de los scripts numerados de esta carpeta (por ejemplo '002').
+    Sus nombres de archivo empiezan con dígitos, por lo que no se pueden importar con import.
+    """
+    nombre = f"script_{prefijo}"
+    if nombre in sys.modules:  # Cada script se carga una sola vez
+        return sys.modules[nombre]
+
+    ruta = next(Path(__file__).parent.glob(f"{prefijo}_*.py"))
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
@@ -0,0 +1,173 @@
+class ColaPrioridadIndexada:
+    """
+    Montículo binario mínimo indexado con operación de decremento de prioridad.
+
+    A diferencia de heapq, cada elemento aparece una sola vez en la cola:
+    si se encuentra un camino mejor hacia un nodo que ya está en la frontera,
+    se reduce su prioridad en el sitio (decrease-key) en lugar de insertar un
+    duplicado. Así el tamaño del montículo nunca supera el número de nodos.
+    """
+    def __init__(self):
+        self.prioridades = []  # Prioridad de cada posición del montículo
+        self.elementos = []  # Elemento guardado en cada posición del montículo
+        self.posicion = {}  # Elemento -> posición actual dentro del montículo
+
+    def __len__(self):
+        return len(self.elementos)
+
+    def __bool__(self):
+        return bool(self.elementos)
+
+    def __contains__(self, elemento):
+        return elemento in self.posicion
+
+    def prioridad(self, elemento):
+        """Prioridad actual de un elemento que está en la cola."""
+        return self.prioridades[self.posicion[elemento]]
+
+    def insertar(self, elemento, prioridad):
+        """Agrega un elemento nuevo a la cola."""
+        self.prioridades.append(prioridad)
+        self.elementos.append(elemento)
+        self.posicion[elemento] = len(self.elementos) - 1
+        self._subir(len(self.elementos) - 1)
+
+    def decrementar(self, elemento, prioridad):
+        """Reduce la prioridad de un elemento que ya está en la cola."""
+        i = self.posicion[elemento]
+        self.prioridades[i] = prioridad
+        self._subir(i)
+
+    def insertar_o_decrementar(self, elemento, prioridad):
+        """
+        Inserta el elemento o reduce su prioridad si la nueva es menor.
+        Retorna True si la cola cambió (útil para actualizar el padre del nodo).
+        """
+        if elemento not in self.posicion:
+            self.insertar(elemento, prioridad)
+            return True
+        if prioridad < self.prioridades[self.posicion[elemento]]:
+            self.decrementar(elemento, prioridad)
+            return True
+        return False
+
+    def extraer_min(self):
+        """Extrae y retorna (elemento, prioridad) con la menor prioridad."""
+        elemento, prioridad = self.elementos[0], self.prioridades[0]
+        ultimo_elemento, ultima_prioridad = self.elementos.pop(), self.prioridades.pop()
+        del self.posicion[elemento]
+        if self.elementos:  # Se mueve el último elemento a la raíz y se hunde
+            self.elementos[0], self.prioridades[0] = ultimo_elemento, ultima_prioridad
+            self.posicion[ultimo_elemento] = 0
+            self._bajar(0)
+        return elemento, prioridad
+
+    def _subir(self, i):
+        prioridades, elementos, posicion = self.prioridades, self.elementos, self.posicion
+        elemento, prioridad = elementos[i], prioridades[i]
+        while i > 0:
+            padre = (i - 1) >> 1
+            if not prioridad < prioridades[padre]:
+                break
+            # El padre baja a la posición i
+            prioridades[i], elementos[i] = prioridades[padre], elementos[padre]
+            posicion[elementos[i]] = i
+            i = padre
+        prioridades[i], elementos[i] = prioridad, elemento
+        posicion[elemento] = i
+
+    def _bajar(self, i):
+        prioridades, elementos, posicion = self.prioridades, self.elementos, self.posicion
+        n = len(elementos)
+        elemento, prioridad = elementos[i], prioridades[i]
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and prioridades[hijo + 1] < prioridades[hijo]:
+                hijo += 1  # Se elige el hijo con menor prioridad
+            if not prioridades[hijo] < prioridad:
+                break
+            prioridades[i], elementos[i] = prioridades[hijo], elementos[hijo]
+            posicion[elementos[i]] = i
+            i = hijo
+        prioridades[i], elementos[i] = prioridad, elemento
+        posicion[elemento] = i
+
+
+class ColaCubetas:
+    """
+    Cola de cubetas (algoritmo de Dial) para prioridades enteras no negativas.
+
+    Cada prioridad tiene su propia cubeta y un cursor avanza sobre ellas en
+    orden creciente. Sirve cuando los costos de las aristas son enteros y evita
+    por completo las comparaciones del montículo. Es más eficiente cuando las
+    prioridades extraídas nunca disminuyen (Dijkstra/UCS, o A* con heurística
+    consistente); si una prioridad menor llega después, el cursor retrocede.
+    """
+    def __init__(self):
+        self.cubetas = {}  # Prioridad -> dict ordenado de elementos (inserción FIFO)
+        self.prioridades = {}  # Elemento -> prioridad actual
+        self.cursor = 0  # Menor prioridad que puede tener una cubeta no vacía
+
+    def __len__(self):
+        return len(self.prioridades)
+
+    def __bool__(self):
+        return bool(self.prioridades)
+
+    def __contains__(self, elemento):
+        return elemento in self.prioridades
+
+    def prioridad(self, elemento):
+        return self.prioridades[elemento]
+
+    def insertar(self, elemento, prioridad):
+        if prioridad != int(prioridad) or prioridad < 0:
+            raise ValueError("ColaCubetas requiere prioridades enteras no negativas.")
+        prioridad = int(prioridad)
+        self.cursor = min(self.cursor, prioridad)
+        self.prioridades[elemento] = prioridad
+        self.cubetas.setdefault(prioridad, {})[elemento] = None
+
+    def decrementar(self, elemento, prioridad):
+        anterior = self.prioridades[elemento]
+        del self.cubetas[anterior][elemento]  # Se saca de su cubeta actual en O(1)
+        if not self.cubetas[anterior]:
+            del self.cubetas[anterior]
+        self.insertar(elemento, prioridad)
+
+    def insertar_o_decrementar(self, elemento, prioridad):
+        if elemento not in self.prioridades:
+            self.insertar(elemento, prioridad)
+            return True
+        if prioridad < self.prioridades[elemento]:
+            self.decrementar(elemento, prioridad)
+            return True
+        return False
+
+    def extraer_min(self):
+        if self.cursor not in self.cubetas:
+            # Se salta a la primera cubeta no vacía; con costos enteros acotados por C
+            # nunca hay más de C + 1 cubetas pendientes, como en el algoritmo de Dial
+            self.cursor = min(self.cubetas)
+        cubeta = self.cubetas[self.cursor]
+        elemento = next(iter(cubeta))
+        del cubeta[elemento]
+        if not cubeta:
+            del self.cubetas[self.cursor]
+        del self.prioridades[elemento]
+        return elemento, self.cursor
+
+
+def crear_cola(tipo='binaria'):
+    """
+    Crea la cola de prioridad indicada:
+    - 'binaria': montículo binario indexado (cualquier prioridad comparable)
+    - 'cubetas': cola de cubetas para costos enteros
+    """
+    if tipo == 'binaria':
+        return ColaPrioridadIndexada()
+    if tipo == 'cubetas':
+        return ColaCubetas()
+    raise ValueError(f"Tipo de cola desconocido: {tipo!r}")
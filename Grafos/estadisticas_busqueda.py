@@ -0,0 +1,186 @@
+"""
+Estadísticas opcionales para las búsquedas de 002 a 010.
+
+Cada búsqueda acepta el argumento 'estadisticas' (None por defecto). Si se pasa un
+objeto EstadisticasBusqueda, la búsqueda cuenta:
+- expandidos: nodos cuyos vecinos se revisaron
+- generados: sucesores listados al expandir esos nodos
+- duplicados: sucesores generados que ya se habían descubierto (se descartan o solo
+  mejoran su prioridad en la cola)
+- frontera_maxima: tamaño máximo de la frontera (cola, pila o camino de la recursión),
+  medido al sacar cada nodo y después de agregar sus sucesores
+- evaluaciones_heuristica: llamadas a la heurística
+- tiempos: segundos en cada fase ('preparacion', 'busqueda', 'reconstruccion')
+
+Con estadisticas=None el costo es de dos comparaciones 'is not None' por nodo expandido
+(nunca por vecino) y una llamada extra por búsqueda; la demo de abajo lo mide.
+"""
+import functools
+import time
+
+class EstadisticasBusqueda:
+    """Contadores de una o varias búsquedas (se acumulan si se reutiliza el objeto)."""
+    __slots__ = ('expandidos', 'generados', 'duplicados', 'frontera_maxima', 'evaluaciones_heuristica',
+                 'tiempos', 'fase_actual', 'inicio_fase', 'nuevos', 'generados_base', 'en_curso')
+
+    def __init__(self):
+        self.expandidos = 0
+        self.generados = 0
+        self.duplicados = 0
+        self.frontera_maxima = 0
+        self.evaluaciones_heuristica = 0
+        self.tiempos = {}  # Fase -> segundos
+        self.fase_actual = None
+        self.inicio_fase = 0.0
+        self.nuevos = None  # Función que da los nodos descubiertos por la búsqueda en curso
+        self.generados_base = 0
+        self.en_curso = False
+
+    def expansion(self, frontera, generados, nodos=1):
+        """
+        Registra 'nodos' expandidos (más de uno en las búsquedas que expanden capas
+        completas) con 'generados' sucesores en total y el tamaño actual de la frontera.
+        """
+        self.expandidos += nodos
+        self.generados += generados
+        if frontera > self.frontera_maxima:
+            self.frontera_maxima = frontera
+
+    def medir_frontera(self, tamano):
+        """Registra el tamaño de la frontera después de agregar los sucesores de un nodo."""
+        if tamano > self.frontera_maxima:
+            self.frontera_maxima = tamano
+
+    def fase(self, nombre):
+        """Cierra la fase en curso y empieza 'nombre' (None solo cierra)."""
+        ahora = time.perf_counter()
+        if self.fase_actual is not None:
+            self.tiempos[self.fase_actual] = self.tiempos.get(self.fase_actual, 0.0) + ahora - self.inicio_fase
+        self.fase_actual = nombre
+        self.inicio_fase = ahora
+
+    def vigilar(self, nuevos):
+        """
+        'nuevos()' debe dar cuántos nodos, sin contar los de partida, ha descubierto la
+        búsqueda (por ejemplo lambda: len(padres) - 1). Al terminar se calcula
+        duplicados = generados - nuevos, sin contar nada dentro del ciclo de vecinos.
+        Una búsqueda que reinicia sus visitados (como la profundización iterativa)
+        vuelve a llamar a vigilar en cada iteración.
+        """
+        self.cerrar_vigilancia()
+        self.nuevos = nuevos
+        self.generados_base = self.generados
+
+    def cerrar_vigilancia(self):
+        if self.nuevos is not None:
+            self.duplicados += max(0, self.generados - self.generados_base - self.nuevos())
+            self.nuevos = None
+
+    def contar_heuristica(self, heuristica):
+        """Envuelve la heurística (diccionario o función) para contar sus evaluaciones."""
+        return HeuristicaContada(heuristica, self)
+
+    def iniciar(self):
+        self.en_curso = True
+        self.nuevos = None
+        self.fase('preparacion')
+
+    def terminar(self):
+        self.fase(None)
+        self.cerrar_vigilancia()
+        self.en_curso = False
+
+    def resultado(self):
+        """Diccionario con todos los contadores y los tiempos por fase."""
+        return {'expandidos': self.expandidos, 'generados': self.generados, 'duplicados': self.duplicados,
+                'frontera_maxima': self.frontera_maxima,
+                'evaluaciones_heuristica': self.evaluaciones_heuristica,
+                'tiempos': dict(self.tiempos)}
+
+    def __repr__(self):
+        return f"EstadisticasBusqueda({self.resultado()})"
+
+
+class HeuristicaContada:
+    """Heurística que cuenta sus evaluaciones; se usa como h(nodo) o h[nodo]."""
+    __slots__ = ('evaluar', 'estadisticas')
+
+    def __init__(self, heuristica, estadisticas):
+        self.evaluar = heuristica if callable(heuristica) else heuristica.__getitem__
+        self.estadisticas = estadisticas
+
+    def __call__(self, nodo):
+        self.estadisticas.evaluaciones_heuristica += 1
+        return self.evaluar(nodo)
+
+    __getitem__ = __call__
+
+
+def con_estadisticas(busqueda):
+    """
+    Decorador para las búsquedas con argumento 'estadisticas': abre la fase
+    'preparacion' al entrar y cierra la fase en curso al salir, por cualquier return.
+    Si la búsqueda llama a otra búsqueda decorada (por ejemplo la versión CSR),
+    solo la de afuera abre y cierra las fases. Sin estadísticas llama directo.
+    """
+    @functools.wraps(busqueda)
+    def envoltura(*argumentos, estadisticas=None, **opciones):
+        if estadisticas is None or estadisticas.en_curso:
+            return busqueda(*argumentos, estadisticas=estadisticas, **opciones)
+        estadisticas.iniciar()
+        try:
+            return busqueda(*argumentos, estadisticas=estadisticas, **opciones)
+        finally:
+            estadisticas.terminar()
+    return envoltura
+
+
+if __name__ == "__main__":
+    import random
+    import timeit
+    from cargar_script import cargar_script
+
+    # Rejilla de 300 x 300 con 20 % de obstáculos, como dict de dicts (costo 1)
+    generador = random.Random(0)
+    lado = 300
+    libres = {(i, j) for i in range(lado) for j in range(lado) if generador.random() >= 0.2}
+    libres |= {(0, 0), (lado - 1, lado - 1)}
+    grafo = {(i, j): {(i + di, j + dj): 1 for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                      if (i + di, j + dj) in libres}
+             for i, j in libres}
+    inicio, meta = (0, 0), (lado - 1, lado - 1)
+    manhattan = {(i, j): abs(i - meta[0]) + abs(j - meta[1]) for i, j in grafo}
+    inverso = cargar_script('006').invertir_grafo(grafo)  # Se prepara una vez para todas las consultas
+
+    busquedas = {
+        'BFS (007)': lambda e: cargar_script('007').bfs(grafo, inicio, meta, estadisticas=e),
+        'UCS (002)': lambda e: cargar_script('002').busqueda_costo_uniforme(grafo, inicio, meta, estadisticas=e),
+        'A* (008)': lambda e: cargar_script('008').a_star(grafo, inicio, meta, manhattan, estadisticas=e),
+        'Voraz (009)': lambda e: cargar_script('009').busqueda_voraz(grafo, inicio, meta, manhattan, estadisticas=e),
+        'Bidireccional (006)': lambda e: cargar_script('006').busqueda_bidireccional(grafo, inicio, meta, inverso,
+                                                                                     estadisticas=e),
+    }
+
+    # Costo del gancho desactivado: una llamada extra por búsqueda (el decorador)
+    # y dos comparaciones 'is not None' por nodo expandido
+    vacia = lambda estadisticas=None: None
+    repeticiones = 200_000
+    llamada = (min(timeit.repeat(con_estadisticas(vacia), number=repeticiones, repeat=5))
+               - min(timeit.repeat(vacia, number=repeticiones, repeat=5))) / repeticiones
+    comparacion = min(timeit.repeat('x is not None', setup='x = None', number=repeticiones, repeat=5)) / repeticiones
+
+    for nombre, buscar in busquedas.items():
+        desactivado = min(timeit.repeat(lambda: buscar(None), number=1, repeat=5))
+        activado = float('inf')
+        for _ in range(5):  # Un objeto nuevo por ejecución para que los contadores no se acumulen
+            estadisticas = EstadisticasBusqueda()
+            comienzo = time.perf_counter()
+            buscar(estadisticas)
+            activado = min(activado, time.perf_counter() - comienzo)
+        gancho = llamada + 2 * comparacion * estadisticas.expandidos
+        print(f"{nombre}: {1000 * desactivado:.1f} ms sin estadísticas "
+              f"(gancho desactivado ~{1e6 * gancho:.0f} us = {100 * gancho / desactivado:.2f} %), "
+              f"{1000 * activado:.1f} ms con estadísticas (+{100 * (activado / desactivado - 1):.0f} %)")
+        resultado = estadisticas.resultado()
+        tiempos = ', '.join(f"{fase} {1000 * segundos:.1f} ms" for fase, segundos in resultado.pop('tiempos').items())
+        print("  " + ', '.join(f"{clave} {valor}" for clave, valor in resultado.items()) + f"; {tiempos}")
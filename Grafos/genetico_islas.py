@@ -0,0 +1,298 @@
+"""
+Algoritmo genético en paralelo, para funciones de aptitud costosas (por ejemplo
+cuando cada evaluación es una simulación).
+
+Dos modos:
+- Modelo de islas (algoritmo_genetico_islas): cada isla es una subpoblación que
+  evoluciona en su propio proceso con el motor de genetico_vectorizado.py. Cada
+  'intervalo_migracion' generaciones, todas las islas copian sus mejores individuos
+  a un tablero en memoria compartida y reciben los de la isla anterior (anillo).
+- Maestro-trabajadores (EvaluadorParalelo): el algoritmo corre en el proceso
+  principal y solo la evaluación de la aptitud se reparte entre un grupo de procesos.
+
+Cada isla tiene su propio generador, derivado de la semilla con SeedSequence.spawn,
+así que el resultado no depende del orden en que el sistema ejecute los procesos
+y es el mismo con paralelo=False (todas las islas en el proceso principal).
+"""
+import multiprocessing
+import os
+import threading
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from genetico_vectorizado import siguiente_generacion
+
+class TableroMigracion:
+    """
+    Migrantes de todas las islas en memoria compartida: individuos[isla] tiene los
+    'migrantes' mejores individuos de la isla y aptitudes[isla] sus aptitudes, para
+    que quien los recibe no tenga que evaluarlos de nuevo.
+    """
+    def __init__(self, islas, migrantes, longitud, tipo, nombres=None):
+        tipo = np.dtype(tipo)
+        formas = ((islas, migrantes, longitud), (islas, migrantes))
+        tamanos = (islas * migrantes * longitud * tipo.itemsize, islas * migrantes * 8)
+        self.creador = nombres is None
+        if self.creador:
+            self.memorias = [shared_memory.SharedMemory(create=True, size=max(1, tamano)) for tamano in tamanos]
+        else:  # Proceso de una isla: se conecta a la memoria que creó el principal
+            self.memorias = [shared_memory.SharedMemory(name=nombre) for nombre in nombres]
+        self.individuos = np.ndarray(formas[0], dtype=tipo, buffer=self.memorias[0].buf)
+        self.aptitudes = np.ndarray(formas[1], dtype=np.float64, buffer=self.memorias[1].buf)
+        self.datos = (islas, migrantes, longitud, tipo.str, [memoria.name for memoria in self.memorias])
+
+    @classmethod
+    def conectar(cls, datos):
+        islas, migrantes, longitud, tipo, nombres = datos
+        return cls(islas, migrantes, longitud, tipo, nombres)
+
+    def publicar(self, isla, poblacion, aptitudes):
+        """Copia al tablero los mejores individuos de la isla."""
+        migrantes = self.aptitudes.shape[1]
+        mejores = np.argpartition(aptitudes, len(aptitudes) - migrantes)[len(aptitudes) - migrantes:]
+        self.individuos[isla] = poblacion[mejores]
+        self.aptitudes[isla] = aptitudes[mejores]
+
+    def recibir(self, isla, poblacion, aptitudes):
+        """Reemplaza a los peores individuos de la isla por los migrantes de la isla anterior."""
+        origen = (isla - 1) % len(self.aptitudes)
+        migrantes = self.aptitudes.shape[1]
+        peores = np.argpartition(aptitudes, migrantes - 1)[:migrantes]
+        poblacion[peores] = self.individuos[origen]
+        aptitudes[peores] = self.aptitudes[origen]
+
+    def cerrar(self):
+        del self.individuos, self.aptitudes  # Los arreglos deben soltar la memoria antes de cerrarla
+        for memoria in self.memorias:
+            memoria.close()
+            if self.creador:
+                memoria.unlink()
+
+
+class Isla:
+    """Subpoblación con su propio generador de números aleatorios."""
+    def __init__(self, aptitud, genoma, tamano, semilla, opciones):
+        self.aptitud = aptitud
+        self.genoma = genoma
+        self.opciones = opciones  # seleccion, prob_cruce, prob_mutacion, elite
+        self.generador = np.random.default_rng(semilla)
+        self.poblacion = genoma.aleatorios(tamano, self.generador)
+        self.aptitudes = np.asarray(aptitud(self.poblacion), dtype=np.float64)
+        self.historial = [float(self.aptitudes.max())]
+
+    def evolucionar(self, generaciones):
+        for _ in range(generaciones):
+            self.poblacion = siguiente_generacion(self.poblacion, self.aptitudes, self.genoma,
+                                                  self.generador, **self.opciones)
+            self.aptitudes = np.asarray(self.aptitud(self.poblacion), dtype=np.float64)
+            self.historial.append(float(self.aptitudes.max()))
+
+    def resultado(self):
+        mejor = np.argmax(self.aptitudes)
+        return self.poblacion[mejor], self.aptitudes[mejor], self.historial
+
+
+def epocas(generaciones, intervalo_migracion):
+    """Generaciones de cada época; entre una época y la siguiente hay una migración."""
+    completas, resto = divmod(generaciones, intervalo_migracion)
+    return [intervalo_migracion] * completas + ([resto] if resto else [])
+
+
+def evolucionar_isla(indice, argumentos, datos_tablero, barrera, resultados):
+    """
+    Proceso de una isla. En cada época: evoluciona, publica sus mejores individuos,
+    espera a que todas publiquen, recibe los de la isla anterior y vuelve a esperar
+    para que nadie sobrescriba el tablero mientras otra isla todavía lo lee.
+    """
+    tablero = None
+    try:
+        aptitud, genoma, tamano, semilla, generaciones, intervalo, opciones = argumentos
+        tablero = TableroMigracion.conectar(datos_tablero)
+        isla = Isla(aptitud, genoma, tamano, semilla, opciones)
+        periodos = epocas(generaciones, intervalo)
+        for numero, cantidad in enumerate(periodos):
+            isla.evolucionar(cantidad)
+            if numero < len(periodos) - 1:
+                tablero.publicar(indice, isla.poblacion, isla.aptitudes)
+                barrera.wait()
+                tablero.recibir(indice, isla.poblacion, isla.aptitudes)
+                barrera.wait()
+        resultados.put((indice, isla.resultado()))
+    except threading.BrokenBarrierError:  # Otra isla falló y ya envió su error
+        resultados.put((indice, None))
+    except Exception as error:
+        barrera.abort()  # Las demás islas dejan de esperar en la barrera
+        resultados.put((indice, error))
+    finally:
+        if tablero is not None:
+            tablero.cerrar()
+
+
+def algoritmo_genetico_islas(aptitud, genoma, islas=4, tamano_isla=1000, generaciones=100, intervalo_migracion=10,
+                             migrantes=2, semilla=None, paralelo=True, **opciones):
+    """
+    Modelo de islas: 'islas' subpoblaciones de tamano_isla individuos que migran sus
+    'migrantes' mejores a la isla siguiente cada intervalo_migracion generaciones.
+    - aptitud: función vectorizada como en algoritmo_genetico_vectorizado (con
+      paralelo=True debe poder enviarse a otro proceso: una función de módulo, no una lambda,
+      salvo que el método de inicio sea fork)
+    - paralelo: True = un proceso por isla, False = todas las islas en este proceso
+    - opciones: seleccion, prob_cruce, prob_mutacion, elite (ver siguiente_generacion)
+
+    Retorna (mejor_individuo, mejor_aptitud, historiales), con el historial de
+    mejores aptitudes de cada isla.
+    """
+    semillas = np.random.SeedSequence(semilla).spawn(islas)  # Una semilla independiente por isla
+    migrantes = min(migrantes, tamano_isla)
+
+    if not paralelo:
+        poblaciones = [Isla(aptitud, genoma, tamano_isla, semillas[i], opciones) for i in range(islas)]
+        tablero = TableroMigracion(islas, migrantes, genoma.longitud, genoma.tipo)
+        try:
+            periodos = epocas(generaciones, intervalo_migracion)
+            for numero, cantidad in enumerate(periodos):
+                for isla in poblaciones:
+                    isla.evolucionar(cantidad)
+                if numero < len(periodos) - 1:  # Mismo orden que con procesos: todas publican y luego reciben
+                    for indice, isla in enumerate(poblaciones):
+                        tablero.publicar(indice, isla.poblacion, isla.aptitudes)
+                    for indice, isla in enumerate(poblaciones):
+                        tablero.recibir(indice, isla.poblacion, isla.aptitudes)
+        finally:
+            tablero.cerrar()
+        resultados = [isla.resultado() for isla in poblaciones]
+    else:
+        resultados = islas_en_procesos(aptitud, genoma, islas, tamano_isla, generaciones, intervalo_migracion,
+                                       migrantes, semillas, opciones)
+
+    mejor = max(range(islas), key=lambda i: resultados[i][1])
+    return resultados[mejor][0], resultados[mejor][1], [historial for _, _, historial in resultados]
+
+
+def islas_en_procesos(aptitud, genoma, islas, tamano_isla, generaciones, intervalo_migracion, migrantes, semillas,
+                      opciones):
+    """Lanza un proceso por isla y retorna la lista de resultados ordenada por isla."""
+    tablero = TableroMigracion(islas, migrantes, genoma.longitud, genoma.tipo)
+    barrera = multiprocessing.Barrier(islas)
+    cola = multiprocessing.Queue()
+    trabajadores = []
+    try:
+        for indice in range(islas):
+            argumentos = (aptitud, genoma, tamano_isla, semillas[indice], generaciones, intervalo_migracion, opciones)
+            trabajador = multiprocessing.Process(target=evolucionar_isla,
+                                                 args=(indice, argumentos, tablero.datos, barrera, cola))
+            trabajador.start()
+            trabajadores.append(trabajador)
+        # Se vacía la cola antes de join: un proceso no termina mientras tenga datos sin entregar
+        resultados = dict(cola.get() for _ in range(islas))
+        for trabajador in trabajadores:
+            trabajador.join()
+    finally:
+        for trabajador in trabajadores:
+            if trabajador.is_alive():
+                trabajador.terminate()
+        tablero.cerrar()
+
+    for resultado in resultados.values():
+        if isinstance(resultado, Exception):
+            raise resultado
+    return [resultados[indice] for indice in range(islas)]
+
+
+class EvaluadorParalelo:
+    """
+    Modo maestro-trabajadores: reparte la evaluación de la aptitud entre un grupo de
+    procesos. Se usa como la función de aptitud de algoritmo_genetico_vectorizado,
+    que sigue corriendo en el proceso principal (y con su misma semilla da el mismo
+    resultado que en serie).
+    - aptitud: función de módulo (debe poder enviarse a los procesos)
+    - vectorizada=False: aptitud recibe un individuo y retorna un número, como
+      funcion_aptitud de 015; cada trabajador la aplica a las filas de su bloque
+    - bloques_por_proceso: más bloques reparten mejor la carga si el costo varía
+    """
+    def __init__(self, aptitud, procesos=None, vectorizada=True, bloques_por_proceso=4):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.bloques = self.procesos * bloques_por_proceso
+        self.grupo = Pool(self.procesos, initializer=iniciar_evaluador, initargs=(aptitud, vectorizada))
+
+    def __call__(self, poblacion):
+        bloques = np.array_split(poblacion, min(self.bloques, len(poblacion)))
+        return np.concatenate(self.grupo.map(evaluar_bloque, bloques))
+
+    def cerrar(self):
+        self.grupo.close()
+        self.grupo.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# Función de aptitud de cada proceso trabajador (se recibe una sola vez al crear el proceso)
+aptitud_trabajador = None
+
+def iniciar_evaluador(aptitud, vectorizada):
+    global aptitud_trabajador
+    if vectorizada:
+        aptitud_trabajador = aptitud
+    else:
+        aptitud_trabajador = lambda bloque: np.array([aptitud(individuo) for individuo in bloque], dtype=np.float64)
+
+
+def evaluar_bloque(bloque):
+    return aptitud_trabajador(bloque)
+
+
+def simulacion(poblacion):
+    """
+    Aptitud costosa de ejemplo: cada individuo son las 8 ganancias de un controlador
+    que se simula 200 pasos; la aptitud es menos el error acumulado al seguir una
+    referencia. El ciclo de la simulación es secuencial, como en una simulación real.
+    """
+    estado = np.zeros(len(poblacion))
+    velocidad = np.zeros(len(poblacion))
+    error_total = np.zeros(len(poblacion))
+    for paso in range(200):
+        referencia = np.sin(paso / 20)
+        error = referencia - estado
+        fuerza = (poblacion[:, 0] * error - poblacion[:, 1] * velocidad
+                  + poblacion[:, 2:].sum(axis=1) * 0.01 * np.tanh(poblacion[:, 3] * error))
+        velocidad += 0.1 * (fuerza - 0.5 * velocidad)
+        estado += 0.1 * velocidad
+        error_total += error ** 2
+    return -error_total
+
+
+if __name__ == "__main__":
+    import time
+    from genetico_vectorizado import GenomaReal, algoritmo_genetico_vectorizado
+
+    genoma = GenomaReal(8, -5, 5)
+    procesos = os.cpu_count()
+    print(f"Núcleos disponibles: {procesos}")
+
+    # Modelo de islas: 4 islas de 2000 individuos, migración cada 5 generaciones
+    for paralelo in (False, True):
+        inicio = time.perf_counter()
+        mejor, aptitud, historiales = algoritmo_genetico_islas(simulacion, genoma, islas=4, tamano_isla=2000,
+                                                               generaciones=30, intervalo_migracion=5,
+                                                               semilla=0, paralelo=paralelo)
+        print(f"Islas con paralelo={paralelo}: {time.perf_counter() - inicio:.2f} s, mejor aptitud {aptitud:.3f}, "
+              f"mejor de cada isla {[round(historial[-1], 3) for historial in historiales]}")
+        if not paralelo:
+            serie = aptitud
+    assert aptitud == serie  # La misma semilla da el mismo resultado con o sin procesos
+
+    # Maestro-trabajadores: solo la aptitud se evalúa en paralelo
+    inicio = time.perf_counter()
+    _, en_serie, _ = algoritmo_genetico_vectorizado(simulacion, genoma, tamano_poblacion=8000, generaciones=30,
+                                                    semilla=0)
+    tiempo_serie = time.perf_counter() - inicio
+    with EvaluadorParalelo(simulacion, procesos=procesos) as evaluador:
+        inicio = time.perf_counter()
+        _, en_paralelo, _ = algoritmo_genetico_vectorizado(evaluador, genoma, tamano_poblacion=8000,
+                                                           generaciones=30, semilla=0)
+    print(f"Maestro-trabajadores: {time.perf_counter() - inicio:.2f} s con {procesos} procesos, "
+          f"{tiempo_serie:.2f} s en serie (mejor aptitud {en_paralelo:.3f} en ambos)")
+    assert en_serie == en_paralelo
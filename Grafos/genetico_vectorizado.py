@@ -0,0 +1,204 @@
+"""
+Algoritmo genético con la población guardada en un arreglo de NumPy.
+
+La población es una matriz (individuos x genes) y cada operador trabaja sobre
+toda la matriz a la vez:
+- aptitud(poblacion) recibe la matriz completa y retorna un arreglo con una
+  aptitud por individuo (se maximiza), así que se evalúa una vez por generación
+- selección por torneo o muestreo estocástico universal (SUS), ambas O(N)
+- cruce y mutación con máscaras aleatorias sobre la matriz
+- elitismo: los mejores individuos pasan sin cambios a la siguiente generación
+
+Los genomas definen cómo se crean, se cruzan y se mutan los individuos:
+GenomaReal (valores reales acotados), GenomaEntero (enteros acotados) y
+GenomaBits (cadenas de bits).
+"""
+import numpy as np
+
+class GenomaReal:
+    """
+    Genes reales entre 'inferior' y 'superior' (escalares o arreglos por gen).
+    - cruce BLX-alfa: cada gen del hijo se elige al azar en el intervalo de los
+      padres extendido en alfa veces su ancho
+    - mutación gaussiana con desviación escala_mutacion * (superior - inferior)
+    """
+    tipo = np.float64
+
+    def __init__(self, longitud, inferior, superior, alfa=0.5, escala_mutacion=0.1):
+        self.longitud = longitud
+        self.inferior = np.broadcast_to(np.asarray(inferior, dtype=self.tipo), (longitud,))
+        self.superior = np.broadcast_to(np.asarray(superior, dtype=self.tipo), (longitud,))
+        self.alfa = alfa
+        self.escala_mutacion = escala_mutacion
+
+    def aleatorios(self, cantidad, generador):
+        return generador.uniform(self.inferior, self.superior, (cantidad, self.longitud))
+
+    def cruzar(self, padres1, padres2, generador):
+        menor, mayor = np.minimum(padres1, padres2), np.maximum(padres1, padres2)
+        extension = self.alfa * (mayor - menor)
+        hijos1 = generador.uniform(menor - extension, mayor + extension)
+        hijos2 = generador.uniform(menor - extension, mayor + extension)
+        return self.acotar(hijos1), self.acotar(hijos2)
+
+    def mutar(self, poblacion, prob_mutacion, generador):
+        filas, columnas = genes_a_mutar(poblacion.shape, prob_mutacion, generador)
+        desviacion = self.escala_mutacion * (self.superior - self.inferior)[columnas]
+        poblacion[filas, columnas] += generador.normal(0.0, desviacion)
+        poblacion[filas, columnas] = np.clip(poblacion[filas, columnas],
+                                             self.inferior[columnas], self.superior[columnas])
+
+    def acotar(self, poblacion):
+        return np.clip(poblacion, self.inferior, self.superior, out=poblacion)
+
+
+class GenomaEntero(GenomaReal):
+    """
+    Genes enteros entre 'inferior' y 'superior' (incluidos).
+    - cruce uniforme: cada gen se toma de uno de los dos padres al azar
+    - mutación: se suma un entero al azar entre -paso y paso
+    """
+    tipo = np.int64
+
+    def __init__(self, longitud, inferior, superior, paso=3):
+        super().__init__(longitud, inferior, superior)
+        self.paso = paso
+
+    def aleatorios(self, cantidad, generador):
+        return generador.integers(self.inferior, self.superior, (cantidad, self.longitud), endpoint=True)
+
+    def cruzar(self, padres1, padres2, generador):
+        return cruce_uniforme(padres1, padres2, generador)
+
+    def mutar(self, poblacion, prob_mutacion, generador):
+        filas, columnas = genes_a_mutar(poblacion.shape, prob_mutacion, generador)
+        poblacion[filas, columnas] += generador.integers(-self.paso, self.paso, len(filas), endpoint=True)
+        poblacion[filas, columnas] = np.clip(poblacion[filas, columnas],
+                                             self.inferior[columnas], self.superior[columnas])
+
+
+class GenomaBits:
+    """
+    Cadena de 'longitud' bits guardada como uint8 (0 o 1).
+    - cruce de un punto: el hijo toma los genes de un padre hasta un corte al azar
+    - mutación: se invierten los bits elegidos
+    """
+    tipo = np.uint8
+
+    def __init__(self, longitud):
+        self.longitud = longitud
+
+    def aleatorios(self, cantidad, generador):
+        return generador.integers(0, 2, (cantidad, self.longitud), dtype=self.tipo)
+
+    def cruzar(self, padres1, padres2, generador):
+        cortes = generador.integers(1, max(2, self.longitud), len(padres1))
+        mascara = np.arange(self.longitud) < cortes[:, None]
+        return np.where(mascara, padres1, padres2), np.where(mascara, padres2, padres1)
+
+    def mutar(self, poblacion, prob_mutacion, generador):
+        filas, columnas = genes_a_mutar(poblacion.shape, prob_mutacion, generador)
+        poblacion[filas, columnas] ^= 1
+
+
+def cruce_uniforme(padres1, padres2, generador):
+    """Cada gen de los hijos viene de uno de los dos padres, elegido al azar."""
+    mascara = generador.random(padres1.shape) < 0.5
+    return np.where(mascara, padres1, padres2), np.where(mascara, padres2, padres1)
+
+
+def genes_a_mutar(forma, prob_mutacion, generador):
+    """
+    Posiciones (filas, columnas) de los genes que mutan, cada uno con probabilidad
+    prob_mutacion. Primero se sortea cuántos mutan (binomial) y luego cuáles, así
+    que con probabilidades bajas no se genera un número al azar por gen.
+    Una posición puede repetirse; con probabilidades bajas es muy raro.
+    """
+    total = forma[0] * forma[1]
+    posiciones = generador.integers(0, total, generador.binomial(total, prob_mutacion))
+    return np.divmod(posiciones, forma[1])
+
+
+def seleccion_torneo(aptitudes, cantidad, generador, tamano_torneo=2):
+    """Índices de 'cantidad' ganadores de torneos entre tamano_torneo individuos al azar."""
+    participantes = generador.integers(0, len(aptitudes), (cantidad, tamano_torneo))
+    ganadores = np.argmax(aptitudes[participantes], axis=1)
+    return participantes[np.arange(cantidad), ganadores]
+
+
+def seleccion_sus(aptitudes, cantidad, generador):
+    """
+    Muestreo estocástico universal: una sola ruleta con 'cantidad' punteros
+    equidistantes. Cada individuo recibe tantos lugares como punteros caen en su
+    tramo, que se cuentan con la suma acumulada, sin buscar puntero por puntero.
+    Las aptitudes se desplazan para que la peor valga 0.
+    """
+    pesos = aptitudes - aptitudes.min()
+    if not np.isfinite(pesos).all() or pesos.sum() == 0:  # Todos iguales: selección uniforme
+        pesos = np.ones(len(aptitudes))
+    acumulados = np.cumsum(pesos) * (cantidad / pesos.sum())  # El tramo i mide pesos[i] punteros
+    punteros = np.ceil(acumulados - generador.random()).astype(np.int64)  # Punteros antes del fin de cada tramo
+    copias = np.diff(punteros, prepend=0)
+    seleccionados = np.repeat(np.arange(len(aptitudes)), copias)[:cantidad]
+    return generador.permutation(seleccionados)  # Las parejas no deben ser vecinos de la ruleta
+
+
+SELECCIONES = {'torneo': seleccion_torneo, 'sus': seleccion_sus}
+
+
+def siguiente_generacion(poblacion, aptitudes, genoma, generador, seleccion='torneo',
+                         prob_cruce=0.9, prob_mutacion=None, elite=1):
+    """
+    Crea la siguiente generación a partir de la población y sus aptitudes:
+    los 'elite' mejores se copian sin cambios y el resto se forma con parejas
+    seleccionadas, cruzadas con probabilidad prob_cruce y luego mutadas.
+    prob_mutacion es por gen (por defecto 1 / longitud del genoma).
+    """
+    tamano = len(poblacion)
+    prob_mutacion = 1 / genoma.longitud if prob_mutacion is None else prob_mutacion
+    elite = min(elite, tamano)
+    pares = (tamano - elite + 1) // 2
+
+    padres = poblacion[SELECCIONES[seleccion](aptitudes, 2 * pares, generador)]
+    padres1, padres2 = padres[:pares], padres[pares:]
+    hijos1, hijos2 = genoma.cruzar(padres1, padres2, generador)
+    sin_cruce = generador.random(pares) >= prob_cruce  # Estas parejas pasan como copias de los padres
+    hijos1[sin_cruce], hijos2[sin_cruce] = padres1[sin_cruce], padres2[sin_cruce]
+    hijos = np.concatenate((hijos1, hijos2))[:tamano - elite]
+    genoma.mutar(hijos, prob_mutacion, generador)
+
+    if elite == 0:
+        return hijos
+    mejores = np.argpartition(aptitudes, tamano - elite)[tamano - elite:]  # Los 'elite' mayores, sin ordenar todo
+    return np.concatenate((poblacion[mejores], hijos))
+
+
+def algoritmo_genetico_vectorizado(aptitud, genoma, tamano_poblacion=1000, generaciones=100, seleccion='torneo',
+                                   prob_cruce=0.9, prob_mutacion=None, elite=1, semilla=None,
+                                   poblacion_inicial=None):
+    """
+    Algoritmo genético completo.
+    - aptitud: función vectorizada, recibe la matriz de la población y retorna
+      un arreglo con la aptitud de cada individuo (se maximiza)
+    - genoma: GenomaReal, GenomaEntero o GenomaBits
+    - seleccion: 'torneo' o 'sus'
+
+    Retorna (mejor_individuo, mejor_aptitud, historial), donde historial tiene la
+    mejor aptitud de cada generación.
+    """
+    generador = np.random.default_rng(semilla)
+    if poblacion_inicial is None:
+        poblacion = genoma.aleatorios(tamano_poblacion, generador)
+    else:
+        poblacion = np.array(poblacion_inicial, dtype=genoma.tipo)
+    aptitudes = aptitud(poblacion)
+    historial = [aptitudes.max()]
+
+    for _ in range(generaciones):
+        poblacion = siguiente_generacion(poblacion, aptitudes, genoma, generador, seleccion,
+                                         prob_cruce, prob_mutacion, elite)
+        aptitudes = aptitud(poblacion)  # Una sola evaluación vectorizada por generación
+        historial.append(aptitudes.max())
+
+    mejor = np.argmax(aptitudes)
+    return poblacion[mejor], aptitudes[mejor], historial
@@ -0,0 +1,274 @@
+import heapq
+import numpy as np
+
+class GrafoCSR:
+    """
+    Grafo en formato de filas dispersas comprimidas (CSR, Compressed Sparse Row).
+
+    Los nodos se identifican internamente con enteros (int32) de 0 a n-1 y las
+    aristas se guardan en tres arreglos de NumPy:
+    - desplazamientos: los vecinos del nodo i están en destinos[desplazamientos[i]:desplazamientos[i + 1]]
+    - destinos: nodo destino de cada arista
+    - pesos: costo de cada arista (None si el grafo no es ponderado); se
+      conservan enteros si todos los costos lo son
+
+    Un arreglo de nombres y un diccionario de índices permiten traducir entre
+    los nombres originales ('A', 'B', ...) y los identificadores enteros.
+    """
+    def __init__(self, desplazamientos, destinos, pesos=None, nombres=None):
+        self.desplazamientos = np.asarray(desplazamientos, dtype=np.int64)
+        self.destinos = np.asarray(destinos, dtype=np.int32)
+        self.pesos = None if pesos is None else np.asarray(pesos)
+        if self.pesos is not None and self.pesos.dtype.kind not in 'iuf':
+            self.pesos = self.pesos.astype(np.float64)
+        self.nombres = None if nombres is None else list(nombres)  # id -> nombre
+        # nombre -> id (si no hay nombres, los nodos son directamente sus enteros)
+        self.indices = None if nombres is None else {nombre: i for i, nombre in enumerate(self.nombres)}
+        self.inverso = None  # Grafo invertido, se calcula la primera vez que se pide
+
+    @classmethod
+    def desde_dict(cls, grafo):
+        """
+        Construye un GrafoCSR a partir de un diccionario de adyacencia.
+        Acepta los formatos usados en los scripts: dict de sets, dict de listas
+        o dict de dicts {vecino: costo} (grafo ponderado).
+        """
+        # Se numeran primero las llaves y después los vecinos que no aparecen como llave
+        nombres = list(grafo)
+        indices = {nombre: i for i, nombre in enumerate(nombres)}
+        for vecinos in grafo.values():
+            for vecino in vecinos:
+                if vecino not in indices:
+                    indices[vecino] = len(nombres)
+                    nombres.append(vecino)
+
+        ponderado = any(isinstance(vecinos, dict) for vecinos in grafo.values())
+        desplazamientos = np.zeros(len(nombres) + 1, dtype=np.int64)
+        destinos = []
+        pesos = []
+        for nombre in nombres:
+            vecinos = grafo.get(nombre, ())
+            destinos.extend(indices[vecino] for vecino in vecinos)
+            if ponderado:
+                pesos.extend(vecinos.values() if isinstance(vecinos, dict) else [1] * len(vecinos))
+            desplazamientos[indices[nombre] + 1] = len(destinos)
+
+        return cls(desplazamientos, destinos, pesos if ponderado else None, nombres)
+
+    @classmethod
+    def desde_arreglos(cls, num_nodos, origenes, destinos, pesos=None, nombres=None):
+        """
+        Construye un GrafoCSR a partir de arreglos de aristas (origen, destino, peso)
+        con identificadores enteros de 0 a num_nodos - 1, sin ciclos de Python.
+        """
+        origenes = np.asarray(origenes)
+        orden = np.argsort(origenes, kind='stable')  # Se agrupan las aristas por su origen
+        desplazamientos = np.zeros(num_nodos + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=num_nodos), out=desplazamientos[1:])
+        pesos = None if pesos is None else np.asarray(pesos)[orden]
+        return cls(desplazamientos, np.asarray(destinos)[orden], pesos, nombres)
+
+    @property
+    def num_nodos(self):
+        return len(self.desplazamientos) - 1
+
+    @property
+    def num_aristas(self):
+        return len(self.destinos)
+
+    def __len__(self):
+        return self.num_nodos
+
+    def __contains__(self, nombre):
+        if self.indices is None:
+            return isinstance(nombre, (int, np.integer)) and 0 <= nombre < self.num_nodos
+        return nombre in self.indices
+
+    def id(self, nombre):
+        """Traduce un nombre de nodo a su identificador entero."""
+        return nombre if self.indices is None else self.indices[nombre]
+
+    def nombre(self, i):
+        """Traduce un identificador entero a su nombre original."""
+        return int(i) if self.nombres is None else self.nombres[i]
+
+    def vecinos(self, i):
+        """Arreglo con los identificadores de los vecinos del nodo i."""
+        return self.destinos[self.desplazamientos[i]:self.desplazamientos[i + 1]]
+
+    def pesos_de(self, i):
+        """Arreglo con los costos de las aristas que salen del nodo i (1 si no es ponderado)."""
+        inicio, fin = self.desplazamientos[i], self.desplazamientos[i + 1]
+        if self.pesos is None:
+            return np.ones(fin - inicio, dtype=np.int64)
+        return self.pesos[inicio:fin]
+
+    def invertido(self):
+        """
+        Devuelve el grafo con todas las aristas invertidas (útil para búsquedas hacia atrás).
+        Se construye una sola vez y se guarda, así las consultas siguientes no repiten
+        el ordenamiento de las aristas (el grafo no debe modificarse después).
+        """
+        if self.inverso is None:
+            self.inverso = self.construir_invertido()
+            self.inverso.inverso = self  # Invertir el invertido da el grafo original
+        return self.inverso
+
+    def construir_invertido(self):
+        origenes = np.repeat(np.arange(self.num_nodos, dtype=np.int32), np.diff(self.desplazamientos))
+        orden = np.argsort(self.destinos, kind='stable')  # Se agrupan las aristas por su destino
+        desplazamientos = np.zeros(self.num_nodos + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.destinos, minlength=self.num_nodos), out=desplazamientos[1:])
+        pesos = None if self.pesos is None else self.pesos[orden]
+        return GrafoCSR(desplazamientos, origenes[orden], pesos, self.nombres)
+
+    def a_dict(self):
+        """Convierte el grafo de vuelta a un diccionario de adyacencia."""
+        grafo = {}
+        for i in range(self.num_nodos):
+            vecinos = [self.nombre(j) for j in self.vecinos(i)]
+            if self.pesos is None:
+                grafo[self.nombre(i)] = vecinos
+            else:
+                grafo[self.nombre(i)] = dict(zip(vecinos, self.pesos_de(i).tolist()))
+        return grafo
+
+
+def reconstruir_camino_ids(padres, nodo):
+    """
+    Reconstruye un camino a partir de un arreglo de padres (-1 marca la raíz).
+    Retorna la lista de identificadores desde la raíz hasta el nodo.
+    """
+    camino = []
+    while nodo != -1:
+        camino.append(int(nodo))
+        nodo = padres[nodo]
+    camino.reverse()
+    return camino
+
+
+def dijkstra_csr(grafo, origen, padres=False, destinos=None):
+    """
+    Distancias desde el nodo 'origen' (identificador entero) a los nodos de un
+    GrafoCSR. Retorna un arreglo de distancias (inf si no se alcanza) y, si
+    padres=True, también el arreglo de predecesores (-1 en la raíz y en los
+    nodos no alcanzados).
+
+    Si se indican 'destinos', la búsqueda se detiene en cuanto se cierra el último
+    de ellos: sus distancias son exactas y las de los demás nodos pueden ser solo
+    cotas superiores.
+
+    Como se recorre el grafo completo, se usa heapq con borrado perezoso: en
+    Python puro es más rápido que el montículo indexado para este caso.
+    """
+    distancias = np.full(grafo.num_nodos, np.inf)
+    predecesores = np.full(grafo.num_nodos, -1, dtype=np.int32)
+    cerrado = np.zeros(grafo.num_nodos, dtype=bool)
+    distancias[origen] = 0
+    cola = [(0, origen)]
+    desplazamientos, destinos_aristas = grafo.desplazamientos, grafo.destinos
+    pesos = grafo.pesos if grafo.pesos is not None else np.ones(grafo.num_aristas, dtype=np.int64)
+
+    # Destinos que faltan por cerrar (None = recorrer todo el grafo)
+    pendientes = None if destinos is None else set(int(d) for d in destinos)
+
+    while cola:
+        distancia, nodo = heapq.heappop(cola)
+        if cerrado[nodo]:
+            continue
+        cerrado[nodo] = True
+        if pendientes is not None:
+            pendientes.discard(nodo)
+            if not pendientes:  # Ya se cerraron todos los destinos
+                break
+        inicio, fin = desplazamientos[nodo], desplazamientos[nodo + 1]
+        for vecino, costo in zip(destinos_aristas[inicio:fin].tolist(), pesos[inicio:fin].tolist()):
+            if distancia + costo < distancias[vecino]:
+                distancias[vecino] = distancia + costo
+                predecesores[vecino] = nodo
+                heapq.heappush(cola, (distancia + costo, vecino))
+
+    return (distancias, predecesores) if padres else distancias
+
+
+def aristas_de(desplazamientos, nodos):
+    """
+    Índices (en destinos/pesos) de todas las aristas que salen de 'nodos', junto
+    con el nodo del que sale cada una. Equivale a concatenar los rangos
+    desplazamientos[v]:desplazamientos[v + 1] sin un ciclo de Python.
+    """
+    inicios = desplazamientos[nodos]
+    cuentas = desplazamientos[nodos + 1] - inicios
+    total = int(cuentas.sum())
+    # Posición de cada arista dentro del rango de su nodo
+    desfases = np.arange(total) - np.repeat(np.cumsum(cuentas) - cuentas, cuentas)
+    return np.repeat(inicios, cuentas) + desfases, np.repeat(nodos, cuentas)
+
+
+def bfs_niveles(grafo, origen, alfa=14, beta=24, invertido=None):
+    """
+    BFS sincronizada por niveles con cambio de dirección (direction-optimizing BFS).
+    Cada nivel se procesa completo con operaciones de NumPy:
+    - arriba-abajo: se recorren las aristas que salen de la frontera
+    - abajo-arriba: cada nodo sin visitar busca, entre sus aristas de entrada,
+      un padre que esté en la frontera (conviene cuando la frontera es enorme)
+    Se pasa a abajo-arriba cuando las aristas de la frontera superan 1/alfa de las
+    aristas que faltan por revisar, y se regresa cuando la frontera tiene menos
+    de n/beta nodos.
+
+    - invertido: grafo invertido ya calculado (si no, se construye solo si hace falta)
+    Retorna (distancias, padres) como arreglos int32: distancias en saltos (-1 si
+    no se alcanza) y el padre de cada nodo en el árbol BFS (-1 en la raíz y en
+    los nodos no alcanzados).
+    """
+    n = grafo.num_nodos
+    distancias = np.full(n, -1, dtype=np.int32)
+    padres = np.full(n, -1, dtype=np.int32)
+    distancias[origen] = 0
+    frontera = np.array([origen], dtype=np.int64)
+    grados_salida = np.diff(grafo.desplazamientos)
+    grados_entrada = np.bincount(grafo.destinos, minlength=n)
+    aristas_sin_revisar = grafo.num_aristas - int(grados_entrada[origen])
+    abajo_arriba = False
+    nivel = 0
+
+    while frontera.size:
+        # Elección de la dirección del siguiente paso
+        if not abajo_arriba and int(grados_salida[frontera].sum()) > aristas_sin_revisar / alfa:
+            abajo_arriba = True
+        elif abajo_arriba and frontera.size < n / beta:
+            abajo_arriba = False
+        nivel += 1
+
+        if abajo_arriba:
+            if invertido is None:
+                invertido = grafo.invertido()
+            en_frontera = np.zeros(n, dtype=bool)
+            en_frontera[frontera] = True
+            sin_visitar = np.flatnonzero(distancias == -1)
+            aristas, hijos = aristas_de(invertido.desplazamientos, sin_visitar)
+            candidatos = invertido.destinos[aristas]  # Vecinos de entrada de cada nodo sin visitar
+            hallados = en_frontera[candidatos]
+            # Cada nodo se queda con el primer padre que encontró en la frontera
+            nuevos, primeros = np.unique(hijos[hallados], return_index=True)
+            padres[nuevos] = candidatos[hallados][primeros]
+        else:
+            aristas, origenes = aristas_de(grafo.desplazamientos, frontera)
+            vecinos = grafo.destinos[aristas]
+            sin_visitar = distancias[vecinos] == -1
+            nuevos, primeros = np.unique(vecinos[sin_visitar], return_index=True)
+            padres[nuevos] = origenes[sin_visitar][primeros]
+
+        distancias[nuevos] = nivel
+        aristas_sin_revisar -= int(grados_entrada[nuevos].sum())
+        frontera = nuevos.astype(np.int64)
+
+    return distancias, padres
+
+
+def arreglo_de_objetos(valores):
+    """Arreglo 1D de objetos (evita que NumPy convierta nombres-tupla en una matriz)."""
+    arreglo = np.empty(len(valores), dtype=object)
+    for i, valor in enumerate(valores):
+        arreglo[i] = valor
+    return arreglo
@@ -0,0 +1,287 @@
+import heapq
+import random
+import numpy as np
+from cola_prioridad import ColaPrioridadIndexada
+from grafo_csr import GrafoCSR, arreglo_de_objetos
+
+class JerarquiaContraccion:
+    """
+    Jerarquías de Contracción (Contraction Hierarchies) para consultas repetidas
+    de camino más corto sobre un mismo grafo ponderado y estático.
+
+    Preprocesamiento (una sola vez):
+    - Los nodos se contraen uno por uno en orden de importancia (diferencia de aristas).
+    - Al contraer v, cada par u -> v -> x sin un camino testigo igual o más corto
+      que evite a v recibe un atajo u -> x, recordando que pasa por v.
+
+    Consulta: dos búsquedas de Dijkstra que solo suben de rango (desde el inicio por
+    las aristas hacia nodos más importantes, desde la meta por las aristas invertidas).
+    Los atajos del camino encontrado se desempaquetan en las aristas originales.
+    """
+    def __init__(self, rango, subida, bajada, atajos, nombres=None):
+        self.rango = rango  # Orden de contracción de cada nodo (mayor = más importante)
+        self.subida = subida  # GrafoCSR con las aristas u -> x donde rango[u] < rango[x]
+        self.bajada = bajada  # GrafoCSR con las aristas x -> u invertidas donde rango[u] > rango[x]
+        self.atajos = atajos  # (u, x) -> nodo intermedio v de cada atajo
+        self.nombres = nombres
+        self.indices = None if nombres is None else {nombre: i for i, nombre in enumerate(nombres)}
+
+    @classmethod
+    def construir(cls, grafo, limite_testigo=50):
+        """
+        Preprocesa un grafo (dict de dicts o GrafoCSR).
+        - limite_testigo: máximo de nodos que cierra cada búsqueda de testigos. Si la
+          búsqueda se corta antes de tiempo se agrega el atajo (más atajos, mismo resultado).
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_dict(grafo)
+        n = grafo.num_nodos
+
+        # Grafo dinámico: salientes[u][x] y entrantes[x][u] guardan el menor costo u -> x
+        salientes = [dict() for _ in range(n)]
+        entrantes = [dict() for _ in range(n)]
+        for u in range(n):
+            for x, costo in zip(grafo.vecinos(u).tolist(), grafo.pesos_de(u).tolist()):
+                if x != u and costo < salientes[u].get(x, float('inf')):
+                    salientes[u][x] = costo
+                    entrantes[x][u] = costo
+
+        def atajos_necesarios(v):
+            """Lista de atajos (u, x, costo) que exige contraer v."""
+            necesarios = []
+            for u, costo_uv in entrantes[v].items():
+                objetivos = {x: costo_uv + costo_vx for x, costo_vx in salientes[v].items() if x != u}
+                if not objetivos:
+                    continue
+                testigo = buscar_testigos(salientes, u, v, objetivos, limite_testigo)
+                necesarios.extend((u, x, costo) for x, costo in objetivos.items()
+                                  if testigo.get(x, float('inf')) > costo)
+            return necesarios
+
+        vecinos_contraidos = [0] * n
+        def prioridad(v):
+            # Diferencia de aristas + vecinos ya contraídos (reparte la contracción por el grafo)
+            return len(atajos_necesarios(v)) - len(entrantes[v]) - len(salientes[v]) + vecinos_contraidos[v]
+
+        cola = [(prioridad(v), v) for v in range(n)]
+        heapq.heapify(cola)
+        rango = np.zeros(n, dtype=np.int32)
+        aristas_subida, aristas_bajada, atajos = [], [], {}
+        contraidos = 0
+
+        while cola:
+            _, v = heapq.heappop(cola)
+            # Actualización perezosa: si la prioridad empeoró, el nodo vuelve a la cola
+            actual = prioridad(v)
+            if cola and actual > cola[0][0]:
+                heapq.heappush(cola, (actual, v))
+                continue
+
+            rango[v] = contraidos
+            contraidos += 1
+            nuevos = atajos_necesarios(v)
+
+            # Las aristas que le quedan a v van a nodos aún no contraídos (de mayor rango)
+            aristas_subida.extend((v, x, costo) for x, costo in salientes[v].items())
+            aristas_bajada.extend((v, u, costo) for u, costo in entrantes[v].items())
+            for x in salientes[v]:
+                del entrantes[x][v]
+                vecinos_contraidos[x] += 1
+            for u in entrantes[v]:
+                del salientes[u][v]
+                vecinos_contraidos[u] += 1
+            salientes[v], entrantes[v] = {}, {}
+
+            for u, x, costo in nuevos:
+                if costo < salientes[u].get(x, float('inf')):
+                    salientes[u][x] = costo
+                    entrantes[x][u] = costo
+                    atajos[(u, x)] = v
+
+        return cls(rango, a_csr(n, aristas_subida), a_csr(n, aristas_bajada),
+                   atajos, grafo.nombres)
+
+    def guardar(self, ruta):
+        """Guarda la jerarquía en un archivo .npz para reutilizarla en otras ejecuciones."""
+        pares = np.array(list(self.atajos), dtype=np.int32).reshape(-1, 2)
+        np.savez(ruta,
+                 rango=self.rango,
+                 subida_desplazamientos=self.subida.desplazamientos, subida_destinos=self.subida.destinos,
+                 subida_pesos=self.subida.pesos,
+                 bajada_desplazamientos=self.bajada.desplazamientos, bajada_destinos=self.bajada.destinos,
+                 bajada_pesos=self.bajada.pesos,
+                 atajos_pares=pares, atajos_medio=np.array(list(self.atajos.values()), dtype=np.int32),
+                 nombres=arreglo_de_objetos(self.nombres or []))
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga una jerarquía guardada con guardar()."""
+        with np.load(ruta, allow_pickle=True) as datos:
+            subida = GrafoCSR(datos['subida_desplazamientos'], datos['subida_destinos'], datos['subida_pesos'])
+            bajada = GrafoCSR(datos['bajada_desplazamientos'], datos['bajada_destinos'], datos['bajada_pesos'])
+            atajos = dict(zip(map(tuple, datos['atajos_pares'].tolist()), datos['atajos_medio'].tolist()))
+            nombres = datos['nombres'].tolist() or None
+            return cls(datos['rango'], subida, bajada, atajos, nombres)
+
+    def consulta(self, inicio, meta):
+        """
+        Costo y camino más corto entre dos nodos, con el mismo formato que
+        busqueda_costo_uniforme: (costo, camino) o (inf, []) si no hay camino.
+        """
+        origen = inicio if self.indices is None else self.indices[inicio]
+        destino = meta if self.indices is None else self.indices[meta]
+
+        lados = (self.subida, self.bajada)
+        distancias = ({origen: 0}, {destino: 0})
+        padres = ({origen: None}, {destino: None})
+        colas = (ColaPrioridadIndexada(), ColaPrioridadIndexada())
+        colas[0].insertar(origen, 0)
+        colas[1].insertar(destino, 0)
+        mu = 0 if origen == destino else float('inf')
+        encuentro = origen if origen == destino else None
+
+        # Se alterna entre ambos lados; cada uno se detiene cuando su mínimo ya no puede mejorar mu
+        lado = 0
+        while colas[0] or colas[1]:
+            if not colas[lado] or colas[lado].prioridad(colas[lado].elementos[0]) >= mu:
+                if not colas[1 - lado] or colas[1 - lado].prioridad(colas[1 - lado].elementos[0]) >= mu:
+                    break
+                lado = 1 - lado
+                continue
+
+            nodo, distancia = colas[lado].extraer_min()
+            if nodo in distancias[1 - lado] and distancia + distancias[1 - lado][nodo] < mu:
+                mu, encuentro = distancia + distancias[1 - lado][nodo], nodo
+
+            for vecino, costo in zip(lados[lado].vecinos(nodo).tolist(), lados[lado].pesos_de(nodo).tolist()):
+                if distancia + costo < distancias[lado].get(vecino, float('inf')):
+                    distancias[lado][vecino] = distancia + costo
+                    padres[lado][vecino] = nodo
+                    colas[lado].insertar_o_decrementar(vecino, distancia + costo)
+            lado = 1 - lado
+
+        if encuentro is None:
+            return float('inf'), []
+
+        # Camino en la jerarquía: inicio -> ... -> encuentro -> ... -> meta
+        camino = []
+        nodo = encuentro
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = padres[0][nodo]
+        camino.reverse()
+        nodo = padres[1][encuentro]
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = padres[1][nodo]
+
+        camino = self.desempaquetar(camino)
+        if self.nombres is not None:
+            camino = [self.nombres[i] for i in camino]
+        return mu, camino
+
+    def desempaquetar(self, camino):
+        """Sustituye cada atajo u -> x por u -> v -> x hasta que solo quedan aristas originales."""
+        completo = [camino[0]]
+        pendientes = [(u, x) for u, x in zip(camino[-2::-1], camino[:0:-1])]  # Pila en orden inverso
+        while pendientes:
+            u, x = pendientes.pop()
+            v = self.atajos.get((u, x))
+            if v is None:
+                completo.append(x)
+            else:
+                pendientes.append((v, x))
+                pendientes.append((u, v))
+        return completo
+
+
+def buscar_testigos(salientes, origen, excluido, objetivos, limite):
+    """
+    Dijkstra local desde origen que evita el nodo excluido. Se detiene al cerrar
+    'limite' nodos o cuando la distancia supera el mayor costo de los objetivos.
+    """
+    tope = max(objetivos.values())
+    distancias = {origen: 0}
+    cola = [(0, origen)]
+    cerrados = 0
+    while cola and cerrados < limite:
+        distancia, nodo = heapq.heappop(cola)
+        if distancia > distancias[nodo]:
+            continue
+        if distancia > tope:
+            break
+        cerrados += 1
+        for vecino, costo in salientes[nodo].items():
+            if vecino != excluido and distancia + costo < distancias.get(vecino, float('inf')):
+                distancias[vecino] = distancia + costo
+                heapq.heappush(cola, (distancia + costo, vecino))
+    return distancias
+
+
+def a_csr(n, aristas):
+    """Convierte una lista de aristas (origen, destino, costo) en un GrafoCSR sin nombres."""
+    aristas.sort(key=lambda arista: arista[0])
+    desplazamientos = np.zeros(n + 1, dtype=np.int64)
+    origenes = np.array([a[0] for a in aristas], dtype=np.int64)
+    np.cumsum(np.bincount(origenes, minlength=n), out=desplazamientos[1:])
+    return GrafoCSR(desplazamientos, [a[1] for a in aristas], [a[2] for a in aristas])
+
+
+def verificar_contra_ucs(jerarquia, grafo, num_consultas=200, semilla=0):
+    """
+    Compara las distancias de la jerarquía con busqueda_costo_uniforme (002) en
+    consultas aleatorias. Lanza AssertionError ante la primera diferencia.
+    """
+    from cargar_script import cargar_script
+    busqueda_costo_uniforme = cargar_script('002').busqueda_costo_uniforme
+
+    generador = random.Random(semilla)
+    nodos = list(grafo) if not isinstance(grafo, GrafoCSR) else [grafo.nombre(i) for i in range(grafo.num_nodos)]
+    for _ in range(num_consultas):
+        inicio, meta = generador.choice(nodos), generador.choice(nodos)
+        esperado, _ = busqueda_costo_uniforme(grafo, inicio, meta)
+        costo, camino = jerarquia.consulta(inicio, meta)
+        assert abs(costo - esperado) < 1e-9 or costo == esperado, \
+            f"CH da {costo} y UCS da {esperado} para {inicio} -> {meta}"
+        if camino:  # El camino desempaquetado debe unir inicio y meta con aristas reales
+            assert camino[0] == inicio and camino[-1] == meta
+            if not isinstance(grafo, GrafoCSR):
+                assert abs(sum(grafo[u][x] for u, x in zip(camino, camino[1:])) - costo) < 1e-9
+    return num_consultas
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    # Grafo ponderado del ejemplo de Búsqueda de Costo Uniforme (002)
+    grafo = {
+        'A': {'B': 1, 'C': 4},
+        'B': {'A': 1, 'D': 2, 'E': 5},
+        'C': {'A': 4, 'F': 3},
+        'D': {'B': 2},
+        'E': {'B': 5, 'F': 1},
+        'F': {'C': 3, 'E': 1}
+    }
+
+    jerarquia = JerarquiaContraccion.construir(grafo)
+    print(f"Atajos agregados: {len(jerarquia.atajos)}")
+
+    # Se guarda el preprocesamiento y se vuelve a cargar, como en otra ejecución
+    ruta = os.path.join(tempfile.gettempdir(), "jerarquia_ejemplo.npz")
+    jerarquia.guardar(ruta)
+    jerarquia = JerarquiaContraccion.cargar(ruta)
+
+    costo, camino = jerarquia.consulta('D', 'F')
+    print(f"Consulta D -> F: costo {costo}, camino {' -> '.join(camino)}")
+
+    # Verificación con un grafo aleatorio dirigido más grande
+    generador = random.Random(42)
+    aleatorio = {i: {} for i in range(300)}
+    for _ in range(1200):
+        u, x = generador.randrange(300), generador.randrange(300)
+        if u != x:
+            aleatorio[u][x] = generador.randint(1, 20)
+    jerarquia = JerarquiaContraccion.construir(aleatorio)
+    consultas = verificar_contra_ucs(jerarquia, aleatorio)
+    print(f"{consultas} consultas aleatorias coinciden con busqueda_costo_uniforme")
@@ -0,0 +1,220 @@
+"""
+Motor reutilizable para problemas de satisfacción de restricciones (CSP) binarios.
+
+- Cada variable tiene un dominio (lista de valores) y su dominio actual se guarda
+  como un conjunto de bits: el bit k encendido significa que dominios[i][k] sigue
+  disponible. Contar, intersectar y comparar dominios son operaciones de enteros.
+- Las restricciones binarias se indexan por variable: restricciones[i][j][a] es la
+  máscara de los valores de j compatibles con i = dominios[i][a]. Podar el dominio
+  de j al asignar i es un solo AND.
+- El resolvedor hace vuelta atrás con pila explícita (sin recursión, así que no lo
+  limita la profundidad), MRV con desempate por grado, valor menos restrictivo
+  (LCV) y comprobación hacia delante. Las podas se anotan en un rastro (trail) y se
+  deshacen al retroceder, en lugar de copiar los dominios.
+"""
+import heapq
+import numpy as np
+
+class CSP:
+    """Variables, dominios y restricciones binarias de un CSP."""
+    def __init__(self, variables, dominios):
+        self.variables = list(variables)
+        self.indice = {variable: i for i, variable in enumerate(self.variables)}
+        self.dominios = [list(dominios[variable]) for variable in self.variables]
+        self.restricciones = [{} for _ in self.variables]  # i -> {j: máscaras de soporte por valor de i}
+
+    def __len__(self):
+        return len(self.variables)
+
+    def completo(self, i):
+        """Conjunto de bits con todo el dominio inicial de la variable i."""
+        return (1 << len(self.dominios[i])) - 1
+
+    def agregar_restriccion(self, xi, xj, relacion):
+        """
+        Agrega una restricción entre xi y xj. 'relacion' puede ser:
+        - una función relacion(vi, vj) -> True si los valores son compatibles
+        - una matriz booleana (NumPy o listas) de len(dominio xi) x len(dominio xj)
+        Si ya había una restricción entre las dos variables, se combinan (AND).
+        """
+        i, j = self.indice[xi], self.indice[xj]
+        if callable(relacion):
+            matriz = np.array([[bool(relacion(vi, vj)) for vj in self.dominios[j]] for vi in self.dominios[i]],
+                              dtype=bool).reshape(len(self.dominios[i]), len(self.dominios[j]))
+        else:
+            matriz = np.asarray(relacion, dtype=bool)
+        self.fijar_soportes(i, j, [mascara_de_fila(fila) for fila in matriz])
+        self.fijar_soportes(j, i, [mascara_de_fila(fila) for fila in matriz.T])
+
+    def fijar_soportes(self, i, j, soportes):
+        anteriores = self.restricciones[i].get(j)
+        if anteriores is not None:
+            soportes = [a & b for a, b in zip(anteriores, soportes)]
+        self.restricciones[i][j] = soportes
+
+    def compatibles(self, i, a, j, b):
+        """True si i = dominios[i][a] y j = dominios[j][b] no violan ninguna restricción entre ellas."""
+        soportes = self.restricciones[i].get(j)
+        return soportes is None or bool(soportes[a] >> b & 1)
+
+    @classmethod
+    def diferentes(cls, variables, dominios, vecinos):
+        """
+        CSP donde las variables vecinas deben tomar valores distintos (coloreo de mapas
+        o de grafos). vecinos: diccionario variable -> lista de vecinos, como en 017.
+        Las máscaras se construyen directamente, sin pasar por una matriz, y se comparten
+        entre las restricciones con los mismos dominios.
+        """
+        csp = cls(variables, dominios)
+        posiciones = [{valor: k for k, valor in enumerate(dominio)} for dominio in csp.dominios]
+        cache = {}
+
+        def soportes(i, j):
+            clave = (tuple(csp.dominios[i]), tuple(csp.dominios[j]))
+            if clave not in cache:
+                completo_j = csp.completo(j)
+                cache[clave] = [completo_j & ~(1 << posiciones[j][valor]) if valor in posiciones[j] else completo_j
+                                for valor in csp.dominios[i]]
+            return cache[clave]
+
+        for xi in csp.variables:
+            i = csp.indice[xi]
+            for xj in vecinos.get(xi, []):
+                j = csp.indice[xj]
+                # Se instalan las dos direcciones aunque 'vecinos' solo liste una; si la
+                # lista es simétrica la segunda vez ya están las mismas máscaras y se omite
+                for a, b in ((i, j), (j, i)):
+                    mascaras = soportes(a, b)
+                    if csp.restricciones[a].get(b) is not mascaras:
+                        csp.fijar_soportes(a, b, mascaras)
+        return csp
+
+
+def mascara_de_fila(fila):
+    """Entero con el bit k encendido si fila[k] es verdadero."""
+    return int.from_bytes(np.packbits(np.asarray(fila, dtype=bool), bitorder='little').tobytes(), 'little')
+
+
+def resolver(csp, lcv=True, max_nodos=None):
+    """
+    Vuelta atrás con comprobación hacia delante sobre el CSP.
+    - Variable: MRV (menos valores restantes); los empates se rompen por grado
+      (más restricciones). Se usa un montículo con entradas perezosas: cada cambio
+      de dominio agrega una entrada y las viejas se descartan al sacarlas.
+    - Valores: con lcv=True, primero los que eliminan menos valores de los vecinos.
+    - Al asignar i = a solo se podan los vecinos de i (dominio &= soporte); cada poda
+      se guarda en el rastro como (variable, dominio anterior).
+    - max_nodos: corta la búsqueda después de ese número de asignaciones probadas.
+
+    Retorna (solucion, nodos): solucion es un diccionario variable -> valor (o None)
+    y nodos el número de asignaciones probadas.
+    """
+    n = len(csp)
+    dominios = [csp.completo(i) for i in range(n)]
+    asignados = [-1] * n
+    restricciones = csp.restricciones
+    grados = [len(restricciones[i]) for i in range(n)]
+    rastro = []
+    monticulo = [(dominios[i].bit_count(), -grados[i], i) for i in range(n)]
+    heapq.heapify(monticulo)
+
+    def elegir_variable():
+        """Variable sin asignar con el dominio más chico (None si no queda ninguna)."""
+        while monticulo:
+            tamano, _, i = heapq.heappop(monticulo)
+            if asignados[i] == -1 and tamano == dominios[i].bit_count():
+                return i
+        return None
+
+    def ordenar_valores(i):
+        valores = [a for a in range(len(csp.dominios[i])) if dominios[i] >> a & 1]
+        if lcv and len(valores) > 1:
+            vecinos = [(dominios[j], soportes) for j, soportes in restricciones[i].items() if asignados[j] == -1]
+            valores.sort(key=lambda a: sum((dominio & ~soportes[a]).bit_count() for dominio, soportes in vecinos))
+        return valores
+
+    def propagar(i, a):
+        """Poda los vecinos sin asignar de i; False si alguno queda sin valores."""
+        for j, soportes in restricciones[i].items():
+            if asignados[j] != -1:
+                continue
+            podado = dominios[j] & soportes[a]
+            if podado != dominios[j]:
+                rastro.append((j, dominios[j]))
+                dominios[j] = podado
+                if not podado:
+                    return False
+                heapq.heappush(monticulo, (podado.bit_count(), -grados[j], j))
+        return True
+
+    def deshacer(marca):
+        while len(rastro) > marca:
+            j, dominio = rastro.pop()
+            dominios[j] = dominio
+            heapq.heappush(monticulo, (dominio.bit_count(), -grados[j], j))
+
+    nodos = 0
+    variable = elegir_variable()
+    if variable is None:  # CSP sin variables
+        return {}, nodos
+    pila = [[variable, ordenar_valores(variable), 0, 0]]
+    # Cada marco: [variable, valores ordenados, siguiente valor a probar, tamaño del rastro al entrar]
+    while pila:
+        marco = pila[-1]
+        variable, valores, k, marca = marco
+        deshacer(marca)  # Se deshacen las podas del valor anterior de esta variable
+        asignados[variable] = -1
+        if k == len(valores):  # Sin valores: se retrocede a la variable anterior
+            pila.pop()
+            heapq.heappush(monticulo, (dominios[variable].bit_count(), -grados[variable], variable))
+            continue
+        if max_nodos is not None and nodos >= max_nodos:
+            return None, nodos
+        marco[2] = k + 1
+        nodos += 1
+        asignados[variable] = valores[k]
+        if not propagar(variable, valores[k]):
+            continue
+        siguiente = elegir_variable()
+        if siguiente is None:  # Todas asignadas
+            return {csp.variables[i]: csp.dominios[i][asignados[i]] for i in range(n)}, nodos
+        pila.append([siguiente, ordenar_valores(siguiente), 0, len(rastro)])
+
+    return None, nodos
+
+
+def grafo_coloreable(nodos, aristas, colores, semilla=0):
+    """
+    Grafo aleatorio que se sabe 'colores'-coloreable: cada nodo recibe un color
+    escondido y las aristas solo unen nodos de colores escondidos distintos.
+    Retorna el diccionario nodo -> vecinos.
+    """
+    generador = np.random.default_rng(semilla)
+    escondido = generador.integers(0, colores, nodos)
+    vecinos = {nodo: set() for nodo in range(nodos)}
+    agregadas = 0
+    while agregadas < aristas:
+        u, v = generador.integers(0, nodos, 2)
+        if escondido[u] != escondido[v] and v not in vecinos[u]:
+            vecinos[u].add(int(v))
+            vecinos[v].add(int(u))
+            agregadas += 1
+    return {nodo: sorted(vecinos[nodo]) for nodo in vecinos}
+
+
+if __name__ == "__main__":
+    import time
+
+    # Coloreo de un grafo de 3000 nodos con 4 colores
+    vecinos = grafo_coloreable(3000, 6000, 4)
+    inicio = time.perf_counter()
+    csp = CSP.diferentes(vecinos, {nodo: range(4) for nodo in vecinos}, vecinos)
+    solucion, nodos = resolver(csp)
+    valida = solucion is not None and all(solucion[u] != solucion[v] for u in vecinos for v in vecinos[u])
+    print(f"Grafo de 3000 nodos con 4 colores: {nodos} nodos en {time.perf_counter() - inicio:.2f} s, "
+          f"solución válida: {valida}")
+
+    # Restricción dada como matriz de NumPy: x < y con dominios 0..4
+    csp = CSP('xy', {'x': range(5), 'y': range(5)})
+    csp.agregar_restriccion('x', 'y', np.less.outer(np.arange(5), np.arange(5)))
+    print("x < y:", resolver(csp)[0])
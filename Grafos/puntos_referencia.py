@@ -0,0 +1,205 @@
+import os
+import random
+import numpy as np
+from grafo_csr import GrafoCSR, dijkstra_csr, arreglo_de_objetos
+
+class TablaPuntosReferencia:
+    """
+    Tablas de distancias para la heurística ALT (A*, Landmarks y desigualdad Triangular).
+
+    Para cada punto de referencia L se guardan dos filas:
+    - desde[i, v] = d(L, v)  (Dijkstra sobre el grafo)
+    - hacia[i, v] = d(v, L)  (Dijkstra sobre el grafo invertido)
+
+    Por la desigualdad triangular, para cualquier objetivo t:
+        d(v, t) >= d(L, t) - d(L, v)   y   d(v, t) >= d(v, L) - d(t, L)
+    así que el máximo de esas cotas sobre todos los L es una heurística admisible
+    y consistente, sin escribir a mano un diccionario de heurísticas.
+
+    Las tablas son arreglos de NumPy de forma (k, n). Se guardan en archivos .npy y
+    se pueden abrir con np.memmap: varios procesos que cargan la misma tabla comparten
+    las páginas del archivo en memoria en lugar de tener cada uno su copia.
+    """
+    def __init__(self, puntos, desde, hacia, nombres=None):
+        self.puntos = puntos  # Identificadores de los puntos de referencia
+        self.desde = desde
+        self.hacia = hacia
+        self.nombres = nombres
+        self.indices = None if nombres is None else {nombre: i for i, nombre in enumerate(nombres)}
+
+    @classmethod
+    def construir(cls, grafo, k=8, estrategia='lejanos', semilla=0):
+        """
+        Elige k puntos de referencia y calcula sus tablas de distancias.
+        - grafo: dict de dicts o GrafoCSR
+        - estrategia: 'lejanos' (cada punto lo más lejos posible de los anteriores)
+          o 'evitar' (puntos en las zonas donde la heurística actual es peor)
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_dict(grafo)
+        if estrategia not in ('lejanos', 'evitar'):
+            raise ValueError(f"Estrategia desconocida: {estrategia!r}")
+
+        invertido = grafo.invertido()
+        k = min(k, grafo.num_nodos)
+        generador = random.Random(semilla)
+        puntos, desde, hacia = [], [], []
+
+        for _ in range(k):
+            if estrategia == 'lejanos':
+                punto = elegir_lejano(grafo, desde, hacia, generador)
+            else:
+                punto = elegir_evitar(grafo, puntos, desde, hacia, generador)
+            if punto in puntos:  # En grafos pequeños o desconectados se elige otro nodo al azar
+                punto = generador.choice([v for v in range(grafo.num_nodos) if v not in puntos])
+            puntos.append(punto)
+            desde.append(dijkstra_csr(grafo, punto))
+            hacia.append(dijkstra_csr(invertido, punto))
+
+        return cls(np.array(puntos, dtype=np.int32), np.array(desde), np.array(hacia), grafo.nombres)
+
+    def guardar(self, directorio):
+        """Guarda cada tabla en su propio archivo .npy dentro del directorio."""
+        os.makedirs(directorio, exist_ok=True)
+        np.save(os.path.join(directorio, 'puntos.npy'), self.puntos)
+        np.save(os.path.join(directorio, 'desde.npy'), self.desde)
+        np.save(os.path.join(directorio, 'hacia.npy'), self.hacia)
+        if self.nombres is not None:
+            np.save(os.path.join(directorio, 'nombres.npy'), arreglo_de_objetos(self.nombres))
+
+    @classmethod
+    def cargar(cls, directorio, mmap=True):
+        """
+        Carga las tablas guardadas. Con mmap=True los arreglos se abren en modo
+        de solo lectura mapeados en memoria: se cargan en milisegundos y el sistema
+        operativo comparte sus páginas entre todos los procesos que los usan.
+        """
+        modo = 'r' if mmap else None
+        puntos = np.load(os.path.join(directorio, 'puntos.npy'))
+        desde = np.load(os.path.join(directorio, 'desde.npy'), mmap_mode=modo)
+        hacia = np.load(os.path.join(directorio, 'hacia.npy'), mmap_mode=modo)
+        ruta_nombres = os.path.join(directorio, 'nombres.npy')
+        nombres = np.load(ruta_nombres, allow_pickle=True).tolist() if os.path.exists(ruta_nombres) else None
+        return cls(puntos, desde, hacia, nombres)
+
+    def heuristica(self, objetivo):
+        """Heurística ALT hacia 'objetivo', lista para pasarse a a_star en lugar del diccionario."""
+        return HeuristicaALT(self, objetivo)
+
+
+class HeuristicaALT:
+    """
+    Función h(nodo) con la cota de la desigualdad triangular hacia un objetivo fijo.
+    Se usa como h(nodo) o h[nodo], igual que un diccionario de heurísticas.
+    """
+    def __init__(self, tabla, objetivo):
+        self.tabla = tabla
+        t = objetivo if tabla.indices is None else tabla.indices[objetivo]
+        # Columnas del objetivo, que se reutilizan en cada evaluación
+        self.desde_objetivo = np.asarray(tabla.desde[:, t])  # d(L, t)
+        self.hacia_objetivo = np.asarray(tabla.hacia[:, t])  # d(t, L)
+
+    def __call__(self, nodo):
+        v = nodo if self.tabla.indices is None else self.tabla.indices[nodo]
+        with np.errstate(invalid='ignore'):  # inf - inf (puntos que no alcanzan) da nan y se ignora
+            cotas = np.concatenate((self.desde_objetivo - self.tabla.desde[:, v],
+                                    self.tabla.hacia[:, v] - self.hacia_objetivo))
+        cotas = cotas[~np.isnan(cotas)]
+        return max(float(cotas.max()), 0.0) if len(cotas) else 0.0
+
+    __getitem__ = __call__
+
+
+def elegir_lejano(grafo, desde, hacia, generador):
+    """
+    Estrategia 'lejanos': el primer punto es el nodo más lejano a uno aleatorio;
+    los siguientes maximizan la distancia mínima a los puntos ya elegidos.
+    """
+    if not desde:
+        distancias = dijkstra_csr(grafo, generador.randrange(grafo.num_nodos))
+    else:
+        # Distancia (ida y vuelta) de cada nodo al punto de referencia más cercano
+        distancias = np.min(np.array(desde) + np.array(hacia), axis=0)
+    distancias = np.where(np.isfinite(distancias), distancias, -1)  # Los inalcanzables no cuentan
+    return int(np.argmax(distancias))
+
+
+def elegir_evitar(grafo, puntos, desde, hacia, generador):
+    """
+    Estrategia 'evitar' (avoid): desde una raíz aleatoria se arma el árbol de caminos
+    más cortos y se pesa cada nodo con el error de la heurística actual hacia él.
+    Se baja por el subárbol de mayor peso que todavía no tiene punto de referencia,
+    y la hoja alcanzada es el nuevo punto.
+    """
+    raiz = generador.randrange(grafo.num_nodos)
+    distancias, padres = dijkstra_csr(grafo, raiz, padres=True)
+    alcanzados = np.flatnonzero(np.isfinite(distancias))
+
+    # Error de la cota actual d(raiz, v) >= max(d(L, v) - d(L, raiz), d(raiz, L) - d(v, L))
+    if desde:
+        with np.errstate(invalid='ignore'):
+            cotas = np.concatenate((np.array(desde) - np.array(desde)[:, [raiz]],
+                                    np.array(hacia)[:, [raiz]] - np.array(hacia)))
+        cotas = np.nan_to_num(cotas, nan=0.0, posinf=0.0, neginf=0.0).max(axis=0)
+    else:
+        cotas = np.zeros(grafo.num_nodos)
+    peso = np.where(np.isfinite(distancias), distancias - np.maximum(cotas, 0), 0)
+
+    # Hijos de cada nodo en el árbol y orden de recorrido desde la raíz
+    hijos = [[] for _ in range(grafo.num_nodos)]
+    for v in alcanzados.tolist():
+        if padres[v] != -1:
+            hijos[padres[v]].append(v)
+    orden = [raiz]
+    for v in orden:
+        orden.extend(hijos[v])
+
+    # Peso de cada subárbol; los subárboles que ya contienen un punto de referencia valen 0
+    tiene_punto = np.zeros(grafo.num_nodos, dtype=bool)
+    tiene_punto[puntos] = True
+    tamano = peso.astype(np.float64)
+    for v in reversed(orden):
+        if padres[v] != -1:
+            tamano[padres[v]] += tamano[v]
+            tiene_punto[padres[v]] |= tiene_punto[v]
+    tamano[tiene_punto] = 0
+
+    # Se desciende por el hijo con mayor peso hasta llegar a una hoja
+    nodo = raiz
+    while hijos[nodo]:
+        siguiente = max(hijos[nodo], key=lambda hijo: tamano[hijo])
+        if tamano[siguiente] <= 0:
+            break
+        nodo = siguiente
+    return nodo
+
+
+if __name__ == "__main__":
+    import tempfile
+    from cargar_script import cargar_script
+
+    a_star = cargar_script('008').a_star
+
+    # Grafo en cuadrícula de 30 x 30 con costos aleatorios (demasiado grande para una heurística a mano)
+    generador = random.Random(1)
+    grafo = {}
+    for i in range(30):
+        for j in range(30):
+            grafo[(i, j)] = {}
+            for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= i + di < 30 and 0 <= j + dj < 30:
+                    grafo[(i, j)][(i + di, j + dj)] = generador.randint(1, 9)
+
+    for estrategia in ('lejanos', 'evitar'):
+        tabla = TablaPuntosReferencia.construir(grafo, k=6, estrategia=estrategia)
+        print(f"Puntos '{estrategia}': {[tabla.nombres[p] for p in tabla.puntos]}")
+
+    # Se guardan las tablas y se vuelven a abrir mapeadas en memoria
+    directorio = os.path.join(tempfile.gettempdir(), "tablas_alt")
+    tabla.guardar(directorio)
+    tabla = TablaPuntosReferencia.cargar(directorio)
+
+    inicio, objetivo = (0, 0), (29, 29)
+    camino = a_star(grafo, inicio, objetivo, tabla.heuristica(objetivo))
+    costo = sum(grafo[u][v] for u, v in zip(camino, camino[1:]))
+    print(f"A* con heurística ALT de {inicio} a {objetivo}: costo {costo}, {len(camino)} nodos en el camino")
@@ -0,0 +1,95 @@
+import os
+from multiprocessing import Pool
+import numpy as np
+from grafo_csr import GrafoCSR, dijkstra_csr
+from archivo_grafo import abrir_binario  # Grafos binarios abiertos con np.memmap
+
+# Grafo de cada proceso trabajador (se recibe una sola vez al crear el proceso)
+grafo_trabajador = None
+
+def uno_a_muchos(grafo, origen, destinos):
+    """
+    Distancias desde un origen a muchos destinos con una sola búsqueda de Dijkstra,
+    que se detiene en cuanto se cierra el último destino.
+    - grafo: dict de dicts o GrafoCSR
+    Retorna un arreglo de NumPy con una distancia por destino (inf si no se alcanza).
+    """
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.desde_dict(grafo)
+    ids = np.array([grafo.id(destino) for destino in destinos], dtype=np.int64)
+    return dijkstra_csr(grafo, grafo.id(origen), destinos=ids)[ids]
+
+
+def muchos_a_muchos(grafo, origenes, destinos, procesos=None):
+    """
+    Matriz de distancias N x M: la fila i contiene las distancias desde origenes[i]
+    a todos los destinos. Cada fila es una búsqueda uno a muchos independiente, así
+    que las filas se reparten entre un grupo de procesos.
+    - procesos: número de procesos (None = uno por núcleo, 1 = sin procesos extra)
+    """
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.desde_dict(grafo)
+    ids_origenes = [grafo.id(origen) for origen in origenes]
+    ids_destinos = np.array([grafo.id(destino) for destino in destinos], dtype=np.int64)
+    procesos = procesos or os.cpu_count() or 1
+
+    if procesos == 1 or len(ids_origenes) == 1:
+        filas = [dijkstra_csr(grafo, origen, destinos=ids_destinos)[ids_destinos] for origen in ids_origenes]
+    else:
+        # Si el grafo viene de un archivo binario, cada trabajador lo reabre con np.memmap
+        # y todos comparten sus páginas; si no, solo se envían los arreglos (no los nombres)
+        ruta = getattr(grafo, 'ruta', None)
+        datos = (ruta,) if ruta is not None else (grafo.desplazamientos, grafo.destinos, grafo.pesos)
+        with Pool(procesos, initializer=iniciar_trabajador, initargs=datos) as grupo:
+            tareas = [(origen, ids_destinos) for origen in ids_origenes]
+            filas = grupo.starmap(fila_distancias, tareas,
+                                  chunksize=max(1, len(tareas) // (4 * procesos)))
+
+    return np.array(filas, dtype=np.float64).reshape(len(ids_origenes), len(ids_destinos))
+
+
+def iniciar_trabajador(*datos):
+    """Reconstruye el grafo una vez por proceso trabajador (a partir de su ruta o de sus arreglos)."""
+    global grafo_trabajador
+    if len(datos) == 1:
+        grafo_trabajador = abrir_binario(datos[0])
+    else:
+        grafo_trabajador = GrafoCSR(*datos)
+
+
+def fila_distancias(origen, destinos):
+    """Una fila de la matriz: distancias desde origen a todos los destinos."""
+    return dijkstra_csr(grafo_trabajador, origen, destinos=destinos)[destinos]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Red de calles en cuadrícula de 60 x 60 con costos aleatorios
+    generador = random.Random(7)
+    lado = 60
+    grafo = {}
+    for i in range(lado):
+        for j in range(lado):
+            grafo[(i, j)] = {}
+            for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= i + di < lado and 0 <= j + dj < lado:
+                    grafo[(i, j)][(i + di, j + dj)] = generador.randint(1, 9)
+    csr = GrafoCSR.desde_dict(grafo)
+
+    # Un depósito y muchos clientes
+    deposito = (0, 0)
+    clientes = generador.sample(list(grafo), 200)
+    inicio = time.perf_counter()
+    distancias = uno_a_muchos(csr, deposito, clientes)
+    print(f"Uno a muchos: {len(clientes)} clientes en {time.perf_counter() - inicio:.3f} s, "
+          f"el más lejano a {distancias.max():.0f}")
+
+    # Matriz completa entre 40 puntos, en paralelo y en serie
+    puntos = generador.sample(list(grafo), 40)
+    inicio = time.perf_counter()
+    matriz = muchos_a_muchos(csr, puntos, puntos, procesos=4)
+    print(f"Muchos a muchos {matriz.shape} con 4 procesos: {time.perf_counter() - inicio:.3f} s")
+    assert np.array_equal(matriz, muchos_a_muchos(csr, puntos, puntos, procesos=1))
+    print("La matriz en paralelo coincide con la calculada en serie")
@@ -2,6 +2,13 @@
 # Ejemplo de Espacio de Estados: Ordenar cubos
 # ---------------------------------------------------
 from collections import deque  # Importamos deque para implementar una cola eficiente
+import os
+import sys
+import random
+
+# Las búsquedas sobre grafos implícitos están en la carpeta Grafos
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Grafos'))
+from busqueda_implicita import a_estrella_implicita, CodificadorEmpaquetado
 
 # Estado inicial (desordenado)
 estado_inicial = (3, 1, 2)
@@ -39,6 +46,19 @@ def generar_sucesores(estado):
             sucesores.append(tuple(nuevo))  # Convertimos la lista de nuevo a tupla y la añadimos
     return sucesores
 
+# ---------------------------------------------------
+# Versión perezosa: genera los sucesores uno por uno, sin construir la lista
+def sucesores_perezosos(estado):
+    """
+    Generador de (sucesor, costo) para las búsquedas de busqueda_implicita.py.
+    Cada intercambio cuesta 1 y la búsqueda puede dejar de pedir sucesores en cualquier momento.
+    """
+    for i in range(len(estado)):
+        for j in range(i + 1, len(estado)):
+            nuevo = list(estado)
+            nuevo[i], nuevo[j] = nuevo[j], nuevo[i]
+            yield tuple(nuevo), 1
+
 # ---------------------------------------------------
 # Búsqueda en amplitud sobre el espacio de estados
 def buscar_solucion(estado_inicial, objetivo):
@@ -100,3 +120,22 @@ try:
 except ValueError as e:
     # Capturamos y mostramos errores de validación
     print(f"Error: {e}")
+
+# ---------------------------------------------------
+# Espacio de estados demasiado grande para enumerarlo: 10 cubos (10! = 3 628 800 estados)
+n = 10
+estado_grande = tuple(random.Random(0).sample(range(1, n + 1), n))
+objetivo_grande = tuple(range(1, n + 1))
+
+def cubos_fuera_de_lugar(estado):
+    """Heurística admisible: cada intercambio coloca a lo más dos cubos en su lugar."""
+    return (sum(a != b for a, b in zip(estado, objetivo_grande)) + 1) // 2
+
+# A* con sucesores perezosos, punteros a padres y cada estado empaquetado en un entero
+camino, costo, estadisticas = a_estrella_implicita(estado_grande, sucesores_perezosos,
+                                                   lambda estado: estado == objetivo_grande,
+                                                   cubos_fuera_de_lugar, CodificadorEmpaquetado(n, n))
+print(f"\n{n} cubos desde {estado_grande}: {costo} intercambios, "
+      f"{estadisticas['expandidos']} estados expandidos")
+for paso in camino:
+    print(" →", paso)